@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List, Any
+from typing import List, Any, Dict
 
 
 @dataclass
@@ -9,12 +9,15 @@ class ClassificationResult:
     """
     new_posts: List[Any] = None
     existing_posts_updates: List[Any] = None
+    previous_view_counts: Dict[int, int] = None  # 기존 게시물 DB id -> 갱신 전 조회수
     
     def __post_init__(self):
         if self.new_posts is None:
             self.new_posts = []
         if self.existing_posts_updates is None:
             self.existing_posts_updates = []
+        if self.previous_view_counts is None:
+            self.previous_view_counts = {}
     
     @property
     def has_new_posts(self) -> bool:
@@ -1,8 +1,9 @@
 import logging
-from typing import List
+from typing import List, Dict, Optional
 from sqlalchemy.exc import SQLAlchemyError
 from app.board.infra.repository.post_repo import PostRepository
 from app.board.domain.post import Post
+from app.board.application.popularity_engine import PopularityEngine
 
 logger = logging.getLogger(__name__)
 
@@ -10,15 +11,18 @@ logger = logging.getLogger(__name__)
 class ExistingPostHandler:
     """기존 게시물 처리 전용 클래스"""
     
-    def __init__(self, post_repo: PostRepository = None):
+    def __init__(self, post_repo: PostRepository = None, popularity_engine: PopularityEngine = None):
         self.post_repo = post_repo or PostRepository()
+        self.popularity_engine = popularity_engine or PopularityEngine()
     
-    async def handle_existing_posts(self, existing_posts_updates: List[Post]) -> bool:
+    async def handle_existing_posts(self, existing_posts_updates: List[Post],
+                                    previous_view_counts: Optional[Dict[int, int]] = None) -> bool:
         """
-        기존 게시물들을 처리 (조회수만 업데이트)
+        기존 게시물들을 처리 (조회수 업데이트 및 인기도 갱신)
         
         Parameters:
         - existing_posts_updates: 업데이트할 Post 객체 목록 (id와 view_count 포함)
+        - previous_view_counts: 갱신 전 DB 조회수 (post_id -> view_count)
         
         Returns:
         - bool: 처리 성공 여부
@@ -33,10 +37,8 @@ class ExistingPostHandler:
             # 조회수만 업데이트 (content_summary는 건드리지 않음)
             await self._update_view_counts_only(existing_posts_updates)
             
-            # TODO: 나중에 추가될 수 있는 처리들
-            # await self._track_view_count_changes(existing_posts_updates)  # 조회수 변화 추적
-            # await self._update_popularity_score(existing_posts_updates)   # 인기도 점수 업데이트
-            # await self._check_trending_posts(existing_posts_updates)      # 트렌딩 게시물 체크
+            # 조회수 변화 추적 + 인기도 점수 업데이트 (트렌딩은 PopularityEngine.top_k로 조회)
+            await self._track_view_count_changes(existing_posts_updates, previous_view_counts)
             
             logger.info("ExistingPostHandler: 기존 게시물 조회수 업데이트 완료")
             return True
@@ -53,4 +55,12 @@ class ExistingPostHandler:
             logger.info("ExistingPostHandler: %d개 기존 게시물 조회수 업데이트 완료", len(existing_posts))
         except SQLAlchemyError as e:
             logger.error("ExistingPostHandler: 조회수 업데이트 실패: %s", e)
-            raise
\ No newline at end of file
+            raise
+
+    async def _track_view_count_changes(self, existing_posts: List[Post],
+                                        previous_view_counts: Optional[Dict[int, int]]) -> None:
+        """조회수 증가량을 시계열로 기록하고 인기도 점수 갱신 (실패해도 조회수 업데이트는 유지)"""
+        try:
+            await self.popularity_engine.record(existing_posts, previous_view_counts)
+        except SQLAlchemyError as e:
+            logger.error("ExistingPostHandler: 조회수 증가량 기록 실패: %s", e)
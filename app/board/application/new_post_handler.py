@@ -19,13 +19,14 @@ class NewPostHandler:
     def __init__(self,
                 post_repo: PostRepository = None,
                 location_repo: EventLocationTimeRepository = None,
+                post_processing_pipeline: PostProcessingPipeline = None,
                 ):
         self.post_repo = post_repo or PostRepository()
         # 환경변수로 상세 스크랩 여부 결정
         self.enable_scraping = os.environ.get("ENABLE_DETAIL_SCRAPING", "false").lower() == "true"
         self.location_repo = location_repo or EventLocationTimeRepository()
         self.post_picture_repo = PostPictureRepository()
-        self.post_processing_pipeline = PostProcessingPipeline()
+        self.post_processing_pipeline = post_processing_pipeline or PostProcessingPipeline()
     
     async def handle_new_posts(self, new_posts: List[Post]) -> List[Post]:
         """
@@ -41,6 +42,7 @@ class NewPostHandler:
         location_entities = []
         post_picture_entites = []
 
+        valid_posts = []
         for post in new_posts:
             logger.info("NewPostHandler: 신규 게시물 처리 시작 (게시물 이름): %s", post.title)
 
@@ -49,10 +51,17 @@ class NewPostHandler:
             if not post.title or not post.url:
                 logger.warning("필수 필드 누락된 게시물 스킵: %s", post)
                 continue
+            valid_posts.append(post)
 
+        # 스크래핑 활성화 시 이번 주기 게시물의 이미지 OCR을 묶어서 처리
+        summary_processed_dtos: List[SummaryProcessedPostDTO] = []
+        if self.enable_scraping and valid_posts:
+            summary_processed_dtos = await self.post_processing_pipeline.process_posts(valid_posts)
+
+        for index, post in enumerate(valid_posts):
             try:
                 if self.enable_scraping:
-                    summary_processed_dto: SummaryProcessedPostDTO = await self.post_processing_pipeline.process_post(post)
+                    summary_processed_dto: SummaryProcessedPostDTO = summary_processed_dtos[index]
                     logger.info("게시물 내용 추출 완료: %s", summary_processed_dto.post.title)
                     logger.info("게시물 내용 추출 디버그 정보: %s", summary_processed_dto.post.content_summary[:10] + "...")  # 요약의 일부만 로그에 남김
                     logger.debug("게시물 내용 추출 세부 정보: %s", summary_processed_dto.post.content_summary[:100] + "...")  # 요약의 일부만 로그에 남김
@@ -1,86 +1,102 @@
+import asyncio
 import logging
 import os
 from app.board.domain.post_picture import PostPicture
 from app.board.application.dto.summary_processed_post_dto import SummaryProcessedPostDTO
 from app.board.application.ports.ocr_port import OCRPort
 from app.board.application.summary_service import SummaryService
-from app.board.infra.ocr.clova_ocr_adapter import ClovaOCRAdapter
-from typing import Optional
+from app.board.infra.ocr.ocr_backend_router import OcrBackendRouter
+from app.board.infra.ocr.ocr_pipeline.stage_timing import board_context
+from typing import List, Optional
 
 logger = logging.getLogger(__name__)
 
 ENABLE_SUMMARY = os.getenv("ENABLE_SUMMARY", "false").lower() == "true"
+# 일괄 처리 시 동시에 진행할 게시물 요약 수 (OpenAI 요청 동시 실행 상한)
+SUMMARY_CONCURRENCY = max(1, int(os.getenv("SUMMARY_CONCURRENCY", "4")))
 
 
 class OcrPipeline:
     """OCR 및 요약 처리를 담당하는 파이프라인"""
     
     def __init__(self, ocr_adapter: Optional[OCRPort] = None, summary_service: Optional[SummaryService] = None):
-        self.ocr_adapter = ocr_adapter or ClovaOCRAdapter()
+        # OCR 백엔드 라우터 (OCR_BACKENDS 순서로 장애 전환, 기본은 CLOVA 단독)
+        self.ocr_adapter = ocr_adapter or OcrBackendRouter()
         self.summary_service = summary_service or SummaryService()
     
-    async def process_dto(self, summary_processed_dto: SummaryProcessedPostDTO) -> SummaryProcessedPostDTO:
+    async def process_dtos(self, summary_processed_dtos: List[SummaryProcessedPostDTO]) -> List[SummaryProcessedPostDTO]:
         """
-        SummaryProcessedPostDTO를 받아서 이미지가 있으면 OCR 처리를 수행하고, 
-        OCR 성공 시 요약도 함께 처리
-        
+        여러 DTO의 이미지를 한 번에 OCR 처리한 뒤 DTO별로 요약 처리
+
+        수집 주기에 들어온 신규 게시물들의 이미지를 묶어서 요청하므로 CLOVA 왕복 횟수가 줄어듭니다.
+        OCR에 실패한(결과가 비었거나 None인) 이미지는 DTO에서 제거하고 요약은 게시물 내용만으로 진행하며,
+        요약은 SUMMARY_CONCURRENCY개씩 동시에 실행합니다.
+        한 게시물의 요약이 실패해도 그 게시물만 게시물 정보만 담은 DTO로 대체됩니다.
+
         Args:
-            summary_processed_dto: OCR 처리할 DTO
-            
+            summary_processed_dtos: OCR 처리할 DTO 목록
+
         Returns:
-            SummaryProcessedPostDTO: OCR 및 요약 처리 완료된 DTO
+            List[SummaryProcessedPostDTO]: 입력 순서대로 OCR 및 요약 처리 완료된 DTO
         """
-        if not summary_processed_dto.has_post_picture():
-            logger.info("이미지가 없어서 OCR 처리를 건너뜁니다")
-            return await self._process_summary(summary_processed_dto)
-        
-        post_picture = summary_processed_dto.post_picture
-        
-        # OCR 처리
-        ocr_success = await self._process_ocr_for_picture(post_picture)
-        
-        if not ocr_success:
-            logger.warning("OCR 처리 실패로 이미지를 DTO에서 제거합니다")
-            # OCR 실패 시 post_picture를 None으로 설정
-            summary_processed_dto.post_picture = None
-        
-        # 요약 처리 (OCR 성공/실패와 관계없이)
-        return await self._process_summary(summary_processed_dto)
-    
-    async def _process_ocr_for_picture(self, post_picture: PostPicture) -> bool:
+        targets = []
+        for dto in summary_processed_dtos:
+            if not dto.has_post_picture():
+                continue
+            if not dto.post_picture.url:
+                logger.warning("OCR 처리 조건이 충족되지 않음 - PostPicture 또는 URL이 없음")
+                dto.post_picture = None
+                continue
+            targets.append(dto)
+
+        if targets:
+            logger.info(f"OCR 일괄 처리 시작 - 이미지 {len(targets)}개")
+            # 묶음 OCR 단계 시간은 게시판이 하나면 그 게시판, 섞여 있으면 "mixed"로 집계
+            board_ids = {dto.post.board_id for dto in targets}
+            try:
+                with board_context(board_ids.pop() if len(board_ids) == 1 else "mixed"):
+                    extracted_texts = await self.ocr_adapter.extract_texts_from_images(
+                        [dto.post_picture.url for dto in targets]
+                    )
+            except Exception as e:
+                logger.error(f"OCR 일괄 처리 중 오류 발생: {e}")
+                extracted_texts = [None] * len(targets)
+
+            for dto, extracted_text in zip(targets, extracted_texts):
+                if not self._apply_ocr_text(dto.post_picture, extracted_text):
+                    logger.warning("OCR 처리 실패로 이미지를 DTO에서 제거합니다")
+                    dto.post_picture = None
+
+        semaphore = asyncio.Semaphore(SUMMARY_CONCURRENCY)
+
+        async def summarize(dto: SummaryProcessedPostDTO) -> SummaryProcessedPostDTO:
+            async with semaphore:
+                with board_context(dto.post.board_id):
+                    try:
+                        return await self._process_summary(dto)
+                    except Exception as e:
+                        logger.error(f"요약 처리 중 오류 발생 - URL: {dto.post.url}, 오류: {e}")
+                        return SummaryProcessedPostDTO.create_with_post_only(dto.post)
+
+        return list(await asyncio.gather(*(summarize(dto) for dto in summary_processed_dtos)))
+
+    @staticmethod
+    def _apply_ocr_text(post_picture: PostPicture, extracted_text: Optional[str]) -> bool:
         """
-        PostPicture에 대해 OCR 처리를 수행
-        
-        Args:
-            post_picture: OCR 처리할 PostPicture 객체
-            
+        OCR 결과 텍스트를 PostPicture에 반영 (비어있거나 실패(None)면 "실패"로 표시)
+
         Returns:
             bool: OCR 처리 성공 여부
         """
-        if not post_picture or not post_picture.url:
-            logger.warning("OCR 처리 조건이 충족되지 않음 - PostPicture 또는 URL이 없음")
-            return False
-            
-        logger.info(f"OCR 처리 시작 - 이미지 URL: {post_picture.url}")
-        
-        try:
-            # OCR 어댑터를 사용하여 텍스트 추출
-            extracted_text = self.ocr_adapter.extract_text_from_image_pipeline(post_picture.url)
-            
-            if extracted_text:
-                # 원본 OCR 텍스트 저장
-                post_picture.original_ocr_text = extracted_text
-                logger.info(f"OCR 처리 완료 - 추출된 텍스트 길이: {len(extracted_text)}자")
-                return True
-            else:
-                logger.warning("OCR 결과가 비어있습니다")
-                post_picture.picture_summary = "실패"
-                return False
-                
-        except Exception as e:
-            logger.error(f"OCR 처리 중 오류 발생: {e}")
-            post_picture.picture_summary = "실패"
-            return False
+        if extracted_text:
+            # 원본 OCR 텍스트 저장
+            post_picture.original_ocr_text = extracted_text
+            logger.info(f"OCR 처리 완료 - 추출된 텍스트 길이: {len(extracted_text)}자")
+            return True
+
+        logger.warning("OCR 결과가 비어있습니다")
+        post_picture.picture_summary = "실패"
+        return False
     
     async def _process_summary(self, dto: SummaryProcessedPostDTO) -> SummaryProcessedPostDTO:
         """
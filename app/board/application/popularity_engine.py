@@ -0,0 +1,272 @@
+import asyncio
+import heapq
+import logging
+import math
+import os
+import time
+from collections import defaultdict
+from datetime import datetime, timezone, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+
+from app.board.domain.post import Post
+from app.board.domain.post_popularity import PostPopularity
+from app.board.domain.post_view_delta import PostViewDelta
+from app.board.infra.repository.post_popularity_repo import PostPopularityRepository
+
+logger = logging.getLogger(__name__)
+
+# 기준 시각 재설정 임계값 (exp(50) ≈ 5e21, float 범위 내에서 충분히 여유 있음)
+_REBASE_EXPONENT = 50.0
+# 이 값 미만으로 감쇠된 점수는 메모리에서 제거
+_MIN_LIVE_SCORE = 1e-3
+# 점수 없는 게시물의 조회수 기준값이 이만큼 넘게 쌓이면 정리
+_PRUNE_SLACK = 1024
+
+
+class PopularityEngine:
+    """
+    조회수 증가량 기반 증분 인기도(트렌딩) 엔진
+
+    - 점수: score(t) = Σ delta_i * exp(-λ(t - t_i)), λ = ln2 / 반감기
+    - 메모리에는 기준 시각 t0로 정규화한 값 s = score(t) * exp(λ(t - t0))를 보관합니다.
+      정규화 값은 시간이 흘러도 게시물 간 순서가 변하지 않으므로 힙을 재정렬할 필요가 없습니다.
+    - top-K는 게시판별/전체 최대 힙(지연 삭제)에서 조회하며 매 요청마다 SQL 집계를 하지 않습니다.
+    - 변경된 점수는 dirty 집합에 모아 두었다가 주기적으로 DB에 저장합니다.
+    """
+
+    def __init__(self,
+                 popularity_repo: PostPopularityRepository = None,
+                 half_life_seconds: Optional[float] = None,
+                 warm_start_hours: Optional[int] = None):
+        self.popularity_repo = popularity_repo or PostPopularityRepository()
+        if half_life_seconds is None:
+            half_life_seconds = float(os.getenv("POPULARITY_HALF_LIFE_SECONDS", "86400"))
+        if half_life_seconds <= 0:
+            raise ValueError(f"half_life_seconds는 0보다 커야 합니다: {half_life_seconds}")
+        self.half_life_seconds = half_life_seconds
+        self.warm_start_hours = int(os.getenv("POPULARITY_WARM_START_HOURS", "168")) if warm_start_hours is None else warm_start_hours
+        self.decay_rate = math.log(2) / self.half_life_seconds
+
+        self._epoch = time.time()
+        self._scores: Dict[int, float] = {}             # post_id -> 정규화 점수
+        self._post_boards: Dict[int, int] = {}          # post_id -> board_id
+        self._last_view_counts: Dict[int, int] = {}     # post_id -> 마지막 조회수
+        self._global_heap: List[Tuple[float, int]] = []  # (-정규화 점수, post_id)
+        self._board_heaps: Dict[int, List[Tuple[float, int]]] = defaultdict(list)
+        self._dirty: Set[int] = set()
+        self._persist_lock = asyncio.Lock()
+        # 인기도 테이블이 없으면(DDL 미적용) DB 저장 없이 메모리에서만 동작
+        self.persistence_enabled = True
+
+    async def warm_start(self) -> None:
+        """DB에 저장된 최근 인기도 점수로 메모리 상태를 복원"""
+        since = datetime.now(timezone.utc) - timedelta(hours=self.warm_start_hours)
+        try:
+            if not await self.popularity_repo.tables_exist():
+                self.persistence_enabled = False
+                logger.warning(
+                    "PopularityEngine: 인기도 테이블(post_popularity, post_view_count_delta)이 없어 "
+                    "DB 저장 없이 메모리에서만 동작합니다 - app/database/migrations/001_post_popularity.sql 적용 필요"
+                )
+                return
+            popularities = await self.popularity_repo.read_popularities_updated_since(since)
+        except Exception as e:
+            logger.error("PopularityEngine: 웜 스타트 실패: %s", e)
+            return
+
+        for popularity in popularities:
+            updated_at = popularity.updated_at or datetime.now(timezone.utc)
+            if updated_at.tzinfo is None:
+                updated_at = updated_at.replace(tzinfo=timezone.utc)
+
+            # 저장 시점 점수를 기준 시각 정규화 값으로 변환
+            normalized = popularity.score * math.exp(self.decay_rate * (updated_at.timestamp() - self._epoch))
+            self._post_boards[popularity.post_id] = popularity.board_id
+            self._last_view_counts[popularity.post_id] = popularity.last_view_count
+            self._set_score(popularity.post_id, normalized)
+
+        logger.info("PopularityEngine: 웜 스타트 완료 - %d개 게시물", len(popularities))
+
+    def observe(self, posts: List[Post], previous_view_counts: Optional[Dict[int, int]] = None) -> List[PostViewDelta]:
+        """
+        이번 주기 조회수를 반영하여 점수를 갱신하고 증가량 목록을 반환
+
+        Parameters:
+        - posts: id, board_id, view_count가 채워진 Post 목록
+        - previous_view_counts: 엔진이 아직 모르는 게시물의 이전 조회수 (post_id -> view_count)
+
+        Returns:
+        - List[PostViewDelta]: 조회수가 증가한 게시물의 증가량 목록
+        """
+        previous_view_counts = previous_view_counts or {}
+        now = time.time()
+        self._maybe_rebase(now)
+        growth = math.exp(self.decay_rate * (now - self._epoch))
+        recorded_at = datetime.fromtimestamp(now, timezone.utc)
+
+        deltas: List[PostViewDelta] = []
+        for post in posts:
+            if post.id is None or post.view_count is None:
+                continue
+
+            previous = self._last_view_counts.get(post.id, previous_view_counts.get(post.id))
+            self._last_view_counts[post.id] = post.view_count
+            self._post_boards[post.id] = post.board_id
+
+            # 처음 보는 게시물은 기준값만 기록, 조회수 감소(초기화 등)는 무시
+            if previous is None or post.view_count <= previous:
+                continue
+
+            delta = post.view_count - previous
+            self._set_score(post.id, self._scores.get(post.id, 0.0) + delta * growth)
+            deltas.append(PostViewDelta(
+                post_id=post.id,
+                board_id=post.board_id,
+                delta=delta,
+                view_count=post.view_count,
+                recorded_at=recorded_at,
+            ))
+
+        if len(self._last_view_counts) > 2 * len(self._scores) + _PRUNE_SLACK:
+            self._compact()
+        return deltas
+
+    def top_k(self, k: int = 10, board_id: Optional[int] = None) -> List[PostPopularity]:
+        """
+        게시판별(board_id 지정 시) 또는 전체 트렌딩 상위 k개 조회
+
+        Returns:
+        - List[PostPopularity]: 현재 시각 기준으로 감쇠된 점수 내림차순 목록
+        """
+        heap = self._global_heap if board_id is None else self._board_heaps.get(board_id)
+        if not heap or k <= 0:
+            return []
+
+        now = time.time()
+        decay = math.exp(-self.decay_rate * (now - self._epoch))
+        updated_at = datetime.fromtimestamp(now, timezone.utc)
+
+        result: List[PostPopularity] = []
+        kept: List[Tuple[float, int]] = []
+        seen: Set[int] = set()
+        while heap and len(result) < k:
+            entry = heapq.heappop(heap)
+            neg_score, post_id = entry
+            # 지연 삭제: 현재 점수와 다른 항목은 버림
+            if post_id in seen or self._scores.get(post_id) != -neg_score:
+                continue
+            seen.add(post_id)
+            kept.append(entry)
+            result.append(PostPopularity(
+                post_id=post_id,
+                board_id=self._post_boards[post_id],
+                score=-neg_score * decay,
+                last_view_count=self._last_view_counts.get(post_id, 0),
+                updated_at=updated_at,
+            ))
+
+        for entry in kept:
+            heapq.heappush(heap, entry)
+
+        return result
+
+    async def record(self, posts: List[Post], previous_view_counts: Optional[Dict[int, int]] = None) -> List[PostViewDelta]:
+        """조회수 변화를 반영하고 증가량을 시계열 테이블에 추가"""
+        deltas = self.observe(posts, previous_view_counts)
+        if deltas and self.persistence_enabled:
+            await self.popularity_repo.append_view_deltas(deltas)
+            logger.info("PopularityEngine: 조회수 증가량 기록 - %d개 게시물", len(deltas))
+        return deltas
+
+    async def persist(self) -> int:
+        """변경된(dirty) 점수를 DB에 저장하고 저장 건수를 반환"""
+        async with self._persist_lock:
+            if not self._dirty:
+                return 0
+            if not self.persistence_enabled:
+                self._dirty.clear()
+                return 0
+
+            dirty, self._dirty = self._dirty, set()
+            now = time.time()
+            decay = math.exp(-self.decay_rate * (now - self._epoch))
+            updated_at = datetime.fromtimestamp(now, timezone.utc)
+
+            popularities = [
+                PostPopularity(
+                    post_id=post_id,
+                    board_id=self._post_boards[post_id],
+                    score=self._scores.get(post_id, 0.0) * decay,
+                    last_view_count=self._last_view_counts.get(post_id, 0),
+                    updated_at=updated_at,
+                )
+                for post_id in dirty
+                if post_id in self._post_boards
+            ]
+
+            try:
+                await self.popularity_repo.upsert_popularities(popularities)
+            except Exception as e:
+                # 다음 주기에 다시 저장되도록 복원
+                self._dirty |= dirty
+                logger.error("PopularityEngine: 인기도 점수 저장 실패: %s", e)
+                return 0
+
+            logger.info("PopularityEngine: 인기도 점수 저장 완료 - %d개", len(popularities))
+            return len(popularities)
+
+    def _set_score(self, post_id: int, normalized: float) -> None:
+        """정규화 점수 갱신 및 힙에 새 항목 추가 (이전 항목은 지연 삭제)"""
+        self._scores[post_id] = normalized
+        self._dirty.add(post_id)
+
+        entry = (-normalized, post_id)
+        heapq.heappush(self._global_heap, entry)
+        board_heap = self._board_heaps[self._post_boards[post_id]]
+        heapq.heappush(board_heap, entry)
+
+        if len(self._global_heap) > 2 * len(self._scores) + 64:
+            self._compact()
+
+    def _maybe_rebase(self, now: float) -> None:
+        """정규화 지수가 커지면 기준 시각을 현재로 옮기고 소멸한 점수를 제거"""
+        exponent = self.decay_rate * (now - self._epoch)
+        if exponent < _REBASE_EXPONENT:
+            return
+
+        factor = math.exp(-exponent)
+        self._epoch = now
+        self._scores = {
+            post_id: score * factor
+            for post_id, score in self._scores.items()
+            if score * factor >= _MIN_LIVE_SCORE
+        }
+        self._compact()
+        logger.info("PopularityEngine: 기준 시각 재설정 - 유지 게시물 %d개", len(self._scores))
+
+    def _compact(self) -> None:
+        """
+        감쇠되어 소멸한 점수와 지연 삭제로 쌓인 오래된 힙 항목 정리
+
+        점수가 없는 게시물의 조회수 기준값/게시판 정보도 제거합니다. (다음 주기에 다시 보이면
+        호출자가 넘겨주는 DB 기준 이전 조회수로 증가량을 계산)
+        """
+        decay = math.exp(-self.decay_rate * (time.time() - self._epoch))
+        self._scores = {
+            post_id: score
+            for post_id, score in self._scores.items()
+            if score * decay >= _MIN_LIVE_SCORE or post_id in self._dirty
+        }
+        live = self._scores.keys() | self._dirty
+        self._last_view_counts = {post_id: count for post_id, count in self._last_view_counts.items() if post_id in live}
+        self._post_boards = {post_id: board_id for post_id, board_id in self._post_boards.items() if post_id in live}
+
+        self._global_heap = [(-score, post_id) for post_id, score in self._scores.items()]
+        heapq.heapify(self._global_heap)
+
+        board_heaps: Dict[int, List[Tuple[float, int]]] = defaultdict(list)
+        for post_id, score in self._scores.items():
+            board_heaps[self._post_boards[post_id]].append((-score, post_id))
+        for heap in board_heaps.values():
+            heapq.heapify(heap)
+        self._board_heaps = board_heaps
@@ -1,4 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
+from typing import List, Optional
 
 class OCRPort(ABC):
     """OCR 처리를 위한 포트 (인터페이스)"""
@@ -14,4 +16,36 @@ class OCRPort(ABC):
         Returns:
             str: 추출된 텍스트 (실패 시 빈 문자열)
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def extract_text_from_image(self, image_url: str) -> str:
+        """
+        이미지에서 텍스트를 추출하는 비동기 메서드 (이벤트 루프를 블로킹하지 않음)
+        
+        Args:
+            image_url: 텍스트를 추출할 이미지 URL 또는 경로
+            
+        Returns:
+            str: 추출된 텍스트 (실패 시 빈 문자열)
+        """
+        pass
+
+    async def extract_texts_from_images(self, image_urls: List[str]) -> List[Optional[str]]:
+        """
+        여러 이미지에서 텍스트를 한 번에 추출 (기본 구현은 이미지별 동시 호출)
+
+        Args:
+            image_urls: 텍스트를 추출할 이미지 URL 또는 경로 목록
+
+        Returns:
+            List[Optional[str]]: 입력 순서대로 추출된 텍스트 (실패한 이미지는 None)
+        """
+        results = await asyncio.gather(
+            *(self.extract_text_from_image(image_url) for image_url in image_urls), return_exceptions=True
+        )
+        return [None if isinstance(result, Exception) else result for result in results]
+
+    async def close(self) -> None:
+        """OCR 어댑터가 보유한 리소스(세션 등) 정리"""
+        pass
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Optional
 from app.board.domain.event_location_time import EventLocationTime
 from app.board.domain.post import Post
+from app.board.domain.post_picture import PostPicture
 
 class SummaryPort(ABC):
     """요약 서비스 아웃바운드 포트"""
@@ -30,4 +31,17 @@ class SummaryPort(ABC):
         Returns:
             EventLocationTime: 추출된 위치 및 시간 정보 (없으면 None)
         """
-        pass
\ No newline at end of file
+        pass
+
+    async def summarize_post_combined(self, post: Post, post_picture: Optional[PostPicture] = None) -> Optional[dict]:
+        """
+        본문 요약, 사진 요약, 장소/날짜 추출을 한 번의 요청으로 처리합니다. (기본 구현은 미지원)
+        
+        Args:
+            post: 요약할 게시물
+            post_picture: OCR 텍스트가 있는 사진 (없으면 None)
+            
+        Returns:
+            dict: {"content_summary", "picture_summary", "locations"} (미지원/실패 시 None)
+        """
+        return None
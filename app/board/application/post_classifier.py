@@ -10,9 +10,9 @@ logger = logging.getLogger(__name__)
 class PostClassifier:
     """게시물 분류 전용 클래스 - 순수 분류만 담당"""
     
-    def __init__(self, post_repo: PostRepository = None):
+    def __init__(self, post_repo: PostRepository = None, post_processor: PostProcessor = None):
         self.post_repo = post_repo or PostRepository()
-        self.post_processor = PostProcessor()
+        self.post_processor = post_processor or PostProcessor()
     
     async def classify_posts(self, scraped_posts: Dict[str, Any]) -> ClassificationResult:
         """
@@ -38,7 +38,8 @@ class PostClassifier:
         
         result = ClassificationResult(
             new_posts=new_posts,
-            existing_posts_updates=existing_posts_updates
+            existing_posts_updates=existing_posts_updates,
+            previous_view_counts={post.id: post.view_count for post in existing_posts_mapping.values()}
         )
         
         logger.info("PostClassifier: 분류 완료 - 신규: %d개, 기존: %d개", 
@@ -49,18 +50,18 @@ class PostClassifier:
     
     
     async def _get_existing_posts_mapping(self, board_id: int, scraped_data: Dict[str, Any]) -> Dict[str, Any]:
-        """DB에서 기존 게시물 조회하여 Post 객체 매핑 생성"""
+        """DB에서 기존 게시물 조회하여 경량 읽기 모델 매핑 생성"""
         # 스크랩한 original_id들 추출
         scraped_original_ids = list(scraped_data.keys())
         
-        # 스크랩한 original_id들만 조회
-        posts_in_db = await self.post_repo.find_by_original_ids(board_id, scraped_original_ids)
+        # 스크랩한 original_id들만 조회 (id, original_post_id, view_count 컬럼만)
+        posts_in_db = await self.post_repo.find_projections_by_original_ids(board_id, scraped_original_ids)
         
         if not posts_in_db:
             logger.info("DB에 기존 게시물이 없습니다.")
             return {}
         
-        # original_post_id -> Post 객체 매핑
+        # original_post_id -> PostProjection 매핑
         mapping = {str(post.original_post_id): post for post in posts_in_db}
         logger.info("기존 게시물 매핑 생성 완료: %d개", len(mapping))
         
@@ -1,5 +1,5 @@
 import logging
-from typing import Optional
+from typing import List, Optional
 
 from app.board.application.dto.summary_processed_post_dto import SummaryProcessedPostDTO
 from app.board.domain.post import Post
@@ -20,31 +20,33 @@ class PostProcessingPipeline:
         self.post_scraper_factory = post_scraper_factory or PostScraperFactory()
         self.ocr_pipeline = ocr_pipeline or OcrPipeline()
 
-    async def process_post(self, post: Post) -> SummaryProcessedPostDTO:
+    async def process_posts(self, posts: List[Post]) -> List[SummaryProcessedPostDTO]:
         """
-        게시물 전체 처리 플로우
-        
+        여러 게시물을 처리하되 OCR은 한 번에 묶어서 요청
+
+        스크래핑은 게시물별로 수행하고, 이미지 OCR은 수집 주기 단위로 모아 CLOVA 요청 수를 줄입니다.
+        스크래핑 또는 요약에 실패한 게시물은 그 게시물만 게시물 정보만 담은 DTO로 대체합니다.
+
         Args:
-            post (Post): 처리할 게시물 객체
-            
+            posts (List[Post]): 처리할 게시물 목록
+
         Returns:
-            SummaryProcessedPostDTO: 처리 완료된 게시물 DTO (OCR 및 요약 포함)
+            List[SummaryProcessedPostDTO]: 입력 순서대로 처리 완료된 게시물 DTO
         """
-        try:
-            logger.info("게시물 처리 시작 - 제목: %s, URL: %s", post.title, post.url)
-            
-            # 1단계: 텍스트 및 이미지 스크래핑
-            scraped_dto = await self._scrape_post_content(post)
-            
-            # 2단계: OCR 처리 (요약 포함)
-            final_dto = await self._process_ocr_and_summary(scraped_dto)
-            
-            logger.info("게시물 처리 완료 - ID: %s", post.id)
-            return final_dto
-            
-        except Exception as e:
-            logger.error("게시물 처리 중 오류 발생 - URL: %s, 오류: %s", post.url, e)
-            return SummaryProcessedPostDTO.create_with_post_only(post)
+        scraped_dtos = []
+        for post in posts:
+            try:
+                logger.info("게시물 처리 시작 - 제목: %s, URL: %s", post.title, post.url)
+                scraped_dtos.append(await self._scrape_post_content(post))
+            except Exception as e:
+                logger.error("게시물 처리 중 오류 발생 - URL: %s, 오류: %s", post.url, e)
+                scraped_dtos.append(SummaryProcessedPostDTO.create_with_post_only(post))
+
+        # OCR/요약 오류는 OcrPipeline.process_dtos에서 게시물별로 처리되어 해당 게시물만 게시물 정보만 담은 DTO가 됨
+        logger.debug("OCR 및 요약 일괄 처리 단계 시작")
+        final_dtos = await self.ocr_pipeline.process_dtos(scraped_dtos)
+        logger.debug("OCR 및 요약 일괄 처리 단계 완료")
+        return final_dtos
 
     async def _scrape_post_content(self, post: Post) -> SummaryProcessedPostDTO:
         """
@@ -57,13 +59,3 @@ class PostProcessingPipeline:
         
         logger.debug("스크래핑 단계 완료")
         return scraped_dto
-
-    async def _process_ocr_and_summary(self, dto: SummaryProcessedPostDTO) -> SummaryProcessedPostDTO:
-        """
-        2단계: OCR 처리 및 요약 처리 (OcrPipeline에서 모두 처리)
-        """
-        logger.debug("OCR 및 요약 처리 단계 시작")
-        
-        processed_dto = await self.ocr_pipeline.process_dto(dto)
-        logger.debug("OCR 및 요약 처리 단계 완료")
-        return processed_dto
\ No newline at end of file
@@ -40,7 +40,8 @@ class PostProcessor:
             logger.info("기존 게시물 조회수 업데이트 시작, 대상 개수: %d", 
                        len(classification_result.existing_posts_updates))
             await self.existing_post_handler.handle_existing_posts(
-                classification_result.existing_posts_updates
+                classification_result.existing_posts_updates,
+                classification_result.previous_view_counts
             )
         
         # 신규 게시물 처리 (조건부 실행)
@@ -15,8 +15,8 @@ class ScrapedPostManager:
     스크래핑된 게시물 처리를 총괄 관리하는 클래스
     """
     
-    def __init__(self, new_post_sender: INewPostSender):
-        self.classifier = PostClassifier()
+    def __init__(self, new_post_sender: INewPostSender, classifier: PostClassifier = None):
+        self.classifier = classifier or PostClassifier()
         self.new_post_sender = new_post_sender
         # 환경변수에서 외부 알림 전송 여부 설정 읽기
         self.enable_notification = os.getenv('ENABLE_NOTIFICATION', '').lower() == 'true'
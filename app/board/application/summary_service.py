@@ -1,12 +1,18 @@
 import logging
+import os
 from app.board.application.ports.summary_port import SummaryPort
 from app.board.infra.adapters.openai_summary_adapter import OpenAISummaryAdapter
 from app.board.application.dto.summary_processed_post_dto import SummaryProcessedPostDTO
 from app.board.domain.event_location_time import EventLocationTime
+from app.board.infra.ocr.ocr_pipeline.stage_timing import stage
 from typing import Optional, List
 
 logger = logging.getLogger(__name__)
 
+# 요약 방식 - combined: 본문/사진 요약과 장소 추출을 GPT 요청 1번으로 처리 (실패 시 multi로 재시도)
+#            multi: 본문 요약, 사진 요약, 요약별 장소 추출을 각각 요청
+SUMMARY_MODE = os.getenv("SUMMARY_MODE", "combined").lower()
+
 class SummaryService:
     """요약 서비스 - 요약과 Location 정보 추출을 담당"""
     
@@ -25,15 +31,27 @@ class SummaryService:
         """
         try:
             logger.info("Post 요약 시작합니다.")
+
+            # 0. 통합 요약 (성공하면 바로 반환, 실패하면 기존 다중 호출 경로)
+            if SUMMARY_MODE == "combined":
+                with stage("summarize_combined"):
+                    combined = await self._process_combined_summary(summary_processed_dto)
+                if combined:
+                    return summary_processed_dto
+                logger.warning("통합 요약 실패 - 기존 다중 호출 방식으로 요약합니다.")
             
             # 1. 본문 요약 처리
-            await self._process_post_summary(summary_processed_dto)
+            with stage("summarize_post"):
+                await self._process_post_summary(summary_processed_dto)
 
             # 2. 사진 요약 처리
-            await self._process_picture_summary(summary_processed_dto)
+            if summary_processed_dto.has_post_picture():
+                with stage("summarize_picture"):
+                    await self._process_picture_summary(summary_processed_dto)
 
             # 3. Location 정보 추출
-            await self._extract_and_process_locations(summary_processed_dto)
+            with stage("extract_locations"):
+                await self._extract_and_process_locations(summary_processed_dto)
             
             # 4. ProcessedPostDTO 반환
             return summary_processed_dto
@@ -42,6 +60,36 @@ class SummaryService:
             logger.error("Post 처리 중 예상치 못한 오류 발생: %s", str(e))
             return SummaryProcessedPostDTO(post=summary_processed_dto.post)
 
+    async def _process_combined_summary(self, summary_processed_dto: SummaryProcessedPostDTO) -> bool:
+        """
+        본문/사진 요약과 위치 정보 추출을 한 번의 요청으로 처리
+        
+        Args:
+            summary_processed_dto: 처리할 SummaryProcessedPostDTO
+            
+        Returns:
+            bool: 성공 여부 (실패 시 DTO는 변경하지 않음)
+        """
+        result = await self.summary_adapter.summarize_post_combined(
+            summary_processed_dto.post, summary_processed_dto.post_picture
+        )
+        if not result:
+            return False
+
+        summary_processed_dto.post.content_summary = result["content_summary"]
+        logger.info(f"Post 본문 요약이 완료되었습니다. content_summary: {result['content_summary'][:10]}...")
+
+        if summary_processed_dto.has_post_picture() and result["picture_summary"] is not None:
+            summary_processed_dto.post_picture.picture_summary = result["picture_summary"]
+            logger.info(f"사진 요약 성공: {result['picture_summary'][:50]}...")
+
+        locations = self._convert_dicts_to_location_entities(
+            result["locations"], summary_processed_dto.post.original_post_id
+        ) if result["locations"] else []
+        summary_processed_dto.locations = self._remove_duplicate_locations(locations)
+        logger.info(f"총 {len(summary_processed_dto.locations)}개의 위치 정보가 추출되었습니다.")
+        return True
+
     async def _process_post_summary(self, summary_processed_dto: SummaryProcessedPostDTO) -> None:
         """
         본문 요약 처리
@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+from typing import Optional
+from datetime import datetime, timezone
+
+
+@dataclass
+class PostPopularity:
+    """게시글 인기도 도메인 객체 (지수 감쇠 점수)"""
+    post_id: int
+    board_id: int
+    score: float
+    last_view_count: int
+    updated_at: Optional[datetime] = None
+
+    def to_dict(self) -> dict:
+        """Domain Entity를 dict로 변환"""
+        return {
+            'post_id': self.post_id,
+            'board_id': self.board_id,
+            'score': self.score,
+            'last_view_count': self.last_view_count,
+            'updated_at': self.updated_at or datetime.now(timezone.utc)
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'PostPopularity':
+        """dict를 Domain Entity로 변환"""
+        return cls(
+            post_id=data.get('post_id'),
+            board_id=data.get('board_id'),
+            score=data.get('score', 0.0),
+            last_view_count=data.get('last_view_count', 0),
+            updated_at=data.get('updated_at')
+        )
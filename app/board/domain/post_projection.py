@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class PostProjection:
+    """
+    게시글 경량 읽기 모델 (분류/조회수 비교용)
+
+    content_summary 같은 큰 컬럼 없이 id, original_post_id, view_count만 담습니다.
+    """
+    id: int
+    original_post_id: int
+    view_count: int
+
+    @classmethod
+    def from_row(cls, row: tuple) -> 'PostProjection':
+        """(id, original_post_id, view_count) 튜플을 읽기 모델로 변환"""
+        post_id, original_post_id, view_count = row
+        return cls(id=post_id, original_post_id=original_post_id, view_count=view_count)
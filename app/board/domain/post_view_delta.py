@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from typing import Optional
+from datetime import datetime, timezone
+
+
+@dataclass
+class PostViewDelta:
+    """스크랩 주기별 게시글 조회수 증가량 도메인 객체 (시계열)"""
+    post_id: int
+    board_id: int
+    delta: int
+    view_count: int
+    id: Optional[int] = None
+    recorded_at: Optional[datetime] = None
+
+    def to_dict(self) -> dict:
+        """Domain Entity를 dict로 변환"""
+        return {
+            'id': self.id,
+            'post_id': self.post_id,
+            'board_id': self.board_id,
+            'delta': self.delta,
+            'view_count': self.view_count,
+            'recorded_at': self.recorded_at or datetime.now(timezone.utc)
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'PostViewDelta':
+        """dict를 Domain Entity로 변환"""
+        return cls(
+            id=data.get('id'),
+            post_id=data.get('post_id'),
+            board_id=data.get('board_id'),
+            delta=data.get('delta', 0),
+            view_count=data.get('view_count', 0),
+            recorded_at=data.get('recorded_at')
+        )
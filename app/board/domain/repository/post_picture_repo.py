@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Dict
 from app.board.domain.post_picture import PostPicture
 
 
@@ -16,4 +17,17 @@ class IPostPictureRepository(ABC):
         Returns:
             PostPicture: 저장된 게시글 사진 객체 (DB에서 생성된 ID 등 포함)
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def update_picture_summaries_by_url(self, summaries: Dict[str, str]) -> int:
+        """
+        사진 URL별 요약을 갱신합니다.
+        
+        Args:
+            summaries (Dict[str, str]): 사진 URL → 새 picture_summary
+            
+        Returns:
+            int: 갱신된 행 수
+        """
+        pass
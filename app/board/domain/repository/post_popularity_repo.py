@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List
+from app.board.domain.post_view_delta import PostViewDelta
+from app.board.domain.post_popularity import PostPopularity
+
+# Repository Interface
+class IPostPopularityRepository(ABC):
+
+    @abstractmethod
+    async def tables_exist(self) -> bool:
+        """인기도 테이블이 생성되어 있는지 확인합니다. (DDL 적용 여부)"""
+        pass
+
+    @abstractmethod
+    async def append_view_deltas(self, deltas: List[PostViewDelta]) -> None:
+        """주기별 조회수 증가량을 시계열 테이블에 추가합니다."""
+        pass
+
+    @abstractmethod
+    async def upsert_popularities(self, popularities: List[PostPopularity]) -> None:
+        """인기도 점수 스냅샷을 저장합니다. (post_id 기준 upsert)"""
+        pass
+
+    @abstractmethod
+    async def read_popularities_updated_since(self, since: datetime) -> List[PostPopularity]:
+        """since 이후 갱신된 인기도 점수를 조회합니다. (엔진 웜 스타트용)"""
+        pass
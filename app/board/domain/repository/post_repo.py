@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import List
 from app.board.domain.post import Post
+from app.board.domain.post_projection import PostProjection
 
 class IPostRepository(ABC):
     """Interface for Post Repository"""
@@ -45,6 +46,19 @@ class IPostRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def find_projections_by_original_ids(self, board_id: int, original_ids: List[str]) -> List[PostProjection]:
+        """특정 게시판에서 original_id 리스트에 해당하는 게시물들의 경량 읽기 모델을 조회합니다.
+        
+        Args:
+            board_id: 게시판 ID
+            original_ids: 조회할 original_post_id 리스트
+            
+        Returns:
+            id, original_post_id, view_count만 담은 읽기 모델 목록
+        """
+        pass
+
     @abstractmethod
     async def update_posts_batch(self, posts: List[Post]) -> None:
         """여러 게시글을 배치로 업데이트합니다.
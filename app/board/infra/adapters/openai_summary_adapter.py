@@ -9,11 +9,59 @@ from typing import Optional, List
 from datetime import datetime
 from app.board.domain.post import Post
 from app.board.domain.post_picture import PostPicture
+from app.board.infra.ocr.ocr_pipeline.output_format import OCR_OUTPUT_FORMAT
 
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 상명대학교 건물 목록 (알파벳 제외) - 위치 추출 결과 검증용
+SANGMYUNG_BUILDINGS = {
+    "사범대학관", "미술관", "가정관", "생활예술관", "학군단", "체육관",
+    "제1공학관", "학생회관", "제2교수회관", "대학본부", "제2공학관",
+    "학술정보관", "월해관", "자하관", "제1교수회관", "미래백년관",
+    "중앙교수회관", "경영경제대학관", "문화예술관"
+}
+
+# 본문/사진 요약과 장소·날짜 추출을 한 번에 요청할 때 사용하는 모델 (function calling 지원 모델)
+SUMMARY_COMBINED_MODEL = os.getenv("SUMMARY_COMBINED_MODEL", "gpt-3.5-turbo")
+
+# 통합 요약 응답 스키마 (function calling) - 장소는 건물 목록 enum으로 제한
+COMBINED_SUMMARY_FUNCTION = {
+    "name": "save_post_summary",
+    "description": "공지 본문 요약, 사진(OCR) 요약, 상명대 건물 장소/날짜 목록을 저장",
+    "parameters": {
+        "type": "object",
+        "properties": {
+            "content_summary": {
+                "type": "string",
+                "description": "공지 본문 정리 (항목별 줄바꿈)"
+            },
+            "picture_summary": {
+                "type": "string",
+                "description": "이미지 추출 텍스트 정리 (항목별 줄바꿈, 이미지 텍스트가 없으면 빈 문자열)"
+            },
+            "events": {
+                "type": "array",
+                "description": "상명대 건물에서 열리는 일정 (건물이 여러 개면 각각 별도 항목, 없으면 빈 배열)",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "location": {"type": "string", "enum": sorted(SANGMYUNG_BUILDINGS)},
+                        "start_date": {"type": "string", "description": "YYYY-MM-DD 또는 빈 문자열"},
+                        "end_date": {"type": "string", "description": "YYYY-MM-DD 또는 빈 문자열"}
+                    },
+                    "required": ["location"]
+                }
+            }
+        },
+        "required": ["content_summary", "picture_summary", "events"]
+    }
+}
+
+# 앞뒤 공백을 제외한 길이가 이 글자 수 이하인 본문/OCR 텍스트는 요약하지 않고 그대로 사용
+SHORT_TEXT_LENGTH = 30
+
 class OpenAISummaryAdapter(SummaryPort):
     """OpenAI API를 사용한 비동기 요약 서비스 어댑터"""
     
@@ -121,13 +169,13 @@ class OpenAISummaryAdapter(SummaryPort):
             logger.info("OCR 텍스트가 짧아서 그대로 반환합니다. 길이: %d자", len(ocr_text.strip()))
             return post_picture
         
+        # OCR 텍스트 형식에 맞는 섹션 구분 안내
+        section_guide = self._ocr_section_guide()
+
         try:
-            messages = [
-                {
-                    "role": "user", 
-                    "content": f"""다음 이미지에서 추출된 텍스트를 정리해주세요.
+            content = f"""다음 이미지에서 추출된 텍스트를 정리해주세요.
                     
-                    각 섹션은 '---'로 구분되어 있습니다.
+                    {section_guide}
 
                     **정리 방식:**
                     - 핵심 정보만 추출하여 항목별로 정리
@@ -143,6 +191,16 @@ class OpenAISummaryAdapter(SummaryPort):
                     기타 정보: (있을 때만)
 
                     추출된 텍스트: {ocr_text}"""
+            if OCR_OUTPUT_FORMAT == "compact":
+                # 안내문 들여쓰기 공백도 입력 토큰이므로 제거 (OCR 텍스트는 그대로)
+                instructions, text_part = content.split("추출된 텍스트: ", 1)
+                instructions = "\n".join(line.strip() for line in instructions.splitlines())
+                content = f"{instructions}추출된 텍스트: {text_part}"
+
+            messages = [
+                {
+                    "role": "user", 
+                    "content": content
                 }
             ]
                     
@@ -166,22 +224,113 @@ class OpenAISummaryAdapter(SummaryPort):
             post_picture.picture_summary = "실패"
             
             return post_picture
-    
-    
+
+    async def summarize_post_combined(self, post: Post, post_picture: Optional[PostPicture] = None) -> Optional[dict]:
+        """
+        본문 요약, 사진(OCR) 요약, 장소/날짜 추출을 function calling 요청 한 번으로 처리합니다.
+
+        짧은 본문/OCR 텍스트는 기존 요약과 같이 요약하지 않고 그대로 사용하며,
+        장소는 SANGMYUNG_BUILDINGS의 건물명으로 검증합니다.
+
+        Parameters:
+        - post: 요약할 Post 객체
+        - post_picture: OCR 텍스트가 있는 PostPicture 객체 (없으면 None)
+
+        Returns:
+        - dict: {"content_summary", "picture_summary", "locations"} (실패 시 None → 기존 다중 호출 경로 사용)
+          picture_summary가 None이면 사진 요약을 갱신하지 않음, locations는 extract_structured_location_info와 같은 형식
+        """
+        content_str = (post.original_content or "").strip()
+        ocr_text = (post_picture.original_ocr_text or "").strip() if post_picture else ""
+
+        # 1. 요약이 필요 없는 텍스트는 기존 요약 방식과 같이 처리
+        content_summary = None
+        if not content_str:
+            content_summary = "내용 없음"
+        elif len(content_str) <= SHORT_TEXT_LENGTH:
+            content_summary = content_str
+        picture_summary = None
+        if post_picture and not ocr_text:
+            picture_summary = "내용 없음"
+        needs_picture_summary = len(ocr_text) > SHORT_TEXT_LENGTH
+
+        # 2. 요약할 내용도 건물명도 없으면 GPT 요청 생략
+        has_building = self._contains_sangmyung_building(f"{content_str}\n{ocr_text}", SANGMYUNG_BUILDINGS)
+        if content_summary is not None and not needs_picture_summary and not has_building:
+            return {"content_summary": content_summary, "picture_summary": picture_summary, "locations": []}
+
+        # 3. 본문 + OCR 텍스트를 한 번에 요청
+        content = f"""다음 학교 공지사항의 본문과 첨부 이미지에서 추출된 텍스트를 정리하고, 일정의 장소와 날짜를 추출해 save_post_summary로 저장해주세요.
+
+        **정리 방식 (content_summary: 본문, picture_summary: 이미지 텍스트):**
+        - 핵심 정보만 추출하여 항목별로 정리 (일정, 장소, 신청방법, 주의사항, 기타 정보 중 있는 것만)
+        - 각 항목은 줄바꿈으로 구분
+        - 이미지 텍스트가 없으면 picture_summary는 빈 문자열
+        - 이미지 텍스트: {self._ocr_section_guide()}
+
+        **장소/날짜 추출 (events):**
+        - 장소는 상명대 건물 목록(enum)의 건물명 그대로만 사용 (층수, 호실 등 부가정보 제외)
+        - 목록에 없는 장소, 온라인, 외부 장소는 제외하고, 여러 건물이면 각각 별도 항목
+        - 날짜는 YYYY-MM-DD, 알 수 없으면 빈 문자열
+
+        공지 본문: {content_str or "없음"}
+
+        이미지 추출 텍스트: {ocr_text or "없음"}"""
+        # 안내문 들여쓰기 공백도 입력 토큰이므로 제거 (본문/OCR 텍스트는 그대로)
+        instructions, text_part = content.split("공지 본문: ", 1)
+        instructions = "\n".join(line.strip() for line in instructions.splitlines())
+        content = f"{instructions}공지 본문: {text_part}"
+
+        try:
+            response = await self.client.chat.completions.create(
+                model=SUMMARY_COMBINED_MODEL,
+                messages=[{"role": "user", "content": content}],
+                tools=[{"type": "function", "function": COMBINED_SUMMARY_FUNCTION}],
+                tool_choice={"type": "function", "function": {"name": COMBINED_SUMMARY_FUNCTION["name"]}},
+                max_tokens=700,
+                temperature=0.2
+            )
+            tool_calls = response.choices[0].message.tool_calls
+            if not tool_calls:
+                logger.error("통합 요약 응답에 function call이 없습니다.")
+                return None
+            result = json.loads(tool_calls[0].function.arguments)
+            if response.usage is not None:
+                logger.info(f"통합 요약 토큰 사용량: 입력 {response.usage.prompt_tokens}, 출력 {response.usage.completion_tokens}")
+        except json.JSONDecodeError as e:
+            logger.error(f"통합 요약 응답 JSON 파싱 실패: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"통합 요약 OpenAI API 호출 중 오류 발생: {e}")
+            return None
+
+        # 4. 응답 검증
+        if not isinstance(result, dict):
+            logger.error(f"통합 요약 응답 형식 오류: {result}")
+            return None
+        if content_summary is None:
+            content_summary = result.get("content_summary")
+            if not isinstance(content_summary, str) or not content_summary.strip():
+                logger.error("통합 요약 응답에 본문 요약이 없습니다.")
+                return None
+            content_summary = content_summary.strip()
+        if needs_picture_summary:
+            picture_summary = result.get("picture_summary")
+            if not isinstance(picture_summary, str) or not picture_summary.strip():
+                logger.error("통합 요약 응답에 사진 요약이 없습니다.")
+                return None
+            picture_summary = picture_summary.strip()
+
+        # 기존 경로와 같이 원문에 건물명이 없으면 장소를 추출하지 않음
+        locations = self._validate_events(result.get("events")) if has_building else []
+        logger.info(f"통합 요약 완료 - 장소 {len(locations)}개")
+        return {"content_summary": content_summary, "picture_summary": picture_summary, "locations": locations}
 
     async def extract_structured_location_info(self, summary_content: str) -> Optional[List[dict]]:
         """2차 필터: 요약된 내용에서 날짜, 장소 정보를 추출하여 딕셔너리 리스트로 반환"""
         if not summary_content or not summary_content.strip():
             return None
         
-        # 상명대학교 건물 목록 (알파벳 제외)
-        SANGMYUNG_BUILDINGS = {
-            "사범대학관", "미술관", "가정관", "생활예술관", "학군단", "체육관",
-            "제1공학관", "학생회관", "제2교수회관", "대학본부", "제2공학관",
-            "학술정보관", "월해관", "자하관", "제1교수회관", "미래백년관",
-            "중앙교수회관", "경영경제대학관", "문화예술관"
-        }
-        
         # 사전 검증: 상명대 건물명이 포함되어 있는지 확인
         if not self._contains_sangmyung_building(summary_content, SANGMYUNG_BUILDINGS):
             logger.info(f"상명대 건물명이 포함되지 않아 GPT 요청을 건너뜁니다: {summary_content[:50]}...")
@@ -322,6 +471,49 @@ class OpenAISummaryAdapter(SummaryPort):
             logger.error(f"구조화된 정보 추출 중 오류 발생: {e}")
         return None
 
+    def _validate_events(self, events) -> List[dict]:
+        """
+        통합 요약 응답의 events를 건물 목록과 날짜 형식으로 검증
+
+        Returns:
+            List[dict]: {"location", "start_date", "end_date"} 목록 (날짜 형식이 잘못되면 None)
+        """
+        if not isinstance(events, list):
+            return []
+
+        valid_events = []
+        for event in events:
+            if not isinstance(event, dict) or not isinstance(event.get("location"), str):
+                continue
+            building = self._find_building_match(event["location"], SANGMYUNG_BUILDINGS)
+            if not building:
+                logger.warning(f"유효하지 않은 건물명 무시: '{event['location']}'")
+                continue
+            valid_events.append({
+                "location": building,
+                "start_date": self._parse_date(event.get("start_date")),
+                "end_date": self._parse_date(event.get("end_date"))
+            })
+        return valid_events
+
+    @staticmethod
+    def _parse_date(value) -> Optional[str]:
+        """YYYY-MM-DD 형식이면 그대로, 아니면 None"""
+        if not isinstance(value, str):
+            return None
+        try:
+            datetime.strptime(value.strip(), "%Y-%m-%d")
+        except ValueError:
+            return None
+        return value.strip()
+
+    @staticmethod
+    def _ocr_section_guide() -> str:
+        """OCR 텍스트 형식에 맞는 섹션 구분 안내"""
+        if OCR_OUTPUT_FORMAT == "compact":
+            return "각 섹션은 빈 줄로 구분되어 있고, 탭으로 구분된 줄들은 표(첫 줄이 머리글)입니다."
+        return "각 섹션은 '---'로 구분되어 있습니다."
+
     def _contains_sangmyung_building(self, text: str, building_set: set) -> bool:
         """
         텍스트에 상명대학교 건물명이 포함되어 있는지 확인 (정확한 명칭만)
@@ -0,0 +1,21 @@
+from sqlalchemy import Integer, Float, DateTime, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from datetime import datetime, timezone
+from app.database.base import Base  # 공통 Base 사용
+
+class PostPopularity(Base):
+    """게시글 인기도 점수 스냅샷 DB 모델"""
+    __tablename__ = "post_popularity"
+    __table_args__ = (
+        Index("ix_post_popularity_updated_at", "updated_at"),
+    )
+
+    post_id: Mapped[int] = mapped_column(Integer, ForeignKey("post.id", ondelete="CASCADE"), primary_key=True)
+    board_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    score: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    last_view_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc)
+    )
@@ -0,0 +1,23 @@
+from sqlalchemy import Integer, DateTime, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from datetime import datetime, timezone
+from app.database.base import Base  # 공통 Base 사용
+
+class PostViewDelta(Base):
+    """게시글 조회수 증가량 시계열 DB 모델"""
+    __tablename__ = "post_view_count_delta"
+    __table_args__ = (
+        Index("ix_post_view_count_delta_board_recorded", "board_id", "recorded_at"),
+        Index("ix_post_view_count_delta_post_recorded", "post_id", "recorded_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    post_id: Mapped[int] = mapped_column(Integer, ForeignKey("post.id", ondelete="CASCADE"), nullable=False)
+    board_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    delta: Mapped[int] = mapped_column(Integer, nullable=False)
+    view_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    recorded_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc)
+    )
@@ -1,43 +1,209 @@
+import asyncio
 from .ocr_pipeline.call_clova import call_clova_ocr
-from .ocr_pipeline.post_process_pipeline import post_process_pipeline
-from .ocr_pipeline.config import section_classification_config, post_process_config
+from .ocr_pipeline.clova_client import ClovaOCRClient
+from .ocr_result_cache import CachedOCRResult, ImageFingerprint, OCRResultCache, OCR_CACHE_ENABLED
+from .ocr_response_archive import OCRResponseArchive, create_default_archive
+from .layout_worker_pool import LayoutWorkerPool, run_layout_pipeline
+from .ocr_pipeline.output_format import OCR_OUTPUT_FORMAT
+from .ocr_pipeline.preprocess.text_likelihood import TextLikelihoodGate
+from .ocr_pipeline.stage_timing import stage
 from app.board.application.ports.ocr_port import OCRPort
 import logging
-from typing import List
+from typing import List, Dict, Optional, Tuple
 
 
 logger = logging.getLogger(__name__)
 
 
 class ClovaOCRAdapter(OCRPort):
+
+    def __init__(self,
+                 clova_client: Optional[ClovaOCRClient] = None,
+                 ocr_cache: Optional[OCRResultCache] = None,
+                 layout_pool: Optional[LayoutWorkerPool] = None,
+                 text_gate: Optional[TextLikelihoodGate] = None,
+                 response_archive: Optional[OCRResponseArchive] = None):
+        self.clova_client = clova_client or ClovaOCRClient()
+        self.ocr_cache = ocr_cache or (OCRResultCache() if OCR_CACHE_ENABLED else None)
+        # 레이아웃 후처리(CPU 작업)는 프로세스 풀에서 실행
+        self.layout_pool = layout_pool or LayoutWorkerPool()
+        # 로고/구분선/장식 배너 등 텍스트가 없을 이미지는 CLOVA 호출 전에 건너뜀
+        self.text_gate = text_gate or TextLikelihoodGate()
+        # 사진별 원본 CLOVA 응답 보관 (재OCR 없이 후처리/요약 재실행용, 캐시와 달리 제거하지 않음)
+        self.response_archive = response_archive or create_default_archive()
       
-   def extract_text_from_image_pipeline(self, image_path: str) -> str:
+    def extract_text_from_image_pipeline(self, image_path: str) -> str:
         ocr_response = call_clova_ocr(image_path)
+        return run_layout_pipeline(ocr_response)
+
+    async def extract_text_from_image(self, image_url: str) -> str:
+        if self.ocr_cache is None:
+            image_data = await self.clova_client.load_image(image_url)
+            if not await self._likely_has_text(image_url, image_data):
+                return ""
+            ocr_response = await self.clova_client.ocr_image(image_data, self.clova_client.format_from_source(image_url))
+            del image_data
+            # 후처리는 CPU 작업이므로 워커 풀에서 실행
+            text = await self.layout_pool.run(ocr_response)
+            await self._archive(image_url, None, ocr_response, text)
+            return text
+
+        # 1. 이미 본 URL이면 다운로드 없이 캐시 적중
+        cached = await asyncio.to_thread(self.ocr_cache.get_by_url, image_url)
+        if cached is not None:
+            logger.info(f"OCR 캐시 적중 (url): {image_url}")
+            text = await self._cached_text(cached)
+            await self._archive(image_url, cached.sha256, cached.ocr_response, text, overwrite=False)
+            return text
+
+        # 2. 이미지 내용(SHA-256, 설정 시 dHash)으로 캐시 조회 - 교차 게시된 같은 포스터
+        image_data = await self.clova_client.load_image(image_url)
+        cached, sha256, dhash = await asyncio.to_thread(self.ocr_cache.get_by_content, image_data)
+        if cached is not None:
+            logger.info(f"OCR 캐시 적중 ({cached.match}): {image_url}")
+            await asyncio.to_thread(self.ocr_cache.remember_url, image_url, cached.sha256)
+            text = await self._cached_text(cached)
+            await self._archive(image_url, cached.sha256, cached.ocr_response, text, overwrite=False)
+            return text
 
-        results: List[str] = post_process_pipeline(
-            ocr_response, 
-            section_classification_config.section_classification_config, 
-            post_process_config.post_process_config
+        # 3. 미적중 - 텍스트가 없을 이미지면 CLOVA 호출 생략
+        if not await self._likely_has_text(image_url, image_data):
+            return ""
+
+        # 4. CLOVA 호출 후 저장
+        ocr_response = await self.clova_client.ocr_image(image_data, self.clova_client.format_from_source(image_url))
+        del image_data
+        text = await self.layout_pool.run(ocr_response)
+        await asyncio.to_thread(self.ocr_cache.put, sha256, dhash, image_url, ocr_response, text)
+        await self._archive(image_url, sha256, ocr_response, text)
+        return text
+
+    async def extract_texts_from_images(self, image_urls: List[str]) -> List[Optional[str]]:
+        """
+        여러 이미지를 캐시 조회 후 미적중분만 묶어서 CLOVA OCR 요청 (실패한 이미지는 None)
+        """
+        unique_urls = list(dict.fromkeys(image_urls))
+        texts: Dict[str, Optional[str]] = {}
+
+        # 1. 캐시 조회 및 이미지 로드 (URL별 동시 실행)
+        lookups = await asyncio.gather(
+            *(self._lookup_for_batch(image_url) for image_url in unique_urls), return_exceptions=True
         )
-        # 후처리 결과를 로그로 출력
-        logger.info("최종 결과:")
-        for idx, section in enumerate(results):
-            logger.info(f"\n--- Section {idx + 1} ---\n{section}")
+        misses: List[Tuple[str, bytes, Optional[str], Optional[ImageFingerprint]]] = []  # (url, 이미지, sha256, 지문)
+        for image_url, lookup in zip(unique_urls, lookups):
+            if isinstance(lookup, Exception):
+                logger.error(f"OCR 이미지 로드 실패: {image_url} - {lookup}")
+                texts[image_url] = None
+            elif isinstance(lookup, str):
+                texts[image_url] = lookup
+            else:
+                misses.append((image_url, *lookup))
+
+        # 2. 미적중 이미지를 묶어서 CLOVA 호출
+        if misses:
+            ocr_responses = await self.clova_client.ocr_images(
+                [(image_data, self.clova_client.format_from_source(image_url)) for image_url, image_data, _, _ in misses]
+            )
+            succeeded = []
+            for (image_url, _, sha256, dhash), ocr_response in zip(misses, ocr_responses):
+                if isinstance(ocr_response, Exception):
+                    logger.error(f"OCR 요청 실패: {image_url} - {ocr_response}")
+                    texts[image_url] = None
+                    continue
+                succeeded.append((image_url, sha256, dhash, ocr_response))
+            del misses, ocr_responses
 
-        # 구분자로 연결해서 문자열로 반환
-        return "\n\n---\n\n".join(results)
+            # 3. 성공한 응답의 레이아웃 후처리를 워커 풀에서 동시에 실행 (여러 코어 사용)
+            processed = await self.layout_pool.run_many([ocr_response for _, _, _, ocr_response in succeeded])
+            for (image_url, sha256, dhash, ocr_response), text in zip(succeeded, processed):
+                if isinstance(text, Exception):
+                    logger.error(f"OCR 후처리 실패: {image_url} - {text}")
+                    texts[image_url] = None
+                    continue
+                if self.ocr_cache is not None:
+                    await asyncio.to_thread(self.ocr_cache.put, sha256, dhash, image_url, ocr_response, text)
+                await self._archive(image_url, sha256, ocr_response, text)
+                texts[image_url] = text
+
+        return [texts[image_url] for image_url in image_urls]
+
+    async def _lookup_for_batch(self, image_url: str):
+        """
+        캐시 적중 시 텍스트, 미적중 시 (이미지 바이트, sha256, 근사 일치용 지문) 반환
+        """
+        if self.ocr_cache is None:
+            image_data = await self.clova_client.load_image(image_url)
+            if not await self._likely_has_text(image_url, image_data):
+                return ""
+            return image_data, None, None
+
+        cached = await asyncio.to_thread(self.ocr_cache.get_by_url, image_url)
+        if cached is not None:
+            logger.info(f"OCR 캐시 적중 (url): {image_url}")
+            text = await self._cached_text(cached)
+            await self._archive(image_url, cached.sha256, cached.ocr_response, text, overwrite=False)
+            return text
+
+        image_data = await self.clova_client.load_image(image_url)
+        cached, sha256, dhash = await asyncio.to_thread(self.ocr_cache.get_by_content, image_data)
+        if cached is not None:
+            logger.info(f"OCR 캐시 적중 ({cached.match}): {image_url}")
+            await asyncio.to_thread(self.ocr_cache.remember_url, image_url, cached.sha256)
+            text = await self._cached_text(cached)
+            await self._archive(image_url, cached.sha256, cached.ocr_response, text, overwrite=False)
+            return text
+        if not await self._likely_has_text(image_url, image_data):
+            return ""
+        return image_data, sha256, dhash
+
+    async def _cached_text(self, cached: CachedOCRResult) -> str:
+        """
+        캐시된 OCR 텍스트 반환
+
+        출력 형식(OCR_OUTPUT_FORMAT)이나 레이아웃 버전이 바뀐 뒤 저장된 텍스트면 저장된 원본 응답으로
+        후처리를 다시 실행하고 캐시를 갱신합니다 (CLOVA 재호출 없음).
+        """
+        if cached.is_current:
+            return cached.text
+        logger.info(
+            f"OCR 캐시 텍스트 재생성 ({cached.output_format}, v{cached.layout_version} → 현재 형식/버전): {cached.sha256}"
+        )
+        text = await self.layout_pool.run(cached.ocr_response)
+        await asyncio.to_thread(self.ocr_cache.update_text, cached.sha256, text)
+        return text
 
+    async def _likely_has_text(self, image_url: str, image_data: bytes) -> bool:
+        """OCR 전 텍스트 가능성 검사 (건너뛴 이미지는 빈 텍스트로 처리되어 OCR 실패와 같이 취급)"""
+        with stage("text_gate"):
+            result = await asyncio.to_thread(self.text_gate.check, image_data)
+        if not result.likely:
+            logger.info(
+                f"텍스트 없는 이미지로 판단하여 OCR 생략 ({result.reason}): {image_url} - "
+                f"{result.width}x{result.height}, {result.byte_size} bytes, "
+                f"edge_density={result.edge_density}, contrast={result.contrast}"
+            )
+        return result.likely
 
-# if __name__ == "__main__":
-#     import sys
-#     if len(sys.argv) < 2:
-#         print("이미지 경로를 인자로 입력하세요: python main.py image.jpg")
-#         sys.exit(1)
+    async def _archive(self, image_url: str, sha256: Optional[str], ocr_response: dict, text: str,
+                       overwrite: bool = True) -> None:
+        """
+        원본 응답과 OCR 텍스트를 보관소에 저장 (실패해도 OCR 결과는 그대로 반환)
 
-#     image_path = sys.argv[1]
-#     final_result = run_ocr_pipeline(image_path)
+        캐시 적중 경로(overwrite=False)는 보관소 도입 전에 캐시된 사진만 새로 저장합니다.
+        """
+        if self.response_archive is None:
+            return
+        try:
+            await asyncio.to_thread(
+                self.response_archive.put, image_url, sha256, ocr_response, text, OCR_OUTPUT_FORMAT, overwrite
+            )
+        except Exception as e:
+            logger.error(f"OCR 원본 응답 보관 실패: {image_url} - {e}")
 
-#     print("\n 최종 결과:")
-#     for idx, section in enumerate(final_result):
-#         print(f"\n--- Section {idx + 1} ---")
-#         print(section)
\ No newline at end of file
+    async def close(self) -> None:
+        await self.clova_client.close()
+        self.layout_pool.close()
+        if self.ocr_cache is not None:
+            self.ocr_cache.close()
+        if self.response_archive is not None:
+            self.response_archive.close()
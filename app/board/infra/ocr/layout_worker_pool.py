@@ -0,0 +1,143 @@
+import asyncio
+import os
+import time
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Tuple
+from .ocr_pipeline.stage_timing import StageRecorder, current_board, recording, stage_histograms
+from .ocr_pipeline.task_latency import TaskLatencyMetrics
+
+logger = logging.getLogger(__name__)
+
+# 레이아웃 후처리 워커 프로세스 수 (0이면 프로세스 풀 없이 스레드에서 실행)
+OCR_LAYOUT_WORKERS = max(0, int(os.getenv("OCR_LAYOUT_WORKERS", str(min(4, os.cpu_count() or 1)))))
+# 워커 프로세스 시작 방식 (이벤트 루프/스레드가 있는 프로세스에서 fork는 안전하지 않으므로 기본 spawn)
+OCR_LAYOUT_START_METHOD = os.getenv("OCR_LAYOUT_START_METHOD", "spawn")
+# 워커 1개가 처리할 최대 작업 수 (메모리 단편화 방지용 재시작, 0이면 무제한 - Python 3.11+)
+OCR_LAYOUT_MAX_TASKS_PER_CHILD = int(os.getenv("OCR_LAYOUT_MAX_TASKS_PER_CHILD", "200"))
+
+
+def run_layout_pipeline(ocr_response: Dict) -> str:
+    """
+    CLOVA OCR 응답 → 레이아웃 분석 → 섹션별 후처리 → 최종 텍스트 (OCR_OUTPUT_FORMAT 형식)
+
+    워커 프로세스에서 실행되므로 모듈 최상위 함수로 두고(피클 가능), 입력은 응답 dict, 출력은 텍스트만 주고받습니다.
+    """
+    from .ocr_pipeline.post_process_pipeline import post_process_structured
+    from .ocr_pipeline.config import section_classification_config, post_process_config
+    from .ocr_pipeline.output_format import OCR_OUTPUT_FORMAT, serialize_sections
+
+    sections = post_process_structured(
+        ocr_response,
+        section_classification_config.section_classification_config,
+        post_process_config.post_process_config
+    )
+    # 후처리 결과를 로그로 출력
+    logger.info("최종 결과:")
+    for idx, section in enumerate(sections):
+        logger.info(f"\n--- Section {idx + 1} ---\n{section['text']}")
+
+    # 출력 형식에 맞게 하나의 문자열로 직렬화
+    return serialize_sections(sections, OCR_OUTPUT_FORMAT)
+
+
+def run_layout_pipeline_timed(ocr_response: Dict) -> Tuple[str, Dict[str, List[float]]]:
+    """
+    run_layout_pipeline + 단계별 소요 시간(ms)
+
+    워커 프로세스의 전역 히스토그램은 부모 프로세스에서 볼 수 없으므로, 단계 시간을 결과와 함께 돌려주어
+    부모 프로세스에서 게시판 라벨로 집계합니다.
+    """
+    with recording(StageRecorder()) as recorder:
+        text = run_layout_pipeline(ocr_response)
+    return text, recorder.timings_ms
+
+
+def _init_worker() -> None:
+    """워커 프로세스 로깅 설정 (spawn된 프로세스는 부모의 로깅 설정을 물려받지 않음)"""
+    from app.config.logging_config import setup_logging
+    setup_logging()
+
+
+class LayoutWorkerPool:
+    """
+    OCR 레이아웃 후처리(CPU 작업)를 프로세스 풀에서 실행
+
+    - 한 스크랩 주기에 새 포스터가 많아도 여러 코어에서 병렬로 처리하고, 이벤트 루프(API)는 막지 않음
+    - max_workers가 0이면 기존처럼 스레드에서 실행 (단일 코어 환경/디버깅용)
+    - 워커가 비정상 종료되어 풀이 깨지면 해당 작업은 스레드에서 처리하고 다음 작업 때 풀을 다시 생성
+    - 작업 지연 시간(제출 → 결과 수신, 큐 대기 포함)을 기록하고, 워커가 측정한 단계별 시간은 게시판별 히스토그램에 집계
+    """
+
+    def __init__(self,
+                 max_workers: Optional[int] = None,
+                 start_method: Optional[str] = None,
+                 max_tasks_per_child: Optional[int] = None):
+        self.max_workers = OCR_LAYOUT_WORKERS if max_workers is None else max(0, max_workers)
+        self.start_method = start_method or OCR_LAYOUT_START_METHOD
+        self.max_tasks_per_child = OCR_LAYOUT_MAX_TASKS_PER_CHILD if max_tasks_per_child is None else max_tasks_per_child
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._metrics = TaskLatencyMetrics()
+        self._fallbacks = 0
+
+    async def run(self, ocr_response: Dict) -> str:
+        """OCR 응답 1건을 후처리하여 최종 텍스트 반환"""
+        started = time.perf_counter()
+        try:
+            text, timings_ms = await self._run_timed(ocr_response)
+        finally:
+            self._metrics.record((time.perf_counter() - started) * 1000)
+        stage_histograms.observe_many(current_board(), timings_ms)
+        return text
+
+    async def _run_timed(self, ocr_response: Dict) -> Tuple[str, Dict[str, List[float]]]:
+        if self.max_workers == 0:
+            return await asyncio.to_thread(run_layout_pipeline_timed, ocr_response)
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._get_executor(), run_layout_pipeline_timed, ocr_response)
+        except BrokenProcessPool:
+            logger.error("레이아웃 워커 풀 비정상 종료 - 스레드에서 처리 후 풀 재생성 예정")
+            self._fallbacks += 1
+            self._discard_executor()
+            return await asyncio.to_thread(run_layout_pipeline_timed, ocr_response)
+
+    async def run_many(self, ocr_responses: List[Dict]) -> List[Any]:
+        """여러 OCR 응답을 동시에 후처리 (실패한 항목은 예외 객체로 반환)"""
+        return await asyncio.gather(*(self.run(ocr_response) for ocr_response in ocr_responses), return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """풀 설정과 작업 지연 시간 통계"""
+        return {
+            **self._metrics.snapshot(),
+            "max_workers": self.max_workers,
+            "mode": "process" if self.max_workers else "thread",
+            "start_method": self.start_method,
+            "running": self._executor is not None,
+            "fallbacks": self._fallbacks,
+        }
+
+    def close(self) -> None:
+        """워커 프로세스 정리 (대기 중인 작업은 취소)"""
+        self._discard_executor()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            options: Dict[str, Any] = {
+                "max_workers": self.max_workers,
+                "mp_context": multiprocessing.get_context(self.start_method),
+                "initializer": _init_worker,
+            }
+            if self.max_tasks_per_child > 0 and self.start_method != "fork":
+                options["max_tasks_per_child"] = self.max_tasks_per_child
+            self._executor = ProcessPoolExecutor(**options)
+            logger.info(f"레이아웃 워커 풀 시작 - 워커 {self.max_workers}개 ({self.start_method})")
+        return self._executor
+
+    def _discard_executor(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
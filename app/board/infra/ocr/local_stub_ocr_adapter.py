@@ -0,0 +1,42 @@
+import asyncio
+import hashlib
+import os
+import logging
+import time
+from typing import Optional
+
+from app.board.application.ports.ocr_port import OCRPort
+
+logger = logging.getLogger(__name__)
+
+# 스텁 응답 지연 시간 (라우터 장애 전환 테스트용)
+OCR_STUB_LATENCY_MS = float(os.getenv("OCR_STUB_LATENCY_MS", "0"))
+
+
+class LocalStubOCRAdapter(OCRPort):
+    """
+    외부 호출 없는 결정적 OCR 스텁 (오프라인 개발/테스트용)
+
+    같은 이미지 경로/URL에는 항상 같은 텍스트를 반환합니다. 운영 OCR 백엔드로 사용하지 않으며,
+    라우터는 OCR_STUB_ENABLED=true일 때만 이 스텁을 경로에 넣습니다.
+    """
+
+    def __init__(self, latency_ms: Optional[float] = None):
+        self.latency_ms = OCR_STUB_LATENCY_MS if latency_ms is None else latency_ms
+
+    def extract_text_from_image_pipeline(self, image_path: str) -> str:
+        if self.latency_ms > 0:
+            time.sleep(self.latency_ms / 1000)
+        return self.stub_text(image_path)
+
+    async def extract_text_from_image(self, image_url: str) -> str:
+        if self.latency_ms > 0:
+            await asyncio.sleep(self.latency_ms / 1000)
+        return self.stub_text(image_url)
+
+    @staticmethod
+    def stub_text(image_source: str) -> str:
+        """이미지 경로/URL로 정해지는 스텁 텍스트"""
+        digest = hashlib.sha256(image_source.encode("utf-8")).hexdigest()[:12]
+        name = image_source.split("?", 1)[0].rsplit("/", 1)[-1]
+        return f"[로컬 OCR 스텁] {name}\n이미지 식별자: {digest}"
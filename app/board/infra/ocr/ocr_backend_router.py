@@ -0,0 +1,187 @@
+import os
+import time
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from app.board.application.ports.ocr_port import OCRPort
+from .local_stub_ocr_adapter import LocalStubOCRAdapter
+
+logger = logging.getLogger(__name__)
+
+# 사용할 OCR 백엔드 (우선순위 순, 쉼표 구분) - clova | stub
+OCR_BACKENDS = [name.strip() for name in os.getenv("OCR_BACKENDS", "clova").split(",") if name.strip()]
+# 로컬 OCR 스텁 사용 허용 (개발 전용) - 꺼져 있으면 OCR_BACKENDS에 stub이 있어도 경로/장애 전환에서 제외
+OCR_STUB_ENABLED = os.getenv("OCR_STUB_ENABLED", "false").lower() == "true"
+# 백엔드별 오류율 EWMA 가중치와, 경로 선택에서 뒤로 미룰 오류율
+OCR_ROUTER_EWMA_ALPHA = float(os.getenv("OCR_ROUTER_EWMA_ALPHA", "0.2"))
+OCR_ROUTER_MAX_ERROR_RATE = float(os.getenv("OCR_ROUTER_MAX_ERROR_RATE", "0.5"))
+# 뒤로 미룬 백엔드를 마지막 오류 후 이 시간(초)이 지나면 다시 설정 순서대로 시도 (뒤로 밀린 백엔드는 호출되지 않아 오류율이 회복되지 않으므로)
+OCR_ROUTER_RETRY_SECONDS = float(os.getenv("OCR_ROUTER_RETRY_SECONDS", "60"))
+
+
+class BackendHealth:
+    """백엔드별 오류율 EWMA"""
+
+    def __init__(self, name: str, alpha: float):
+        self.name = name
+        self.alpha = alpha
+        self.error_rate = 0.0
+        self.calls = 0
+        self.errors = 0
+        self.last_error_at: Optional[float] = None
+
+    def record_success(self) -> None:
+        self.calls += 1
+        self.error_rate = (1 - self.alpha) * self.error_rate
+
+    def record_error(self) -> None:
+        self.calls += 1
+        self.errors += 1
+        self.last_error_at = time.monotonic()
+        self.error_rate = (1 - self.alpha) * self.error_rate + self.alpha
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "ewma_error_rate": round(self.error_rate, 4),
+        }
+
+
+def _default_backend_factories() -> Dict[str, Callable[[], OCRPort]]:
+    from .clova_ocr_adapter import ClovaOCRAdapter
+
+    return {"clova": ClovaOCRAdapter, "stub": LocalStubOCRAdapter}
+
+
+class OcrBackendRouter(OCRPort):
+    """
+    여러 OCR 백엔드를 OCRPort 하나로 묶는 장애 전환 라우터
+
+    - 경로 선택: 설정 순서(OCR_BACKENDS)를 따르되, 오류율 EWMA가 상한을 넘은 백엔드는 마지막 오류 후
+      retry_seconds 동안 뒤로 미룸
+    - 장애 전환: 요청이 실패하면 다음 백엔드로 재요청. 묶음 요청은 실패한(None) 이미지만 다음 백엔드로 재요청
+    - 로컬 스텁(LocalStubOCRAdapter)은 가짜 텍스트를 반환하므로 OCR_STUB_ENABLED(개발 전용)일 때만 사용
+    실제 경로인 묶음 요청은 여러 이미지를 CLOVA 요청 하나로 보내므로 이미지별 지연 시간을 측정할 수 없고,
+    같은 묶음을 중복 전송(헤징)하면 유료 호출이 그대로 늘어나므로 지연 시간 기반 경로 선택과 헤징은 하지 않습니다.
+    """
+
+    def __init__(self,
+                 backends: Optional[Dict[str, OCRPort]] = None,
+                 backend_names: Optional[List[str]] = None,
+                 stub_enabled: bool = OCR_STUB_ENABLED,
+                 ewma_alpha: float = OCR_ROUTER_EWMA_ALPHA,
+                 max_error_rate: float = OCR_ROUTER_MAX_ERROR_RATE,
+                 retry_seconds: float = OCR_ROUTER_RETRY_SECONDS):
+        names = backend_names or OCR_BACKENDS
+        if backends is None:
+            factories = _default_backend_factories()
+            backends = {name: factories[name]() for name in names if name in factories}
+        self.backends: Dict[str, OCRPort] = {}
+        for name in names:
+            if name not in backends:
+                logger.warning(f"알 수 없는 OCR 백엔드 무시: {name}")
+            elif isinstance(backends[name], LocalStubOCRAdapter) and not stub_enabled:
+                logger.warning(f"로컬 OCR 스텁은 개발 전용입니다 (OCR_STUB_ENABLED=true 필요) - 제외: {name}")
+            else:
+                self.backends[name] = backends[name]
+        if not self.backends:
+            raise ValueError(f"사용 가능한 OCR 백엔드가 없습니다: {names}")
+
+        self.max_error_rate = max_error_rate
+        self.retry_seconds = retry_seconds
+        self._health = {name: BackendHealth(name, ewma_alpha) for name in self.backends}
+        self._lock = threading.Lock()
+        logger.info(f"OCR 백엔드 라우터 - 백엔드: {list(self.backends)}")
+
+    def route(self) -> List[str]:
+        """이번 요청의 백엔드 시도 순서"""
+        now = time.monotonic()
+        with self._lock:
+            unhealthy = {
+                name: health.error_rate > self.max_error_rate and now - health.last_error_at < self.retry_seconds
+                for name, health in self._health.items()
+            }
+        # 정렬은 안정적이므로 같은 상태끼리는 설정 순서 유지
+        return sorted(self.backends, key=lambda name: unhealthy[name])
+
+    def extract_text_from_image_pipeline(self, image_path: str) -> str:
+        last_error: Optional[Exception] = None
+        for name in self.route():
+            try:
+                text = self.backends[name].extract_text_from_image_pipeline(image_path)
+            except Exception as e:
+                self._record_error(name, e)
+                last_error = e
+                continue
+            self._record_success(name)
+            return text
+        raise last_error
+
+    async def extract_text_from_image(self, image_url: str) -> str:
+        last_error: Optional[Exception] = None
+        for index, name in enumerate(self.route()):
+            if index > 0:
+                logger.warning(f"OCR 백엔드 장애 전환 → {name}: {image_url} ({last_error})")
+            try:
+                text = await self.backends[name].extract_text_from_image(image_url)
+            except Exception as e:
+                self._record_error(name, e)
+                last_error = e
+                continue
+            self._record_success(name)
+            return text
+        raise last_error
+
+    async def extract_texts_from_images(self, image_urls: List[str]) -> List[Optional[str]]:
+        results: List[Optional[str]] = [None] * len(image_urls)
+        remaining = list(range(len(image_urls)))
+        for name in self.route():
+            if not remaining:
+                break
+            if len(remaining) < len(image_urls):
+                logger.warning(f"OCR 묶음 요청 실패 {len(remaining)}건 장애 전환 → {name}")
+            try:
+                texts = await self.backends[name].extract_texts_from_images([image_urls[index] for index in remaining])
+            except Exception as e:
+                self._record_error(name, e)
+                continue
+            # 이미지별 성공/실패(None)를 오류율에 반영
+            self._record_batch(name, texts)
+            for index, text in zip(remaining, texts):
+                results[index] = text
+            remaining = [index for index, text in zip(remaining, texts) if text is None]
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        """백엔드별 호출/오류 수, 오류율 EWMA와 현재 경로 순서"""
+        order = self.route()
+        with self._lock:
+            backends = {name: health.snapshot() for name, health in self._health.items()}
+        return {"route": order, "backends": backends}
+
+    async def close(self) -> None:
+        for backend in self.backends.values():
+            await backend.close()
+
+    def _record_success(self, name: str) -> None:
+        with self._lock:
+            self._health[name].record_success()
+
+    def _record_batch(self, name: str, texts: List[Optional[str]]) -> None:
+        failed = sum(text is None for text in texts)
+        if failed:
+            logger.error(f"OCR 백엔드 묶음 요청 일부 실패 ({name}): {failed}/{len(texts)}건")
+        with self._lock:
+            health = self._health[name]
+            for text in texts:
+                if text is None:
+                    health.record_error()
+                else:
+                    health.record_success()
+
+    def _record_error(self, name: str, error: Exception) -> None:
+        logger.error(f"OCR 백엔드 오류 ({name}): {error}")
+        with self._lock:
+            self._health[name].record_error()
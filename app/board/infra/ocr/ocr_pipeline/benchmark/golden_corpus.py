@@ -0,0 +1,288 @@
+"""
+OCR 후처리 파이프라인 골든 코퍼스 벤치마크 / 회귀 검사
+
+실제 CLOVA 응답(JSON)을 고정 자료(fixture)로 저장해 두고, 오프라인으로 전체 후처리 단계를 재실행하여
+- 단계별 소요 시간 백분위수와 메모리 할당량(tracemalloc)
+- 저장된 골든 결과(섹션 타입 + 최종 텍스트)와의 차이
+를 보고합니다. 레이아웃 코드 최적화가 출력을 바꾸지 않았는지 확인하는 용도입니다.
+
+사용법 (python -m app.board.infra.ocr.ocr_pipeline.benchmark.golden_corpus ...):
+    record --from-cache [--limit N]     OCR 결과 캐시에 저장된 CLOVA 응답을 코퍼스로 수집
+    record --synthetic                  합성 레이아웃(표/컬럼/타임라인/잡음/혼합)을 코퍼스로 수집
+    record IMAGE [IMAGE ...]            이미지 파일/URL을 CLOVA로 OCR하여 코퍼스로 수집
+    replay [--repeat N] [--memory]      코퍼스 재실행 → 단계별 시간/메모리 + 골든 비교 (차이가 있으면 종료 코드 1)
+    update                              현재 코드의 출력으로 골든 결과 갱신 (의도한 출력 변경 후)
+
+기본 코퍼스(benchmark/golden)는 저장소에 포함된 합성 레이아웃 고정 자료입니다 (실제 게시물 내용 없음).
+실제 CLOVA 응답으로 수집한 코퍼스는 개인정보가 섞일 수 있으므로 OCR_GOLDEN_DIR/--corpus로 저장소 밖에 둡니다.
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from ..config import section_classification_config, post_process_config
+from ..post_process_pipeline import post_process_sections
+from ..stage_timing import StageRecorder, recording
+
+logger = logging.getLogger(__name__)
+
+OCR_GOLDEN_DIR = os.getenv("OCR_GOLDEN_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden"))
+
+# record --synthetic으로 생성하는 합성 레이아웃 (종류, 블록 수, 시드)
+SYNTHETIC_FIXTURES = (
+    ("table", 60, 0), ("table", 120, 1),
+    ("column", 60, 0), ("column", 120, 1),
+    ("timeline", 40, 0), ("timeline", 80, 1),
+    ("noise", 40, 0), ("noise", 80, 1),
+    ("mixed", 120, 0), ("mixed", 200, 1),
+)
+
+# 보고서에 표시할 단계 순서 (post_process_sections의 stage 이름)
+STAGES = ("extract", "sort", "split", "merge", "classify", "post_process")
+
+
+@dataclass
+class GoldenFixture:
+    """코퍼스 항목 1개 - 원본 CLOVA 응답과 골든 결과(섹션 타입/텍스트)"""
+    name: str
+    ocr_response: Dict
+    golden: List[Dict[str, str]]
+
+
+@dataclass
+class SectionDiff:
+    """골든 결과와 다른 섹션"""
+    fixture: str
+    index: int
+    expected: Optional[Dict[str, str]]
+    actual: Optional[Dict[str, str]]
+
+
+@dataclass
+class ReplayReport:
+    """재실행 결과 - 단계별 측정값과 골든 비교 결과"""
+    fixtures: int = 0
+    recorder: StageRecorder = field(default_factory=StageRecorder)
+    total_ms: List[float] = field(default_factory=list)
+    diffs: List[SectionDiff] = field(default_factory=list)
+
+
+def run_sections(ocr_response: Dict) -> List[Dict[str, str]]:
+    """운영 설정으로 후처리 파이프라인 실행 (섹션별 타입/텍스트, 예외는 "error" 섹션 1개로 기록)"""
+    try:
+        return post_process_sections(
+            ocr_response,
+            section_classification_config.section_classification_config,
+            post_process_config.post_process_config
+        )
+    except Exception as e:
+        return [{"type": "error", "text": f"{type(e).__name__}: {e}"}]
+
+
+# --- 코퍼스 입출력 ---
+
+def fixture_name(ocr_response: Dict) -> str:
+    """응답 내용 기준 이름 (같은 응답은 한 번만 저장)"""
+    raw = json.dumps(ocr_response, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()[:16]
+
+
+def save_fixture(corpus_dir: str, fixture: GoldenFixture) -> str:
+    os.makedirs(corpus_dir, exist_ok=True)
+    path = os.path.join(corpus_dir, f"{fixture.name}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"name": fixture.name, "ocr_response": fixture.ocr_response, "golden": fixture.golden},
+            f, ensure_ascii=False, indent=1
+        )
+    return path
+
+
+def load_fixtures(corpus_dir: str) -> List[GoldenFixture]:
+    if not os.path.isdir(corpus_dir):
+        return []
+    fixtures = []
+    for filename in sorted(os.listdir(corpus_dir)):
+        if not filename.endswith(".json"):
+            continue
+        with open(os.path.join(corpus_dir, filename), encoding="utf-8") as f:
+            data = json.load(f)
+        fixtures.append(GoldenFixture(data["name"], data["ocr_response"], data.get("golden", [])))
+    return fixtures
+
+
+def record_responses(corpus_dir: str, ocr_responses: List[Dict]) -> int:
+    """CLOVA 응답들을 현재 코드의 출력을 골든으로 하여 코퍼스에 추가 (이미 있는 응답은 건너뜀)"""
+    added = 0
+    for ocr_response in ocr_responses:
+        name = fixture_name(ocr_response)
+        if os.path.exists(os.path.join(corpus_dir, f"{name}.json")):
+            continue
+        save_fixture(corpus_dir, GoldenFixture(name, ocr_response, run_sections(ocr_response)))
+        added += 1
+    return added
+
+
+def record_from_cache(corpus_dir: str, limit: Optional[int] = None) -> int:
+    """OCR 결과 캐시(SQLite)에 저장된 원본 CLOVA 응답을 코퍼스로 수집"""
+    from app.board.infra.ocr.ocr_result_cache import OCRResultCache
+
+    cache = OCRResultCache()
+    try:
+        return record_responses(corpus_dir, [ocr_response for _, ocr_response in cache.iter_responses(limit)])
+    finally:
+        cache.close()
+
+
+def record_from_images(corpus_dir: str, image_sources: List[str]) -> int:
+    """이미지 파일 경로/URL을 CLOVA로 OCR하여 코퍼스로 수집"""
+    from ..call_clova import call_clova_ocr
+
+    return record_responses(corpus_dir, [call_clova_ocr(image_source) for image_source in image_sources])
+
+
+def record_synthetic(corpus_dir: str) -> int:
+    """합성 레이아웃을 코퍼스로 수집 (저장소에 포함하는 기본 코퍼스 생성용)"""
+    from .synthetic_layouts import make_layout
+
+    return record_responses(corpus_dir, [make_layout(kind, count, seed) for kind, count, seed in SYNTHETIC_FIXTURES])
+
+
+def update_golden(corpus_dir: str) -> int:
+    """현재 코드의 출력으로 모든 항목의 골든 결과 갱신, 변경된 항목 수 반환"""
+    changed = 0
+    for fixture in load_fixtures(corpus_dir):
+        sections = run_sections(fixture.ocr_response)
+        if sections != fixture.golden:
+            fixture.golden = sections
+            save_fixture(corpus_dir, fixture)
+            changed += 1
+    return changed
+
+
+# --- 재실행 ---
+
+def replay(fixtures: List[GoldenFixture], repeat: int = 1, trace_memory: bool = False) -> ReplayReport:
+    """
+    코퍼스 재실행 - repeat회 반복하여 단계별 시간을 모으고, 첫 실행 결과를 골든과 비교
+
+    trace_memory가 True이면 tracemalloc을 켜고 단계별 할당량을 측정합니다 (시간 측정값은 느려짐).
+    """
+    report = ReplayReport(fixtures=len(fixtures), recorder=StageRecorder(trace_memory=trace_memory))
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        for fixture in fixtures:
+            for attempt in range(max(repeat, 1)):
+                started = time.perf_counter()
+                with recording(report.recorder):
+                    sections = run_sections(fixture.ocr_response)
+                report.total_ms.append((time.perf_counter() - started) * 1000)
+                if attempt == 0:
+                    report.diffs.extend(diff_sections(fixture.name, fixture.golden, sections))
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    return report
+
+
+def diff_sections(name: str, expected: List[Dict[str, str]], actual: List[Dict[str, str]]) -> List[SectionDiff]:
+    """섹션 타입/텍스트가 다른 섹션 목록 (섹션 수가 다르면 남는 쪽은 None과 비교)"""
+    diffs = []
+    for index in range(max(len(expected), len(actual))):
+        expected_section = expected[index] if index < len(expected) else None
+        actual_section = actual[index] if index < len(actual) else None
+        if expected_section != actual_section:
+            diffs.append(SectionDiff(name, index, expected_section, actual_section))
+    return diffs
+
+
+def format_report(report: ReplayReport, max_diffs: int = 20) -> str:
+    lines = [f"fixtures: {report.fixtures}, runs: {len(report.total_ms)}", ""]
+    lines.append(f"{'stage':<13} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9} {'peak KB':>9}")
+
+    timings = dict(report.recorder.timings_ms)
+    timings["total"] = report.total_ms
+    for name in STAGES + ("total",):
+        samples = timings.get(name)
+        if not samples:
+            continue
+        p50, p95, p99 = np.percentile(samples, [50, 95, 99])
+        peaks = report.recorder.peak_bytes.get(name)
+        peak = f"{np.mean(peaks) / 1024:>9.1f}" if peaks else f"{'-':>9}"
+        lines.append(f"{name:<13} {p50:>9.2f} {p95:>9.2f} {p99:>9.2f} {max(samples):>9.2f} {peak}")
+
+    lines.append("")
+    if not report.diffs:
+        lines.append("골든 결과와 동일")
+        return "\n".join(lines)
+
+    changed = len({diff.fixture for diff in report.diffs})
+    lines.append(f"골든 결과와 다름: {changed}개 항목, {len(report.diffs)}개 섹션")
+    for diff in report.diffs[:max_diffs]:
+        expected_type = diff.expected["type"] if diff.expected else None
+        actual_type = diff.actual["type"] if diff.actual else None
+        kind = f"type {expected_type} → {actual_type}" if expected_type != actual_type else "text"
+        lines.append(f"- {diff.fixture} #{diff.index}: {kind}")
+        if diff.expected and diff.actual and expected_type == actual_type:
+            lines.append(f"    expected: {diff.expected['text'][:120]!r}")
+            lines.append(f"    actual:   {diff.actual['text'][:120]!r}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="OCR 후처리 골든 코퍼스 벤치마크")
+    parser.add_argument("--corpus", default=OCR_GOLDEN_DIR, help="코퍼스 디렉터리")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = commands.add_parser("record", help="CLOVA 응답을 코퍼스로 수집")
+    record_parser.add_argument("images", nargs="*", help="OCR할 이미지 파일 경로/URL")
+    record_parser.add_argument("--from-cache", action="store_true", help="OCR 결과 캐시에서 수집")
+    record_parser.add_argument("--synthetic", action="store_true", help="합성 레이아웃으로 수집")
+    record_parser.add_argument("--limit", type=int, default=None)
+
+    replay_parser = commands.add_parser("replay", help="코퍼스 재실행 및 골든 비교")
+    replay_parser.add_argument("--repeat", type=int, default=3, help="항목별 반복 횟수 (시간 백분위수용)")
+    replay_parser.add_argument("--memory", action="store_true", help="tracemalloc으로 단계별 할당량 측정")
+
+    commands.add_parser("update", help="현재 출력으로 골든 결과 갱신")
+
+    args = parser.parse_args(argv)
+    logging.disable(logging.WARNING)  # 파이프라인 단계 로그(과분할 경고 등)가 보고서와 측정 시간에 섞이지 않도록
+
+    if args.command == "record":
+        if args.from_cache:
+            added = record_from_cache(args.corpus, args.limit)
+        elif args.synthetic:
+            added = record_synthetic(args.corpus)
+        elif args.images:
+            added = record_from_images(args.corpus, args.images)
+        else:
+            parser.error("record: 이미지 경로, --from-cache 또는 --synthetic이 필요합니다")
+        print(f"{added}개 항목 추가 → {args.corpus}")
+        return 0
+
+    if args.command == "update":
+        print(f"{update_golden(args.corpus)}개 항목 골든 결과 갱신")
+        return 0
+
+    fixtures = load_fixtures(args.corpus)
+    if not fixtures:
+        print(f"코퍼스가 비어 있습니다: {args.corpus}")
+        return 1
+    report = replay(fixtures, repeat=args.repeat, trace_memory=args.memory)
+    print(format_report(report))
+    return 1 if report.diffs else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""
+OCR 출력 형식별 LLM 입력 토큰 수 비교
+
+골든 코퍼스(또는 합성 레이아웃)의 포스터마다 후처리 결과를 legacy / compact 형식으로 직렬화하여
+추정 토큰 수와 절감률을 보고합니다. (토큰 수는 output_format.estimate_tokens 기준)
+
+사용법:
+    python -m app.board.infra.ocr.ocr_pipeline.benchmark.output_tokens [--corpus DIR] [--synthetic table mixed ...]
+"""
+import argparse
+import logging
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from ..config import section_classification_config, post_process_config
+from ..post_process_pipeline import post_process_structured
+from ..output_format import OUTPUT_FORMATS, estimate_tokens, serialize_sections
+from .golden_corpus import OCR_GOLDEN_DIR, load_fixtures
+from .synthetic_layouts import make_layout
+
+
+def count_tokens(ocr_response: Dict) -> Dict[str, int]:
+    """출력 형식별 추정 토큰 수"""
+    sections = post_process_structured(
+        ocr_response,
+        section_classification_config.section_classification_config,
+        post_process_config.post_process_config
+    )
+    return {output_format: estimate_tokens(serialize_sections(sections, output_format)) for output_format in OUTPUT_FORMATS}
+
+
+def format_report(rows: List[Tuple[str, Dict[str, int]]]) -> str:
+    lines = [f"{'poster':<24} {'legacy':>8} {'compact':>8} {'saved':>7}"]
+    for name, counts in rows + [("total", {
+        output_format: sum(counts[output_format] for _, counts in rows) for output_format in OUTPUT_FORMATS
+    })]:
+        legacy, compact = counts["legacy"], counts["compact"]
+        saved = f"{(legacy - compact) / legacy * 100:>6.1f}%" if legacy else f"{'-':>7}"
+        lines.append(f"{name:<24} {legacy:>8} {compact:>8} {saved}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="OCR 출력 형식별 토큰 수 비교")
+    parser.add_argument("--corpus", default=OCR_GOLDEN_DIR, help="골든 코퍼스 디렉터리")
+    parser.add_argument("--synthetic", nargs="*", default=None,
+                        help="코퍼스 대신 합성 레이아웃 사용 (table, column, timeline, noise, mixed)")
+    parser.add_argument("--blocks", type=int, default=200, help="합성 레이아웃 블록 수")
+    args = parser.parse_args(argv)
+    logging.disable(logging.WARNING)
+
+    if args.synthetic is not None:
+        kinds = args.synthetic or ["table", "column", "timeline", "noise", "mixed"]
+        responses = [(f"synthetic_{kind}", make_layout(kind, args.blocks)) for kind in kinds]
+    else:
+        responses = [(fixture.name, fixture.ocr_response) for fixture in load_fixtures(args.corpus)]
+    if not responses:
+        print(f"코퍼스가 비어 있습니다: {args.corpus} (--synthetic으로 합성 레이아웃 사용 가능)")
+        return 1
+
+    print(format_report([(name, count_tokens(ocr_response)) for name, ocr_response in responses]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
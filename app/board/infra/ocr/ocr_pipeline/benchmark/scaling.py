@@ -0,0 +1,302 @@
+"""
+레이아웃 알고리즘 스케일링 마이크로 벤치마크
+
+합성 레이아웃(표/다단/일정표/노이즈/혼합)을 블록 수별(기본 50 ~ 10,000개)로 만들어 각 단계 함수를 측정하고,
+log(시간) - log(블록 수) 회귀 기울기로 경험적 복잡도를 보고합니다. (기울기 ≈ 1: 선형, ≈ 2: 이차)
+이차 회귀가 운영에 나가기 전에 드러나도록 --max-slope를 넘는 단계가 있으면 종료 코드 1을 반환합니다.
+
+--legacy는 기존 줄 단위 선형 탐색(O(n·줄 수)) 정렬/줄 그룹핑과 sweep-line 구현을 비교합니다
+(결과가 같은지 확인하고 블록 수별 시간 보고, 결과가 다르면 종료 코드 1).
+
+사용법:
+    python -m app.board.infra.ocr.ocr_pipeline.benchmark.scaling [--kinds table column ...] [--sizes 50 100 ...]
+    python -m app.board.infra.ocr.ocr_pipeline.benchmark.scaling --legacy [--sizes 250 500 ...]
+"""
+import argparse
+import logging
+import math
+import random
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..config import section_classification_config, post_process_config
+from ..config.block_sort_config import block_sort_config
+from ..layout_analysis.block_extractor import extract_blocks_from_ocr_response
+from ..layout_analysis.block_set import BlockSet
+from ..layout_analysis.sorted_block import sort_blocks
+from ..layout_analysis.split_sections import (
+    calculate_adaptive_y_threshold, group_blocks_into_lines, split_sections_by_y_gap
+)
+from ..layout_analysis.merge_sections.merge_table_like_sections import merge_table_like_sections
+from ..layout_analysis.merge_sections.merge_column_like_sections import merge_column_like_sections
+from ..classifier.table.table_classifier import score_table_section
+from ..classifier.table.group_rows_by_y import group_rows_by_y
+from ..classifier.column.column_classifier import score_column_section
+from ..post_process.table.align_blocks_to_columns import align_blocks_to_columns
+from .synthetic_layouts import LAYOUT_KINDS, make_layout
+
+DEFAULT_SIZES = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+DEFAULT_KINDS = tuple(LAYOUT_KINDS) + ("mixed",)
+DEFAULT_LEGACY_SIZES = (250, 500, 1000, 2000, 4000)
+# 기울기 계산에서 제외할 작은 입력 (고정 오버헤드가 지배적인 구간)
+SLOPE_MIN_SIZE = 250
+# 기울기 계산에서 제외할 짧은 측정값 (타이머 해상도/잡음 구간)
+SLOPE_MIN_SECONDS = 0.0005
+
+
+def _prepare_sorted(blocks: BlockSet) -> BlockSet:
+    return sort_blocks(blocks)
+
+
+def _prepare_sections(blocks: BlockSet) -> List[BlockSet]:
+    sorted_blocks = sort_blocks(blocks)
+    return split_sections_by_y_gap(sorted_blocks, calculate_adaptive_y_threshold(sorted_blocks))
+
+
+def _bench_group_lines(blocks: BlockSet) -> Callable[[], object]:
+    sorted_blocks = _prepare_sorted(blocks)
+    y_tolerance = max(int(calculate_adaptive_y_threshold(sorted_blocks) * 0.51), 10)
+    return lambda: group_blocks_into_lines(sorted_blocks, y_tolerance)
+
+
+def _bench_split(blocks: BlockSet) -> Callable[[], object]:
+    sorted_blocks = _prepare_sorted(blocks)
+    y_threshold = calculate_adaptive_y_threshold(sorted_blocks)
+    return lambda: split_sections_by_y_gap(sorted_blocks, y_threshold)
+
+
+def _bench_merge_table(blocks: BlockSet) -> Callable[[], object]:
+    sections = _prepare_sections(blocks)
+    return lambda: merge_table_like_sections(sections)
+
+
+def _bench_merge_column(blocks: BlockSet) -> Callable[[], object]:
+    sections = _prepare_sections(blocks)
+    return lambda: merge_column_like_sections(sections)
+
+
+def _bench_align(blocks: BlockSet) -> Callable[[], object]:
+    # table_post_process와 같은 임계값
+    avg_height = blocks.h.sum() / max(len(blocks), 1)
+    y_tolerance = min(max(int(avg_height * 0.8), 6), 20)
+    x_tolerance = min(max(int(avg_height * 2.0), 25), 70)
+    std_threshold = min(max(int(avg_height * 0.4), 3), 20)
+    rows = group_rows_by_y(blocks, y_tolerance)
+    max_iterations = post_process_config.post_process_config["table"]["max_iterations"]
+    return lambda: align_blocks_to_columns(rows, x_tolerance, std_threshold, max_iterations)
+
+
+_CLASSIFIER = section_classification_config.section_classification_config
+
+# 단계 이름 → (블록 → 측정할 호출) - 준비 작업(정렬/분리 등)은 측정에서 제외
+BENCHMARKS: Dict[str, Callable[[BlockSet], Callable[[], object]]] = {
+    "sort_blocks": lambda blocks: (lambda: sort_blocks(blocks)),
+    "group_blocks_into_lines": _bench_group_lines,
+    "split_sections_by_y_gap": _bench_split,
+    "merge_table_like_sections": _bench_merge_table,
+    "merge_column_like_sections": _bench_merge_column,
+    "score_table_section": lambda blocks: (lambda: score_table_section(blocks, **_CLASSIFIER["table"])),
+    "score_column_section": lambda blocks: (lambda: score_column_section(blocks, **_CLASSIFIER["column"])),
+    "align_blocks_to_columns": _bench_align,
+}
+
+
+def measure(benchmark: Callable[[BlockSet], Callable[[], object]],
+            ocr_response: Dict,
+            min_runs: int = 3,
+            max_runs: int = 50,
+            min_seconds: float = 0.2) -> float:
+    """
+    최소 실행 시간(초) - 실행마다 블록을 새로 추출하여 view별 캐시(섹션 통계, 정렬 인덱스 등)가 재사용되지 않게 함
+
+    반복은 준비 작업을 포함한 경과 시간이 min_seconds를 넘거나 max_runs회에 이르면 멈춥니다.
+    """
+    best = math.inf
+    runs = 0
+    wall_started = time.perf_counter()
+    while runs < min_runs or (runs < max_runs and time.perf_counter() - wall_started < min_seconds):
+        call = benchmark(extract_blocks_from_ocr_response(ocr_response))
+        started = time.perf_counter()
+        call()
+        best = min(best, time.perf_counter() - started)
+        runs += 1
+    return best
+
+
+def loglog_slope(sizes: List[int],
+                 seconds: List[float],
+                 min_size: int = SLOPE_MIN_SIZE,
+                 min_seconds: float = SLOPE_MIN_SECONDS) -> Optional[float]:
+    """log(시간) = a·log(블록 수) + b 의 기울기 a (점이 2개 미만이면 None)"""
+    points = [
+        (size, elapsed) for size, elapsed in zip(sizes, seconds)
+        if size >= min_size and elapsed >= min_seconds
+    ]
+    if len(points) < 2:
+        return None
+    xs, ys = zip(*points)
+    return float(np.polyfit(np.log(xs), np.log(ys), 1)[0])
+
+
+def run(kinds: List[str],
+        sizes: List[int],
+        benchmarks: List[str],
+        max_seconds: float,
+        seed: int = 0) -> List[Tuple[str, str, List[int], List[float], Optional[float]]]:
+    """
+    (레이아웃 종류, 단계, 측정한 블록 수, 최소 시간(초), 기울기) 목록
+
+    한 번 실행이 max_seconds를 넘으면 그 단계의 더 큰 입력은 건너뜁니다.
+    """
+    results = []
+    responses = {(kind, size): make_layout(kind, size, seed) for kind in kinds for size in sizes}
+    for kind in kinds:
+        for name in benchmarks:
+            measured_sizes, seconds = [], []
+            for size in sizes:
+                elapsed = measure(BENCHMARKS[name], responses[(kind, size)])
+                measured_sizes.append(size)
+                seconds.append(elapsed)
+                if elapsed > max_seconds:
+                    break
+            results.append((kind, name, measured_sizes, seconds, loglog_slope(measured_sizes, seconds)))
+    return results
+
+
+# --- 기존 구현과 비교 (--legacy) ---
+
+def _legacy_sort_blocks(blocks: List[Dict], config: Dict = block_sort_config) -> List[Dict]:
+    """sweep-line 도입 전 sort_blocks - 블록마다 모든 줄의 최소/최대 y를 다시 계산"""
+    margin = config.get("y_overlap_margin", 5)
+    margin_ratio = config.get("dynamic_margin_ratio", 0.5)
+    lines: List[List[Dict]] = []
+    for block in sorted(blocks, key=lambda b: b["y"]):
+        y1 = block["y"]
+        y2 = y1 + block.get("h", 0)
+        for line in lines:
+            line_min = min(b["y"] for b in line)
+            line_max = max(b["y"] + b["h"] for b in line)
+            dynamic_margin = max(margin, (line_max - line_min) * margin_ratio)
+            if y2 >= line_min - dynamic_margin and y1 <= line_max + dynamic_margin:
+                line.append(block)
+                break
+        else:
+            lines.append([block])
+    return [b for line in lines for b in sorted(line, key=lambda b: b["x"])]
+
+
+def _legacy_group_blocks_into_lines(blocks: List[Dict], y_tolerance: int) -> List[List[Dict]]:
+    """sweep-line 도입 전 group_blocks_into_lines - 블록마다 모든 줄의 중심 평균을 다시 계산"""
+    lines: List[List[Dict]] = []
+    for block in sorted(blocks, key=lambda b: b["y"] + b.get("h", 0) // 2):
+        cy = block["y"] + block.get("h", 0) // 2
+        for line in lines:
+            if abs(cy - np.mean([b["y"] + b.get("h", 0) // 2 for b in line])) <= y_tolerance:
+                line.append(block)
+                break
+        else:
+            lines.append([block])
+    return [sorted(line, key=lambda b: b["x"]) for line in lines]
+
+
+def _line_blocks(count: int, seed: int = 0) -> List[Dict]:
+    """한 줄에 8개씩 놓인 블록을 섞은 목록 (블록 텍스트 = 생성 순번)"""
+    rng = random.Random(seed)
+    blocks = []
+    per_line = 8
+    for i in range(count):
+        line, col = divmod(i, per_line)
+        blocks.append({
+            "x": col * 120 + rng.randint(0, 10),
+            "y": line * 28 + rng.randint(-3, 3),
+            "w": rng.randint(40, 110),
+            "h": rng.randint(16, 24),
+            "text": str(i),
+        })
+    rng.shuffle(blocks)
+    return blocks
+
+
+def _timed(function: Callable, *args) -> Tuple[object, float]:
+    started = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - started
+
+
+def compare_legacy(sizes: List[int], seed: int = 0, y_tolerance: int = 12) -> List[Tuple[int, float, float, float, float, bool]]:
+    """(블록 수, 기존 정렬, sweep 정렬, 기존 줄 그룹핑, sweep 줄 그룹핑 시간(초), 결과 동일 여부) 목록"""
+    rows = []
+    for count in sizes:
+        blocks = _line_blocks(count, seed)
+        legacy_sorted, legacy_sort_time = _timed(_legacy_sort_blocks, blocks)
+        new_sorted, sort_time = _timed(sort_blocks, blocks)
+        legacy_lines, legacy_line_time = _timed(_legacy_group_blocks_into_lines, blocks, y_tolerance)
+        new_lines, line_time = _timed(group_blocks_into_lines, blocks, y_tolerance)
+        same = (
+            [b["text"] for b in legacy_sorted] == list(new_sorted.text)
+            and [[b["text"] for b in line] for line in legacy_lines] == [list(line.text) for line in new_lines]
+        )
+        rows.append((count, legacy_sort_time, sort_time, legacy_line_time, line_time, same))
+    return rows
+
+
+def _main_legacy(sizes: List[int], seed: int) -> int:
+    print(f"{'blocks':>7} | {'sort legacy':>11} {'sweep':>8} | {'lines legacy':>12} {'sweep':>8} | same")
+    different = []
+    for count, legacy_sort, sweep_sort, legacy_lines, sweep_lines, same in compare_legacy(sizes, seed):
+        print(f"{count:>7} | {legacy_sort * 1000:>9.1f}ms {sweep_sort * 1000:>6.1f}ms | "
+              f"{legacy_lines * 1000:>10.1f}ms {sweep_lines * 1000:>6.1f}ms | {'yes' if same else 'NO'}")
+        if not same:
+            different.append(count)
+    if different:
+        print(f"\n기존 구현과 결과가 다름: 블록 수 {different}")
+        return 1
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="레이아웃 알고리즘 스케일링 벤치마크")
+    parser.add_argument("--kinds", nargs="+", default=list(DEFAULT_KINDS), choices=list(DEFAULT_KINDS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=None,
+                        help=f"블록 수 (기본 {list(DEFAULT_SIZES)}, --legacy는 {list(DEFAULT_LEGACY_SIZES)})")
+    parser.add_argument("--benchmarks", nargs="+", default=list(BENCHMARKS), choices=list(BENCHMARKS))
+    parser.add_argument("--max-slope", type=float, default=1.8,
+                        help="이 기울기를 넘으면 이차 회귀로 보고 (n log n 단계는 구간에 따라 1.5 안팎)")
+    parser.add_argument("--max-seconds", type=float, default=5.0, help="1회 실행이 이 시간을 넘으면 더 큰 입력 생략")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--legacy", action="store_true", help="기존 정렬/줄 그룹핑 구현과 sweep-line 구현 비교")
+    args = parser.parse_args(argv)
+    logging.disable(logging.WARNING)  # 단계 로그가 측정 시간에 섞이지 않도록
+
+    if args.legacy:
+        return _main_legacy(sorted(args.sizes or DEFAULT_LEGACY_SIZES), args.seed)
+
+    sizes = sorted(args.sizes or DEFAULT_SIZES)
+    results = run(args.kinds, sizes, args.benchmarks, args.max_seconds, args.seed)
+
+    header = f"{'kind':<9} {'stage':<27}" + "".join(f"{size:>9}" for size in sizes) + f"{'slope':>8}"
+    print(header)
+    print("-" * len(header))
+    regressions = []
+    for kind, name, measured_sizes, seconds, slope in results:
+        cells = [f"{elapsed * 1000:>7.1f}ms" for elapsed in seconds] + [f"{'-':>9}"] * (len(sizes) - len(seconds))
+        flag = ""
+        if slope is not None and slope > args.max_slope:
+            flag = " !"
+            regressions.append((kind, name, slope))
+        slope_text = f"{slope:>8.2f}" if slope is not None else f"{'-':>8}"
+        print(f"{kind:<9} {name:<27}" + "".join(cells) + slope_text + flag)
+
+    if regressions:
+        print()
+        for kind, name, slope in regressions:
+            print(f"초선형 증가 감지: {kind}/{name} (기울기 {slope:.2f} > {args.max_slope})")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+import random
+from typing import Callable, Dict, List, Tuple
+
+# 합성 텍스트 (블록 내용은 레이아웃 알고리즘 성능과 무관하므로 짧은 단어만 사용)
+_WORDS = ("공지", "안내", "신청", "기간", "장소", "대상", "2025.03.02", "09:00", "학생회관",
+          "특강", "세미나", "모집", "문의", "02-123-4567", "참가비", "무료", "선착순")
+
+# 레이아웃 종류별 기본 이미지 너비
+_IMAGE_WIDTH = 1200
+
+
+def _field(x: float, y: float, w: float, h: float, text: str, line_break: bool) -> Dict:
+    """CLOVA General OCR 응답 필드 형식"""
+    return {
+        "inferText": text,
+        "lineBreak": line_break,
+        "boundingPoly": {"vertices": [
+            {"x": x, "y": y}, {"x": x + w, "y": y}, {"x": x + w, "y": y + h}, {"x": x, "y": y + h},
+        ]},
+    }
+
+
+def _dense_table(rng: random.Random, count: int) -> Tuple[List[Dict], int]:
+    """열 수 4~8, 정렬 방식(왼쪽/가운데/오른쪽)이 일정한 촘촘한 표"""
+    columns = rng.randint(4, 8)
+    column_width = (_IMAGE_WIDTH - 40) // columns
+    alignment = rng.choice("lcr")
+    line_height = rng.randint(14, 24)
+    fields, y = [], 20
+    while len(fields) < count:
+        for column in range(columns):
+            if len(fields) >= count:
+                break
+            width = rng.randint(20, column_width - 10)
+            base = 20 + column * column_width
+            x = {"l": base, "c": base + (column_width - width) // 2, "r": base + column_width - width}[alignment]
+            fields.append(_field(x + rng.randint(-3, 3), y + rng.randint(-2, 2), width, line_height,
+                                 rng.choice(_WORDS), column == columns - 1))
+        y += line_height + rng.randint(6, 14)
+    return fields, y
+
+
+def _multi_column(rng: random.Random, count: int) -> Tuple[List[Dict], int]:
+    """2~3단 전단지 - 단마다 짧은 줄이 세로로 이어짐"""
+    columns = rng.randint(2, 3)
+    column_width = (_IMAGE_WIDTH - 40) // columns
+    line_height = rng.randint(14, 28)
+    per_column = -(-count // columns)
+    fields, bottom = [], 20
+    for column in range(columns):
+        y = 20
+        placed = 0
+        while placed < per_column and len(fields) < count:
+            x = 20 + column * column_width + rng.randint(0, 10)
+            for word in range(rng.randint(1, 3)):
+                if placed >= per_column or len(fields) >= count:
+                    break
+                width = rng.randint(20, column_width // 3)
+                fields.append(_field(x, y, width, line_height, rng.choice(_WORDS), False))
+                x += width + 8
+                placed += 1
+            y += line_height + rng.randint(4, 12)
+        bottom = max(bottom, y)
+    return fields, bottom
+
+
+def _timeline(rng: random.Random, count: int) -> Tuple[List[Dict], int]:
+    """왼쪽 날짜 + 오른쪽 설명 문장이 반복되는 일정표"""
+    line_height = rng.randint(14, 24)
+    fields, y = [], 20
+    while len(fields) < count:
+        fields.append(_field(30, y, 110, line_height, f"{rng.randint(1, 12)}.{rng.randint(1, 28)}", False))
+        x = 180
+        for word in range(rng.randint(1, 6)):
+            if len(fields) >= count:
+                break
+            width = rng.randint(30, 140)
+            fields.append(_field(x, y + rng.randint(-2, 2), width, line_height, rng.choice(_WORDS), word == 5))
+            x += width + rng.randint(5, 15)
+        y += line_height + rng.randint(10, 30)
+    return fields, y
+
+
+def _noise(rng: random.Random, count: int) -> Tuple[List[Dict], int]:
+    """크기/위치가 불규칙한 블록 (배경 장식, 오인식 조각)"""
+    height = max(400, count * 6)
+    fields = [
+        _field(rng.randint(0, _IMAGE_WIDTH - 60), rng.randint(0, height), rng.randint(5, 200), rng.randint(3, 90),
+               rng.choice(_WORDS), rng.random() < 0.3)
+        for _ in range(count)
+    ]
+    return fields, height + 100
+
+
+LAYOUT_KINDS: Dict[str, Callable[[random.Random, int], Tuple[List[Dict], int]]] = {
+    "table": _dense_table,
+    "column": _multi_column,
+    "timeline": _timeline,
+    "noise": _noise,
+}
+
+
+def make_layout(kind: str, count: int, seed: int = 0) -> Dict:
+    """
+    블록 수가 count개인 합성 레이아웃을 CLOVA OCR 응답 형식으로 생성
+
+    kind: "table" | "column" | "timeline" | "noise" | "mixed" (여러 종류를 세로로 이어붙인 포스터)
+    """
+    rng = random.Random(seed)
+    if kind == "mixed":
+        fields, offset = [], 0
+        kinds = list(LAYOUT_KINDS)
+        remaining = count
+        while remaining > 0:
+            size = min(remaining, rng.randint(20, max(20, count // 4)))
+            part, height = LAYOUT_KINDS[rng.choice(kinds)](rng, size)
+            for part_field in part:
+                for vertex in part_field["boundingPoly"]["vertices"]:
+                    vertex["y"] += offset
+            fields.extend(part)
+            offset += height + rng.randint(40, 120)
+            remaining -= size
+        height = offset
+    else:
+        fields, height = LAYOUT_KINDS[kind](rng, count)
+
+    return {
+        "version": "V2",
+        "images": [{
+            "name": f"synthetic_{kind}_{count}",
+            "fields": fields,
+            "convertedImageInfo": {"width": _IMAGE_WIDTH, "height": max(height, 100)},
+        }],
+    }
@@ -0,0 +1,196 @@
+"""
+OCR 전 텍스트 가능성 검사(text_likelihood) 오프라인 평가
+
+보관된 이미지 파일마다 검사 결과와 정답(텍스트 포함 여부)을 비교하여
+절약한 CLOVA 호출 수와 놓친 텍스트 이미지 수를 보고합니다.
+
+정답 지정 방법:
+    --labels labels.json   {"파일명": true/false 또는 OCR 텍스트, ...}
+    --from-cache           OCR 결과 캐시(SQLite)에 같은 이미지(SHA-256)의 OCR 텍스트가 있으면 그 텍스트로 판정
+
+사용법:
+    python -m app.board.infra.ocr.ocr_pipeline.benchmark.text_gate_eval IMAGE_DIR (--labels FILE | --from-cache) [--sweep]
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from ..preprocess.text_likelihood import OCR_GATE_MIN_EDGE_DENSITY, TextLikelihood, assess_text_likelihood
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp", ".tif", ".tiff")
+# 에지 밀도 하한 탐색 값 (--sweep)
+SWEEP_EDGE_DENSITIES = (0.0, 0.005, 0.01, 0.015, 0.02, 0.03, 0.05, 0.08)
+
+
+@dataclass
+class GateSample:
+    """평가 이미지 1개 - 정답과 검사 결과"""
+    name: str
+    has_text: bool
+    result: TextLikelihood
+    elapsed_ms: float
+
+
+@dataclass
+class GateReport:
+    samples: List[GateSample] = field(default_factory=list)
+    unlabeled: int = 0
+
+    @property
+    def skipped(self) -> List[GateSample]:
+        return [sample for sample in self.samples if not sample.result.likely]
+
+    @property
+    def missed(self) -> List[GateSample]:
+        """텍스트가 있는데 건너뛴 이미지"""
+        return [sample for sample in self.skipped if sample.has_text]
+
+
+def is_text(label, min_chars: int) -> bool:
+    """라벨(bool 또는 OCR 텍스트) → 텍스트 포함 여부"""
+    if isinstance(label, str):
+        return len("".join(label.split())) >= min_chars
+    return bool(label)
+
+
+def load_labels(image_dir: str, labels_path: Optional[str], from_cache: bool) -> Dict[str, object]:
+    """파일명 → 라벨 (라벨 파일 우선, 없으면 OCR 캐시의 텍스트)"""
+    labels: Dict[str, object] = {}
+    if labels_path:
+        with open(labels_path, encoding="utf-8") as f:
+            labels.update(json.load(f))
+    if from_cache:
+        from app.board.infra.ocr.ocr_result_cache import OCRResultCache
+
+        cache = OCRResultCache()
+        try:
+            for name in _image_files(image_dir):
+                if name in labels:
+                    continue
+                with open(os.path.join(image_dir, name), "rb") as f:
+                    text = cache.peek_text(hashlib.sha256(f.read()).hexdigest())
+                if text is not None:
+                    labels[name] = text
+        finally:
+            cache.close()
+    return labels
+
+
+def _image_files(image_dir: str) -> List[str]:
+    return sorted(name for name in os.listdir(image_dir) if name.lower().endswith(IMAGE_EXTENSIONS))
+
+
+def evaluate(image_dir: str, labels: Dict[str, object], min_chars: int = 10, **thresholds) -> GateReport:
+    report = GateReport()
+    for name in _image_files(image_dir):
+        if name not in labels:
+            report.unlabeled += 1
+            continue
+        with open(os.path.join(image_dir, name), "rb") as f:
+            image_data = f.read()
+        started = time.perf_counter()
+        result = assess_text_likelihood(image_data, **thresholds)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        report.samples.append(GateSample(name, is_text(labels[name], min_chars), result, elapsed_ms))
+    return report
+
+
+def sweep_edge_density(report: GateReport) -> List[Tuple[float, int, int]]:
+    """
+    에지 밀도 하한별 (하한, 건너뛴 수, 놓친 텍스트 수)
+
+    에지 밀도 이전 단계(크기/비율/대비)에서 걸러진 이미지는 하한과 관계없이 건너뛴 것으로 셉니다.
+    """
+    rows = []
+    for threshold in SWEEP_EDGE_DENSITIES:
+        skipped = missed = 0
+        for sample in report.samples:
+            result = sample.result
+            if result.reason in (None, "low_edge_density"):
+                skip = result.edge_density is not None and result.edge_density < threshold
+            else:
+                skip = True
+            if skip:
+                skipped += 1
+                missed += sample.has_text
+        rows.append((threshold, skipped, missed))
+    return rows
+
+
+def format_report(report: GateReport, sweep: bool = False, max_missed: int = 20) -> str:
+    total = len(report.samples)
+    with_text = sum(sample.has_text for sample in report.samples)
+    skipped, missed = report.skipped, report.missed
+    lines = [
+        f"images: {total} (text {with_text}, no text {total - with_text}, unlabeled {report.unlabeled})",
+        f"calls saved: {len(skipped)} ({len(skipped) / max(total, 1) * 100:.1f}%)",
+        f"text missed: {len(missed)} ({len(missed) / max(with_text, 1) * 100:.1f}% of text images)",
+        f"correctly skipped: {len(skipped) - len(missed)} of {total - with_text} no-text images",
+    ]
+    if report.samples:
+        lines.append(f"avg check: {sum(sample.elapsed_ms for sample in report.samples) / total:.2f} ms")
+
+    reasons: Dict[str, List[int]] = {}
+    for sample in skipped:
+        counts = reasons.setdefault(sample.result.reason, [0, 0])
+        counts[0] += 1
+        counts[1] += sample.has_text
+    if reasons:
+        lines.append("")
+        lines.append(f"{'reason':<18} {'skipped':>8} {'missed':>7}")
+        for reason, (count, reason_missed) in sorted(reasons.items()):
+            lines.append(f"{reason:<18} {count:>8} {reason_missed:>7}")
+
+    if sweep:
+        lines.append("")
+        lines.append(f"{'min_edge_density':<18} {'skipped':>8} {'missed':>7}")
+        for threshold, count, threshold_missed in sweep_edge_density(report):
+            marker = " *" if threshold == OCR_GATE_MIN_EDGE_DENSITY else ""
+            lines.append(f"{threshold:<18} {count:>8} {threshold_missed:>7}{marker}")
+
+    if missed:
+        lines.append("")
+        lines.append("놓친 텍스트 이미지:")
+        for sample in missed[:max_missed]:
+            result = sample.result
+            lines.append(
+                f"- {sample.name}: {result.reason} ({result.width}x{result.height}, {result.byte_size} bytes, "
+                f"edge={result.edge_density}, contrast={result.contrast})"
+            )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="OCR 전 텍스트 가능성 검사 오프라인 평가")
+    parser.add_argument("image_dir", help="보관된 이미지 디렉터리")
+    parser.add_argument("--labels", help="파일명 → true/false 또는 OCR 텍스트 JSON")
+    parser.add_argument("--from-cache", action="store_true", help="OCR 결과 캐시의 텍스트로 정답 판정")
+    parser.add_argument("--min-chars", type=int, default=10, help="텍스트 라벨이 이 글자 수(공백 제외) 이상이면 텍스트 포함")
+    parser.add_argument("--sweep", action="store_true", help="에지 밀도 하한별 절약/누락 표 출력")
+    args = parser.parse_args(argv)
+    logging.disable(logging.WARNING)
+
+    if not args.labels and not args.from_cache:
+        parser.error("--labels 또는 --from-cache가 필요합니다")
+
+    labels = load_labels(args.image_dir, args.labels, args.from_cache)
+    # sweep은 에지 밀도 하한 0으로 평가한 결과에서 하한별로 다시 판정
+    thresholds = {"min_edge_density": 0.0} if args.sweep else {}
+    report = evaluate(args.image_dir, labels, args.min_chars, **thresholds)
+    if args.sweep:
+        for sample in report.samples:
+            if sample.result.likely and sample.result.edge_density is not None \
+                    and sample.result.edge_density < OCR_GATE_MIN_EDGE_DENSITY:
+                sample.result.likely, sample.result.reason = False, "low_edge_density"
+    print(format_report(report, sweep=args.sweep))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
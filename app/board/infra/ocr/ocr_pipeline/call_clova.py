@@ -1,14 +1,10 @@
 import requests
-import base64
-import os
-import json
-import uuid
-import time
-from typing import List, Dict
-from tempfile import NamedTemporaryFile
+from typing import Dict
 import logging
 
-from .config.env import CLOVA_OCR_URL, CLOVA_SECRET_KEY 
+from .config.env import CLOVA_OCR_URL, CLOVA_SECRET_KEY, CLOVA_MAX_IMAGE_BYTES
+from .payload_builder import build_ocr_payload
+from .preprocess.image_preprocessor import preprocess_image, restore_ocr_coordinates
 
 logger = logging.getLogger(__name__)
 
@@ -18,53 +14,41 @@ def call_clova_ocr(image_source: str) -> Dict:
     """
     logger.info(f"OCR 요청 시작: {image_source}")
 
-    temp_file = None
-
     try:
-        # 1. 이미지가 URL인 경우 다운로드해서 메모리 임시파일로 저장
+        # 1. 이미지가 URL인 경우 메모리로 스트리밍 다운로드 (임시 파일 없음)
         if image_source.startswith("http://") or image_source.startswith("https://"):
-            response = requests.get(image_source)
-            response.raise_for_status()
-            temp_file = NamedTemporaryFile(delete=False, suffix=".jpg")
-            temp_file.write(response.content)
-            temp_file.flush()
-            image_path = temp_file.name
-            logger.debug(f"이미지 URL 다운로드 및 임시 저장 완료: {image_path}")
+            image_data = _download_image(image_source)
+            logger.debug(f"이미지 URL 다운로드 완료: {len(image_data)} bytes")
         else:
-            image_path = image_source
+            with open(image_source, "rb") as f:
+                image_data = f.read()
+            logger.debug("이미지 파일 읽기 완료")
 
-        # 2. 이미지 파일 읽기
-        with open(image_path, "rb") as f:
-            image_data = f.read()
-        logger.debug("이미지 파일 읽기 완료")
+        # 2. 포맷 판별 / 축소 / 재압축 / 메타데이터 제거
+        prepared = preprocess_image(image_data, fallback_format=image_source.split("?", 1)[0].split('.')[-1])
+        del image_data
 
-        # 3. Base64 인코딩
-        image_base64 = base64.b64encode(image_data).decode("utf-8")
-        logger.debug("이미지 base64 인코딩 완료")
+        # 3. Base64 인코딩 + JSON 본문 생성 (이미지 버퍼 중간 사본 없음)
+        body = build_ocr_payload(prepared.data, prepared.format)
+        logger.debug("OCR 요청 본문 생성 완료")
 
         # 4. CLOVA OCR API 요청
-        payload = {
-            "images": [{
-                "format": image_path.split('.')[-1],
-                "name": "ocr_test",
-                "data": image_base64
-            }],
-            "requestId": str(uuid.uuid4()),
-            "version": "V2",
-            "timestamp": int(time.time() * 1000)
-        }
-
         headers = {
             "Content-Type": "application/json",
             "X-OCR-SECRET": CLOVA_SECRET_KEY
         }
 
-        response = requests.post(CLOVA_OCR_URL, headers=headers, data=json.dumps(payload))
+        # requests는 bytearray를 스트림으로 취급하므로 bytes로 한 번 변환 후 원본 해제
+        payload = bytes(body)
+        del body
+        response = requests.post(CLOVA_OCR_URL, headers=headers, data=payload)
         response.raise_for_status()
         result = response.json()
 
         logger.info("OCR 요청 성공")
-        return result
+
+        # 5. 전처리 이미지 기준 좌표를 원본 기준으로 복원
+        return restore_ocr_coordinates(result, prepared)
 
     except requests.RequestException:
         logger.error("OCR 요청 실패", exc_info=True)
@@ -74,10 +58,19 @@ def call_clova_ocr(image_source: str) -> Dict:
         logger.exception("알 수 없는 오류 발생")
         raise
 
-    finally:
-        # URL에서 다운로드한 임시 파일 삭제
-        if temp_file is not None:
-            temp_file.close()
-            if os.path.exists(temp_file.name):
-                os.remove(temp_file.name)
-                logger.debug(f"임시 이미지 파일 삭제 완료: {temp_file.name}")
+
+def _download_image(image_url: str) -> bytearray:
+    """이미지를 청크 단위로 메모리에 다운로드 (최대 크기 초과 시 중단)"""
+    with requests.get(image_url, stream=True) as response:
+        response.raise_for_status()
+
+        content_length = response.headers.get("Content-Length")
+        if content_length is not None and int(content_length) > CLOVA_MAX_IMAGE_BYTES:
+            raise ValueError(f"이미지 크기 초과: {content_length} > {CLOVA_MAX_IMAGE_BYTES} bytes")
+
+        buffer = bytearray()
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            if len(buffer) + len(chunk) > CLOVA_MAX_IMAGE_BYTES:
+                raise ValueError(f"이미지 크기 초과: > {CLOVA_MAX_IMAGE_BYTES} bytes")
+            buffer += chunk
+        return buffer
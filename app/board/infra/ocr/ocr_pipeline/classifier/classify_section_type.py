@@ -1,19 +1,21 @@
 from .table.table_classifier import score_table_section
 from .column.column_classifier import score_column_section
 # from .timeline.timeline_classifier import score_timeline_section
-from typing import List, Dict
+from app.board.infra.ocr.ocr_pipeline.layout_analysis.block_set import BlockSet, as_block_set
+from typing import Dict, Sequence, Union
 import logging
 
 logger = logging.getLogger(__name__)
 
 #4. 각 섹션들의 타입 판별
 def classify_section_type(
-    section: List[Dict],
+    section: Union[BlockSet, Sequence[Dict]],
     config: Dict[str, Dict] = {},
     min_score_threshold: float = 0.25,
     min_score_gap: float = 0.05
     ) -> str:
     logger.debug("섹션 타입 판별 시작")
+    section = as_block_set(section)
 
     table_score = score_table_section(section, **config.get("table", {}))
     column_score = score_column_section(section, **config.get("column", {}))
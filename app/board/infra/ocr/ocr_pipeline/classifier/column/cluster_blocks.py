@@ -1,36 +1,28 @@
-from typing import List, Dict
+from typing import List, Dict, Sequence, Union
 import numpy as np
+from app.board.infra.ocr.ocr_pipeline.layout_analysis.block_set import BlockSet, as_block_set
+from app.board.infra.ocr.ocr_pipeline.layout_analysis.clustering_1d import gap_breaks
+from app.board.infra.ocr.ocr_pipeline.layout_analysis.spatial_index import order_by
 
 # 컬럼으로 판단된 섹션을 컬럼으로 분리
-def cluster_blocks_by_x(section: List[Dict], x_gap_threshold: float) -> List[List[Dict]]:
+def cluster_blocks_by_x(section: Union[BlockSet, Sequence[Dict]], x_gap_threshold: float) -> List[BlockSet]:
     """
     블록들을 x 중심 기준으로 IQR 기반 클러스터링하여 컬럼 후보로 나눔
     """
     if not section:
         return []
 
-    sorted_blocks = sorted(section, key=lambda b: b["x"] + b["w"] // 2)
-    centers = [b["x"] + b["w"] // 2 for b in sorted_blocks]
+    section = as_block_set(section)
+    order = order_by(section, "cx")
+    centers = section.cx[order]
 
     center_diffs = np.diff(centers)
     q1 = np.percentile(center_diffs, 25)
     q3 = np.percentile(center_diffs, 75)
     iqr = q3 - q1
 
-    avg_width = np.mean([b["w"] for b in section])
+    avg_width = np.mean(section.w)
     adaptive_gap = np.clip(iqr * 1.5, avg_width * 0.8, avg_width * 2.5)
 
-    column_bins: List[List[Dict]] = [[sorted_blocks[0]]]
-
-    for i, block in enumerate(sorted_blocks[1:], 1):
-        curr_center = centers[i]
-        prev_center = centers[i - 1]
-
-        if abs(curr_center - prev_center) <= adaptive_gap:
-            column_bins[-1].append(block)
-        else:
-            column_bins.append([block])
-
-    return column_bins
-
-    
\ No newline at end of file
+    # 인접 중심 간격이 adaptive_gap을 넘는 곳에서 컬럼 분리
+    return section.split(np.split(order, gap_breaks(centers, adaptive_gap)))
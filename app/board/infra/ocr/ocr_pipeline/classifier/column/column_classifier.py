@@ -1,12 +1,14 @@
 import numpy as np
-from typing import List, Dict
+from typing import Dict, Sequence, Union
 from .cluster_blocks import cluster_blocks_by_x
+from app.board.infra.ocr.ocr_pipeline.layout_analysis.block_set import BlockSet, as_block_set
+from app.board.infra.ocr.ocr_pipeline.layout_analysis.section_features import section_features
 import logging
 
 logger = logging.getLogger(__name__)
 
 def score_column_section(
-    section: List[Dict],
+    section: Union[BlockSet, Sequence[Dict]],
     min_columns: int,
     min_blocks_per_column: int,
     min_threshold: int,
@@ -21,11 +23,12 @@ def score_column_section(
             logger.debug(f"[column] 블록 수 부족: {len(section)}")
             return 0.0
 
-        x_centers = [block["x"] + block["w"] // 2 for block in section]
+        section = as_block_set(section)
+        features = section_features(section)
 
         # 동적 클러스터 임계값 계산
-        avg_block_width = np.mean([b["w"] for b in section])
-        std_block_width = np.std([b["w"] for b in section])
+        avg_block_width = features.width_mean
+        std_block_width = features.width_std
         estimated_gap = avg_block_width + std_block_width
         
         # std가 크면 multiplier 보정
@@ -34,8 +37,6 @@ def score_column_section(
 
         x_cluster_threshold = int(np.clip(estimated_gap * multiplier, min_threshold, max_threshold))
         x_std_threshold = int(np.clip(std_block_width * 2.0, 30, 140))
-
-        x_centers_sorted = sorted(x_centers)
         
         # 실제 클러스터링 실행
         clusters = cluster_blocks_by_x(section, x_cluster_threshold)
@@ -43,8 +44,7 @@ def score_column_section(
         block_per_column = [len(col) for col in clusters]
         std_column_size = np.std(block_per_column) if len(block_per_column) >= 2 else 999
 
-        x_centers = [block["x"] + block["w"] // 2 for block in section]
-        x_std = np.std(x_centers)
+        x_std = features.cx_std
 
         # --- 점수 계산 ---
         # 1. 컬럼 수 기준
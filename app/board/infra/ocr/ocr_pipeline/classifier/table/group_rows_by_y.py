@@ -1,28 +1,33 @@
-from typing import List, Dict
+from typing import List, Dict, Sequence, Union
+import numpy as np
+from app.board.infra.ocr.ocr_pipeline.layout_analysis.block_set import BlockSet, as_block_set
+from app.board.infra.ocr.ocr_pipeline.layout_analysis.split_sections import assign_center_groups
+from app.board.infra.ocr.ocr_pipeline.layout_analysis.spatial_index import order_by
 
-def group_rows_by_y(section: List[Dict], y_tolerance: int) -> List[List[Dict]]:
-    rows = []
+def group_rows_by_y(section: Union[BlockSet, Sequence[Dict]], y_tolerance: int) -> List[BlockSet]:
+    section = as_block_set(section)
+    return section.split(group_row_positions(section, y_tolerance))
 
-    def get_center_y(block):
-        return block["y"] + block.get("h", 0) // 2
 
-    # y 중심 기준 정렬
-    sorted_blocks = sorted(section, key=get_center_y)
+def group_row_positions(section: BlockSet, y_tolerance: int) -> List[np.ndarray]:
+    """
+    y 중심이 기존 행의 평균 y 중심과 tolerance 이내인 첫 행에 배정하여 행별 위치 배열 반환
+    (행 내 순서는 y 중심 정렬 순서)
 
-    for block in sorted_blocks:
-        b_cy = get_center_y(block)
-        placed = False
+    같은 섹션/tolerance의 결과는 섹션에 보관되어 테이블 판별과 테이블 후처리가 공유합니다.
+    """
+    return section.memoize(("rows_by_y", y_tolerance), lambda: _group_row_positions(section, y_tolerance))
 
-        for row in rows:
-            row_cys = [get_center_y(b) for b in row]
-            avg_cy = sum(row_cys) / len(row_cys)
 
-            if abs(b_cy - avg_cy) <= y_tolerance:
-                row.append(block)
-                placed = True
-                break
+def _group_row_positions(section: BlockSet, y_tolerance: int) -> List[np.ndarray]:
+    if not section:
+        return []
 
-        if not placed:
-            rows.append([block])
+    # y 중심 기준 정렬 후 sweep-line으로 행 배정
+    order = order_by(section, "cy")
+    row_of = assign_center_groups(section.cy[order].tolist(), y_tolerance)
+    row_count = int(row_of.max()) + 1
 
-    return rows
+    grouped = np.argsort(row_of, kind="stable")
+    boundaries = np.cumsum(np.bincount(row_of, minlength=row_count))[:-1]
+    return np.split(order[grouped], boundaries)
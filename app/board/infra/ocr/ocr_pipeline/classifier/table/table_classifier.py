@@ -1,12 +1,14 @@
 import numpy as np
-from typing import List, Dict
-from .group_rows_by_y import group_rows_by_y
+from typing import Dict, List, Sequence, Union
+from .group_rows_by_y import group_row_positions
+from app.board.infra.ocr.ocr_pipeline.layout_analysis.block_set import BlockSet, as_block_set
+from app.board.infra.ocr.ocr_pipeline.layout_analysis.section_features import section_features
 import logging
 
 logger = logging.getLogger(__name__)
 
 def score_table_section(
-    section: List[Dict],
+    section: Union[BlockSet, Sequence[Dict]],
     overlap_ratio_threshold: float,
     min_rows: int,
     colspan_check_enabled: bool
@@ -15,20 +17,24 @@ def score_table_section(
 
     try:
         
+        section = as_block_set(section)
+        xs = section.x
+        ws = section.w
+
         #모든 블록들의 평균 높이
-        avg_height = sum(b["h"] for b in section) / max(len(section), 1)
+        avg_height = section_features(section).avg_height
         #글자 크기에 따른 임계값 설정
         y_tolerance = min(max(int(avg_height * 0.8), 6), 20)
         
-        rows = group_rows_by_y(section, y_tolerance)
+        rows = group_row_positions(section, y_tolerance)
 
         if len(rows) < min_rows:
             logger.debug(f"[table] 행 수 부족: {len(rows)} < {min_rows}")
             return 0.0
 
         # 1. 행 내 x 정렬 기준 분석
-        row_x_list = [sorted(block["x"] for block in row) for row in rows if len(row) >= 2]
-        row_x_diffs = [np.diff(xs) for xs in row_x_list if len(xs) >= 2]
+        row_x_list = [np.sort(xs[row]) for row in rows if len(row) >= 2]
+        row_x_diffs = [np.diff(row_xs) for row_xs in row_x_list if len(row_xs) >= 2]
 
         all_diffs = np.concatenate(row_x_diffs) if row_x_diffs else np.array([])
         avg_std = np.std(all_diffs) if len(all_diffs) > 0 else 999
@@ -42,17 +48,8 @@ def score_table_section(
         else:
             row_std_score = 0.2
 
-        # 2. 행 간 x 좌표 유사성 (overlap)
-        overlap_ratios = []
-        for i in range(len(row_x_list)):
-            for j in range(i + 1, len(row_x_list)):
-                set_i = set(row_x_list[i])
-                set_j = set(row_x_list[j])
-                union = set_i | set_j
-                if union:
-                    ratio = len(set_i & set_j) / len(union)
-                    overlap_ratios.append(ratio)
-        avg_overlap = np.mean(overlap_ratios) if overlap_ratios else 0.0
+        # 2. 행 간 x 좌표 유사성 (overlap) - 모든 행 쌍의 x 좌표 집합 Jaccard 평균
+        avg_overlap = average_pairwise_jaccard(row_x_list)
 
         if avg_overlap > 0.6:
             overlap_score = 1.0
@@ -64,8 +61,8 @@ def score_table_section(
             overlap_score = 0.0
 
         # 3. 셀 너비 표준편차 (너비 균형)
-        all_widths = [block["w"] for row in rows for block in row]
-        width_std = np.std(all_widths) if all_widths else 0.0
+        all_widths = ws[np.concatenate(rows)]
+        width_std = np.std(all_widths) if len(all_widths) else 0.0
         
         if width_std < 100:
             width_std_score = 1.0
@@ -79,14 +76,14 @@ def score_table_section(
         colspan_score = 0.0
         if colspan_check_enabled:
             max_cells_per_row = max(len(row) for row in rows)
-            row_widths = [sum(block["w"] for block in row) for row in rows]
+            row_widths = [ws[row].sum() for row in rows]
             avg_row_width = np.mean(row_widths) if row_widths else 0
 
             for row in rows:
-                widths = [block["w"] for block in row]
+                widths = ws[row]
                 if (
                     len(row) <= max_cells_per_row - 2 and
-                    sum(widths) > avg_row_width * 1.5 and
+                    widths.sum() > avg_row_width * 1.5 and
                     np.std(widths) > np.mean(widths) * 0.5
                 ):
                     colspan_detected = True
@@ -125,3 +122,29 @@ def score_table_section(
     except Exception as e:
         logger.exception("[table] 테이블 판별 중 예외 발생")
         return 0.0
+
+
+def average_pairwise_jaccard(row_values: List[np.ndarray]) -> float:
+    """
+    행별 x 좌표 집합의 모든 쌍(i < j) Jaccard 유사도 평균
+
+    행 × 고유 x 좌표 incidence 행렬의 곱으로 교집합 크기를 한 번에 구함 (행 쌍별 set 연산 대신)
+    """
+    if len(row_values) < 2:
+        return 0.0
+
+    flat = np.concatenate(row_values)
+    unique_values, columns = np.unique(flat, return_inverse=True)
+    row_ids = np.repeat(np.arange(len(row_values)), [len(values) for values in row_values])
+
+    incidence = np.zeros((len(row_values), len(unique_values)), dtype=np.float32)
+    incidence[row_ids, columns] = 1.0
+
+    intersections = incidence @ incidence.T
+    sizes = np.diag(intersections)
+    upper_i, upper_j = np.triu_indices(len(row_values), k=1)
+    unions = sizes[upper_i] + sizes[upper_j] - intersections[upper_i, upper_j]
+
+    # 행 쌍 순서(i < j, 행 우선)는 기존 이중 루프와 동일
+    ratios = intersections[upper_i, upper_j].astype(np.float64)[unions > 0] / unions[unions > 0]
+    return np.mean(ratios) if len(ratios) else 0.0
@@ -0,0 +1,280 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple, Union
+
+import aiohttp
+
+from .config.env import (
+    CLOVA_OCR_URL,
+    CLOVA_SECRET_KEY,
+    CLOVA_TIMEOUT_SECONDS,
+    CLOVA_MAX_CONNECTIONS,
+    CLOVA_MAX_RETRIES,
+    CLOVA_RETRY_BACKOFF_SECONDS,
+    CLOVA_MAX_IMAGE_BYTES,
+    CLOVA_MAX_IMAGES_PER_REQUEST,
+)
+from .payload_builder import build_batch_ocr_payload
+from .preprocess.image_preprocessor import preprocess_image, restore_ocr_coordinates
+from .preprocess.image_tiler import plan_tiles, crop_tiles, stitch_tile_responses
+from .stage_timing import stage
+
+logger = logging.getLogger(__name__)
+
+# 재시도 대상 HTTP 상태 코드 (일시적 오류)
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class ClovaOCRRetryableError(Exception):
+    """재시도 가능한 CLOVA/이미지 서버 응답 오류"""
+
+
+class ImageTooLargeError(ValueError):
+    """다운로드 이미지가 허용 크기를 초과한 경우"""
+
+
+class ClovaOCRClient:
+    """
+    CLOVA OCR 비동기 클라이언트
+
+    커넥션 풀을 가진 aiohttp 세션 하나를 재사용하며, 이미지 다운로드와 OCR 요청 모두
+    타임아웃과 지수 백오프 재시도를 적용합니다. 이벤트 루프를 블로킹하지 않습니다.
+    """
+
+    def __init__(self,
+                 timeout_seconds: float = CLOVA_TIMEOUT_SECONDS,
+                 max_connections: int = CLOVA_MAX_CONNECTIONS,
+                 max_retries: int = CLOVA_MAX_RETRIES,
+                 retry_backoff_seconds: float = CLOVA_RETRY_BACKOFF_SECONDS,
+                 max_image_bytes: int = CLOVA_MAX_IMAGE_BYTES,
+                 max_images_per_request: int = CLOVA_MAX_IMAGES_PER_REQUEST):
+        self.timeout = aiohttp.ClientTimeout(total=timeout_seconds)
+        self.max_connections = max_connections
+        self.max_retries = max_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.max_image_bytes = max_image_bytes
+        self.max_images_per_request = max(1, max_images_per_request)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def call_clova_ocr(self, image_source: str) -> Dict:
+        """
+        이미지 파일 경로 또는 URL을 받아 CLOVA OCR 요청 수행 (비동기)
+        """
+        logger.info(f"OCR 요청 시작: {image_source}")
+
+        image_data = await self.load_image(image_source)
+        return await self.ocr_image(image_data, self.format_from_source(image_source))
+
+    async def load_image(self, image_source: str) -> bytes:
+        """이미지 URL은 다운로드, 로컬 경로는 파일 읽기"""
+        with stage("download"):
+            if image_source.startswith("http://") or image_source.startswith("https://"):
+                return await self.download_image(image_source)
+            return await asyncio.to_thread(self._read_file, image_source)
+
+    async def ocr_image(self, image_data: bytes, fallback_format: str = "jpg") -> Dict:
+        """
+        이미 메모리에 있는 이미지 바이트로 CLOVA OCR 수행 (원본 좌표 기준 응답 반환)
+        """
+        result = (await self.ocr_images([(image_data, fallback_format)]))[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def ocr_images(self, images: List[Tuple[bytes, str]]) -> List[Union[Dict, Exception]]:
+        """
+        여러 이미지를 최소한의 CLOVA 요청으로 묶어 OCR 수행
+
+        1. 이미지별 전처리 (세로로 긴 이미지는 겹치는 타일로 분할)
+        2. 전체 이미지/타일에 고유 이름을 붙여 요청당 최대 이미지 수만큼 묶어 동시에 전송
+        3. 응답의 이미지 이름으로 원래 이미지에 되돌려 타일 합성 및 원본 좌표 복원
+
+        Args:
+            images: (이미지 바이트, 대체 포맷) 목록
+
+        Returns:
+            입력 순서대로 원본 좌표 기준 응답 또는 해당 이미지의 실패 예외
+        """
+        # 포맷 판별 / 축소 / 재압축 (CPU 작업이므로 스레드에서 실행)
+        with stage("preprocess"):
+            prepared_images = await asyncio.gather(
+                *(asyncio.to_thread(preprocess_image, image_data, fallback_format) for image_data, fallback_format in images)
+            )
+
+        units: List[Tuple[str, bytes, str]] = []  # (이름, 이미지 바이트, 포맷)
+        plans = []                                 # 이미지별 (전처리 결과, 타일 구간, 단위 이름 목록) 또는 예외
+        for index, prepared in enumerate(prepared_images):
+            spans = plan_tiles(prepared.width, prepared.height)
+            if not spans:
+                name = f"image_{index}"
+                units.append((name, prepared.data, prepared.format))
+                plans.append((prepared, spans, [name]))
+                continue
+
+            try:
+                tiles = await asyncio.to_thread(crop_tiles, prepared.data, spans)
+            except Exception as e:
+                logger.error(f"타일 분할 실패: {e}")
+                plans.append(e)
+                continue
+            logger.info(f"타일 분할 OCR: {prepared.width}x{prepared.height} → {len(tiles)}개 타일")
+            names = [f"image_{index}_tile_{tile_index}" for tile_index in range(len(tiles))]
+            units.extend((name, tile, "jpg") for name, tile in zip(names, tiles))
+            plans.append((prepared, spans, names))
+
+        responses = await self._request_units(units)
+        del units
+
+        results: List[Union[Dict, Exception]] = []
+        for plan in plans:
+            if isinstance(plan, Exception):
+                results.append(plan)
+                continue
+
+            prepared, spans, names = plan
+            unit_responses = [responses[name] for name in names]
+            failure = next((response for response in unit_responses if isinstance(response, Exception)), None)
+            if failure is not None:
+                results.append(failure)
+                continue
+
+            if spans:
+                result = stitch_tile_responses(unit_responses, spans, prepared.width, prepared.height)
+            else:
+                result = unit_responses[0]
+            # 전처리 이미지 기준 좌표를 원본 기준으로 복원
+            results.append(restore_ocr_coordinates(result, prepared))
+
+        logger.info(f"OCR 요청 완료: 이미지 {len(images)}개, 실패 {sum(isinstance(r, Exception) for r in results)}개")
+        return results
+
+    async def download_image(self, image_url: str) -> bytearray:
+        """이미지 URL을 메모리로 스트리밍 다운로드 (최대 크기 초과 시 즉시 중단)"""
+        async def _download() -> bytearray:
+            session = await self._get_session()
+            async with session.get(image_url) as response:
+                self._raise_for_status(response)
+
+                content_length = response.content_length
+                if content_length is not None and content_length > self.max_image_bytes:
+                    raise ImageTooLargeError(f"이미지 크기 초과: {content_length} > {self.max_image_bytes} bytes")
+
+                # 청크 단위로 하나의 버퍼에 누적 (bytes 변환 사본을 만들지 않음)
+                buffer = bytearray()
+                async for chunk in response.content.iter_chunked(64 * 1024):
+                    if len(buffer) + len(chunk) > self.max_image_bytes:
+                        raise ImageTooLargeError(f"이미지 크기 초과: > {self.max_image_bytes} bytes")
+                    buffer += chunk
+                return buffer
+
+        image_data = await self._with_retry(_download, "이미지 다운로드")
+        logger.debug(f"이미지 URL 다운로드 완료: {len(image_data)} bytes")
+        return image_data
+
+    async def request_ocr(self, image_data: bytes, image_format: str) -> Dict:
+        """이미지 바이트를 CLOVA OCR API로 전송하고 JSON 응답 반환"""
+        return await self.request_batch_ocr([("ocr_test", image_data, image_format)])
+
+    async def request_batch_ocr(self, units: List[Tuple[str, bytes, str]]) -> Dict:
+        """(이름, 이미지 바이트, 포맷) 목록을 요청 1건으로 CLOVA OCR API에 전송하고 JSON 응답 반환"""
+        # 이미지 버퍼를 복사하지 않고 JSON 본문을 직접 생성
+        with stage("encode"):
+            body = build_batch_ocr_payload([(image_data, image_format, name) for name, image_data, image_format in units])
+
+        headers = {
+            "Content-Type": "application/json",
+            "X-OCR-SECRET": CLOVA_SECRET_KEY
+        }
+
+        async def _post() -> Dict:
+            session = await self._get_session()
+            async with session.post(CLOVA_OCR_URL, data=body, headers=headers) as response:
+                self._raise_for_status(response)
+                return await response.json(content_type=None)
+
+        with stage("clova_call"):
+            return await self._with_retry(_post, "OCR 요청")
+
+    async def _request_units(self, units: List[Tuple[str, bytes, str]]) -> Dict[str, Union[Dict, Exception]]:
+        """
+        이미지 단위들을 요청당 최대 이미지 수로 묶어 동시에 전송하고, 이름별 단일 이미지 응답으로 분리
+
+        요청이 실패하면 그 요청에 담긴 모든 단위에 같은 예외를 기록합니다.
+        """
+        batches = [
+            units[start:start + self.max_images_per_request]
+            for start in range(0, len(units), self.max_images_per_request)
+        ]
+        if batches:
+            logger.debug(f"CLOVA OCR 요청 묶음: 이미지 {len(units)}개 → 요청 {len(batches)}건")
+
+        batch_responses = await asyncio.gather(
+            *(self.request_batch_ocr(batch) for batch in batches), return_exceptions=True
+        )
+
+        responses: Dict[str, Union[Dict, Exception]] = {}
+        for batch, batch_response in zip(batches, batch_responses):
+            if isinstance(batch_response, Exception):
+                for name, _, _ in batch:
+                    responses[name] = batch_response
+                continue
+
+            common = {key: value for key, value in batch_response.items() if key != "images"}
+            image_infos = batch_response.get("images", [])
+            by_name = {image_info.get("name"): image_info for image_info in image_infos}
+            for position, (name, _, _) in enumerate(batch):
+                # 응답에 이름이 없으면 요청 순서로 매칭
+                image_info = by_name.get(name)
+                if image_info is None and position < len(image_infos):
+                    image_info = image_infos[position]
+                if image_info is None:
+                    responses[name] = ValueError(f"OCR 응답에 이미지 누락: {name}")
+                else:
+                    responses[name] = {**common, "images": [image_info]}
+        return responses
+
+    async def close(self) -> None:
+        """세션 및 커넥션 풀 정리"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            logger.info("CLOVA OCR 클라이언트 세션 종료")
+        self._session = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """실행 중인 이벤트 루프에서 세션을 지연 생성"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_connections)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+        return self._session
+
+    async def _with_retry(self, operation, operation_name: str):
+        """일시적 오류(네트워크, 타임아웃, 429/5xx)에 대해 지수 백오프로 재시도"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await operation()
+            except (ClovaOCRRetryableError, aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt >= self.max_retries:
+                    logger.error(f"{operation_name} 실패 (재시도 {attempt}회 후): {e}")
+                    raise
+                delay = self.retry_backoff_seconds * (2 ** attempt)
+                logger.warning(f"{operation_name} 일시적 오류, {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries}): {e}")
+                await asyncio.sleep(delay)
+
+    @staticmethod
+    def _raise_for_status(response: aiohttp.ClientResponse) -> None:
+        """재시도 가능한 상태 코드는 별도 예외로 구분"""
+        if response.status in RETRYABLE_STATUS:
+            raise ClovaOCRRetryableError(f"HTTP {response.status}: {response.url}")
+        response.raise_for_status()
+
+    @staticmethod
+    def _read_file(image_path: str) -> bytes:
+        with open(image_path, "rb") as f:
+            return f.read()
+
+    @staticmethod
+    def format_from_source(image_source: str) -> str:
+        """쿼리스트링을 제외한 경로의 확장자로 이미지 포맷 추정 (매직 바이트 판별 실패 시 사용)"""
+        path = image_source.split("?", 1)[0].split("#", 1)[0]
+        extension = path.rsplit(".", 1)[-1].lower() if "." in path.rsplit("/", 1)[-1] else ""
+        return extension or "jpg"
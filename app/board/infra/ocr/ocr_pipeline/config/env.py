@@ -9,6 +9,16 @@ load_dotenv()
 CLOVA_OCR_URL = get_required_env("CLOVA_OCR_URL")
 CLOVA_SECRET_KEY = get_required_env("CLOVA_SECRET_KEY")
 
+# CLOVA 비동기 클라이언트 관련
+CLOVA_TIMEOUT_SECONDS = float(os.getenv("CLOVA_TIMEOUT_SECONDS", "30"))
+CLOVA_MAX_CONNECTIONS = int(os.getenv("CLOVA_MAX_CONNECTIONS", "4"))
+CLOVA_MAX_RETRIES = int(os.getenv("CLOVA_MAX_RETRIES", "2"))
+CLOVA_RETRY_BACKOFF_SECONDS = float(os.getenv("CLOVA_RETRY_BACKOFF_SECONDS", "0.5"))
+# 다운로드 허용 최대 이미지 크기 (기본 20MB)
+CLOVA_MAX_IMAGE_BYTES = int(os.getenv("CLOVA_MAX_IMAGE_BYTES", str(20 * 1024 * 1024)))
+# 요청 1건에 담을 최대 이미지 수 (General OCR은 현재 1장만 허용 - API 한도가 늘면 올려서 사용)
+CLOVA_MAX_IMAGES_PER_REQUEST = max(1, int(os.getenv("CLOVA_MAX_IMAGES_PER_REQUEST", "1")))
+
 # 로깅 관련
 LOG_LEVEL = os.getenv("LOG_LEVEL", "DEBUG")
 LOG_FORMAT = os.getenv("LOG_FORMAT", "[%(asctime)s] %(levelname)s [%(name)s] - %(message)s")
@@ -1,12 +1,15 @@
-from typing import List, Dict
+from typing import Dict
 import logging
+import numpy as np
+from .block_set import BLOCK_DTYPE, BlockSet
 
 logger = logging.getLogger(__name__)
 
 #1. ocr로 추출된 json에서 필요한 정보(bounding box, text, linebreak)만 추출
-def extract_blocks_from_ocr_response(ocr_response: Dict) -> List[Dict]:
+def extract_blocks_from_ocr_response(ocr_response: Dict) -> BlockSet:
     
-    blocks = []
+    rows = []
+    texts = []
     
     try:
             image_info = ocr_response["images"][0]
@@ -20,23 +23,15 @@ def extract_blocks_from_ocr_response(ocr_response: Dict) -> List[Dict]:
     for idx, field in enumerate(image_fields):
         try:
             vertices = field["boundingPoly"]["vertices"]
-            x = min(v["x"] for v in vertices)
-            y = min(v["y"] for v in vertices)
-            w = max(v["x"] for v in vertices) - x
-            h = max(v["y"] for v in vertices) - y
+            xs = [v["x"] for v in vertices]
+            ys = [v["y"] for v in vertices]
+            x = min(xs)
+            y = min(ys)
+            row = (x, y, max(xs) - x, max(ys) - y, field["lineBreak"])
+            text = field["inferText"]
 
-            block = {
-                "x": x,
-                "y": y,
-                "w": w,
-                "h": h,
-                "text": field["inferText"],
-                "linebreak": field["lineBreak"],
-                "image_width": image_width,
-                "image_height": image_height
-            }
-
-            blocks.append(block)
+            rows.append(row)
+            texts.append(text)
 
         except KeyError as e:
             logger.debug(f"필드 누락 (index {idx}): {e}")
@@ -45,4 +40,9 @@ def extract_blocks_from_ocr_response(ocr_response: Dict) -> List[Dict]:
             logger.debug(f"블록 처리 중 예외 발생 (index {idx})", exc_info=True)
             continue
 
-    return blocks
\ No newline at end of file
+    # 좌표는 구조화 배열, 텍스트는 같은 순서의 병렬 배열로 보관
+    records = np.array(rows, dtype=BLOCK_DTYPE)
+    text_array = np.empty(len(texts), dtype=object)
+    text_array[:] = texts
+
+    return BlockSet(records, text_array, image_width=image_width, image_height=image_height)
@@ -0,0 +1,205 @@
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Sequence, Union
+import numpy as np
+
+# 블록 좌표/줄바꿈 구조화 배열 타입 (CLOVA 좌표는 정수/실수 모두 올 수 있으므로 float64로 통일)
+BLOCK_DTYPE = np.dtype([
+    ("x", np.float64),
+    ("y", np.float64),
+    ("w", np.float64),
+    ("h", np.float64),
+    ("linebreak", np.bool_),
+])
+
+
+class BlockSet:
+    """
+    OCR 블록 집합의 열 지향(columnar) 표현
+
+    - 원본 블록: 구조화 배열(x, y, w, h, linebreak) + 같은 순서의 텍스트 배열
+    - 섹션/줄/컬럼: 원본 배열에 대한 인덱스 배열(view) - 블록 복사 없이 나누고 합침
+    - 좌표 열(x, y, cx, cy 등)은 view별로 한 번만 계산해 캐시
+    - 이미지 단위 구조(정렬 인덱스 등)는 같은 원본을 공유하는 모든 view가 함께 캐시
+    - 반복/정수 인덱싱 시 기존 dict 블록과 같은 형태를 반환 (기존 호출부 호환)
+    """
+
+    __slots__ = ("records", "texts", "index", "image_width", "image_height", "_columns", "_memo", "_shared")
+
+    def __init__(self,
+                 records: np.ndarray,
+                 texts: np.ndarray,
+                 image_width: Optional[float] = None,
+                 image_height: Optional[float] = None,
+                 index: Optional[np.ndarray] = None,
+                 shared: Optional[Dict[Hashable, Any]] = None):
+        self.records = records
+        self.texts = texts
+        self.image_width = image_width
+        self.image_height = image_height
+        self.index = np.arange(len(records), dtype=np.intp) if index is None else index
+        self._columns: Dict[str, np.ndarray] = {}
+        self._memo: Dict[Hashable, Any] = {}
+        self._shared: Dict[Hashable, Any] = {} if shared is None else shared
+
+    @classmethod
+    def from_dicts(cls, blocks: Sequence[Dict]) -> "BlockSet":
+        """기존 dict 블록 목록을 BlockSet으로 변환"""
+        records = np.zeros(len(blocks), dtype=BLOCK_DTYPE)
+        if blocks:
+            records["x"] = [block["x"] for block in blocks]
+            records["y"] = [block["y"] for block in blocks]
+            records["w"] = [block.get("w", 0) for block in blocks]
+            records["h"] = [block.get("h", 0) for block in blocks]
+            records["linebreak"] = [bool(block.get("linebreak", False)) for block in blocks]
+
+        texts = np.empty(len(blocks), dtype=object)
+        texts[:] = [block.get("text", "") for block in blocks]
+
+        sample = next((block for block in blocks if "image_width" in block and "image_height" in block), None)
+        return cls(
+            records,
+            texts,
+            image_width=sample["image_width"] if sample else None,
+            image_height=sample["image_height"] if sample else None,
+        )
+
+    # --- view 생성 ---
+
+    def take(self, positions) -> "BlockSet":
+        """이 집합 내 위치(0..len-1) 배열로 부분 집합 view 생성 (순서 유지)"""
+        return self._view(self.index[np.asarray(positions, dtype=np.intp)])
+
+    def concat(self, *others: "BlockSet") -> "BlockSet":
+        """view들을 이어붙인 집합 (섹션 병합) - 같은 원본을 공유하면 인덱스만 이어붙임"""
+        if all(other.records is self.records for other in others):
+            return self._view(np.concatenate([self.index] + [other.index for other in others]))
+
+        # 서로 다른 원본(dict 목록에서 각각 변환된 섹션 등)은 새 원본으로 복사
+        parts = (self,) + others
+        sample = next((part for part in parts if part.image_width is not None and part.image_height is not None), self)
+        return BlockSet(
+            np.concatenate([part.records[part.index] for part in parts]),
+            np.concatenate([part.texts[part.index] for part in parts]),
+            image_width=sample.image_width,
+            image_height=sample.image_height,
+        )
+
+    def split(self, position_groups: List[np.ndarray]) -> List["BlockSet"]:
+        """위치 배열 목록으로 여러 view 생성"""
+        return [self.take(positions) for positions in position_groups]
+
+    def _view(self, index: np.ndarray) -> "BlockSet":
+        return BlockSet(self.records, self.texts, self.image_width, self.image_height, index, self._shared)
+
+    # --- 열(column) 접근 ---
+
+    def _column(self, name: str) -> np.ndarray:
+        column = self._columns.get(name)
+        if column is None:
+            if name == "cx":
+                column = self.x + self.w // 2
+            elif name == "cy":
+                column = self.y + self.h // 2
+            elif name == "text":
+                column = self.texts[self.index]
+            else:
+                column = self.records[name][self.index]
+            self._columns[name] = column
+        return column
+
+    @property
+    def x(self) -> np.ndarray:
+        return self._column("x")
+
+    @property
+    def y(self) -> np.ndarray:
+        return self._column("y")
+
+    @property
+    def w(self) -> np.ndarray:
+        return self._column("w")
+
+    @property
+    def h(self) -> np.ndarray:
+        return self._column("h")
+
+    @property
+    def cx(self) -> np.ndarray:
+        """x 중심 (x + w // 2)"""
+        return self._column("cx")
+
+    @property
+    def cy(self) -> np.ndarray:
+        """y 중심 (y + h // 2)"""
+        return self._column("cy")
+
+    @property
+    def linebreak(self) -> np.ndarray:
+        return self._column("linebreak")
+
+    @property
+    def text(self) -> np.ndarray:
+        return self._column("text")
+
+    def memoize(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        이 view에 대한 계산 결과를 key별로 한 번만 계산해 보관
+        (예: 같은 섹션의 행 그룹핑을 분류 단계와 후처리 단계가 공유)
+        """
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    def memoize_shared(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        같은 원본(records)을 공유하는 모든 view가 함께 쓰는 계산 결과를 key별로 한 번만 계산해 보관
+        (예: 이미지 단위 정렬 인덱스 - compute는 view가 아닌 원본 전체 기준이어야 함)
+        """
+        if key not in self._shared:
+            self._shared[key] = compute()
+        return self._shared[key]
+
+    # --- dict 호환 어댑터 ---
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __bool__(self) -> bool:
+        return len(self.index) > 0
+
+    def __getitem__(self, position: int) -> Dict:
+        return self._to_dict(int(self.index[position]))
+
+    def __iter__(self) -> Iterator[Dict]:
+        for source in self.index:
+            yield self._to_dict(int(source))
+
+    def __add__(self, other: "BlockSet") -> "BlockSet":
+        return self.concat(other)
+
+    def to_dicts(self) -> List[Dict]:
+        return list(self)
+
+    def _to_dict(self, source: int) -> Dict:
+        record = self.records[source]
+        block = {
+            "x": float(record["x"]),
+            "y": float(record["y"]),
+            "w": float(record["w"]),
+            "h": float(record["h"]),
+            "text": self.texts[source],
+            "linebreak": bool(record["linebreak"]),
+        }
+        if self.image_width is not None and self.image_height is not None:
+            block["image_width"] = self.image_width
+            block["image_height"] = self.image_height
+        return block
+
+    def __repr__(self) -> str:
+        return f"BlockSet({len(self)} blocks)"
+
+
+def as_block_set(blocks: Union[BlockSet, Sequence[Dict]]) -> BlockSet:
+    """dict 블록 목록 또는 BlockSet을 BlockSet으로 (이미 BlockSet이면 그대로)"""
+    if isinstance(blocks, BlockSet):
+        return blocks
+    return BlockSet.from_dicts(blocks)
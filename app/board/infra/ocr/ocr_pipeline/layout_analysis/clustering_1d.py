@@ -0,0 +1,83 @@
+from typing import List
+import numpy as np
+
+
+class SortedCentroids:
+    """
+    오름차순으로 정렬된 1차원 중심값(열 기준 x 등) 집합
+
+    최근접 중심 배정을 searchsorted로 이웃 두 중심만 비교하여 수행합니다. (블록 × 중심 전체 비교 대신)
+    """
+
+    __slots__ = ("values",)
+
+    def __init__(self, values: np.ndarray):
+        self.values = np.asarray(values, dtype=np.float64)
+
+    @classmethod
+    def merge_values(cls, values: np.ndarray, tolerance: float) -> "SortedCentroids":
+        """
+        값들을 오름차순으로 훑으며 마지막 중심과 tolerance 이내면 (중심 + 값) / 2로 갱신, 아니면 새 중심 추가
+
+        값이 오름차순이므로 새 중심이 생긴 뒤에는 이전 중심들과의 거리가 항상 tolerance를 넘어,
+        "tolerance 이내인 첫 중심 갱신" 규칙은 마지막 중심만 확인하는 것과 같습니다.
+        """
+        centroids: List[float] = []
+        for value in np.unique(values).tolist():
+            if centroids and abs(centroids[-1] - value) <= tolerance:
+                centroids[-1] = (centroids[-1] + value) / 2
+            else:
+                centroids.append(value)
+        return cls(np.array(centroids, dtype=np.float64))
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def assign(self, values: np.ndarray) -> np.ndarray:
+        """각 값에서 가장 가까운 중심의 인덱스 (거리가 같으면 앞쪽 중심)"""
+        values = np.asarray(values, dtype=np.float64)
+        if not len(values):
+            return np.empty(0, dtype=np.intp)
+        if not len(self.values):
+            raise ValueError("중심값이 없어 배정할 수 없습니다")
+
+        right = np.searchsorted(self.values, values, side="left")
+        right = np.minimum(right, len(self.values) - 1)
+        left = np.maximum(right - 1, 0)
+        choose_left = np.abs(self.values[left] - values) <= np.abs(self.values[right] - values)
+        return np.where(choose_left, left, right)
+
+    def is_close(self, other: "SortedCentroids", atol: float = 1e-2) -> bool:
+        """중심 수가 같고 모든 중심이 atol 이내로 같으면 수렴으로 판단"""
+        return len(self) == len(other) and len(self) > 0 and bool(np.allclose(self.values, other.values, atol=atol))
+
+
+def leader_clusters(sorted_values: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    정렬된 값에서 직전 클러스터 시작값(leader)과 tolerance 넘게 떨어진 첫 값으로 새 클러스터 시작
+
+    다음 클러스터 시작 위치를 searchsorted로 바로 찾으므로 클러스터 수만큼만 반복합니다.
+
+    Returns:
+        클러스터별 시작값 배열
+    """
+    sorted_values = np.asarray(sorted_values, dtype=np.float64)
+    count = len(sorted_values)
+    starts = []
+    position = 0
+    while position < count:
+        leader = sorted_values[position]
+        starts.append(position)
+
+        # leader + tolerance 이후 첫 위치 (부동소수 경계는 기존 비교식 x - leader > tolerance 기준으로 보정)
+        position = int(np.searchsorted(sorted_values, leader + tolerance, side="right"))
+        while position < count and sorted_values[position] - leader <= tolerance:
+            position += 1
+        while position - 1 > starts[-1] and sorted_values[position - 1] - leader > tolerance:
+            position -= 1
+    return sorted_values[starts]
+
+
+def gap_breaks(sorted_values: np.ndarray, max_gap: float) -> np.ndarray:
+    """정렬된 값에서 인접 간격이 max_gap을 넘는 위치(새 클러스터가 시작되는 위치) 배열"""
+    return np.flatnonzero(np.abs(np.diff(sorted_values)) > max_gap) + 1
@@ -1,27 +1,29 @@
 import numpy as np
-from typing import List, Dict
+from typing import List, Dict, Sequence, Union
+from ..block_set import BlockSet, as_block_set
+from ..section_features import merge_sections, section_features
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-def calculate_dynamic_column_tolerance(blocks: List[Dict]) -> int:
+def calculate_dynamic_column_tolerance(blocks: Union[BlockSet, Sequence[Dict]]) -> int:
     """
     OCR 블록들의 평균 너비 + 해상도 및 종횡비 기반으로 컬럼 클러스터링 tolerance를 동적으로 계산
     """
-    widths = [b.get("w", 0) for b in blocks if b.get("w", 0) > 0]
-    if not widths:
+    blocks = as_block_set(blocks)
+    widths = blocks.w[blocks.w > 0]
+    if not len(widths):
         return 40
     avg_width = np.mean(widths)
     base_tolerance = avg_width * 1.2
 
     # 해상도 및 종횡비 기반 보정
-    sample_block = next((b for b in blocks if "image_width" in b and "image_height" in b), None)
-    if not sample_block:
+    if blocks.image_width is None or blocks.image_height is None:
         tolerance = base_tolerance
     else:
-        image_width = sample_block["image_width"]
-        image_height = sample_block["image_height"]
+        image_width = blocks.image_width
+        image_height = blocks.image_height
         aspect_ratio = image_height / image_width if image_width > 0 else 1.0
 
         # 종횡비 보정 (과도한 보정 방지)
@@ -41,18 +43,10 @@ def calculate_dynamic_column_tolerance(blocks: List[Dict]) -> int:
         tolerance = base_tolerance * aspect_factor * resolution_factor
     return int(min(max(float(tolerance), 25), 100))
 
-def cluster_x_positions(blocks: List[Dict], tolerance: int) -> List[int]:
-    x_centers = sorted([b["x"] + b.get("w", 0) // 2 for b in blocks])
-    if not x_centers:
-        return []
+def cluster_x_positions(blocks: Union[BlockSet, Sequence[Dict]], tolerance: int) -> List[float]:
+    return section_features(as_block_set(blocks)).x_clusters(tolerance)
 
-    clusters = [x_centers[0]]
-    for x in x_centers[1:]:
-        if abs(x - clusters[-1]) > tolerance:
-            clusters.append(x)
-    return clusters
-
-def score_column_like_similarity(s1: List[Dict], s2: List[Dict], tolerance: int) -> float:
+def score_column_like_similarity(s1: Union[BlockSet, Sequence[Dict]], s2: Union[BlockSet, Sequence[Dict]], tolerance: int) -> float:
     """
     두 섹션이 컬럼 구조로 유사한지 점수 반환 (0~1)
     - 컬럼 수 유사
@@ -75,7 +69,7 @@ def score_column_like_similarity(s1: List[Dict], s2: List[Dict], tolerance: int)
     return round((col_score * 0.6 + balance_score * 0.4), 2)
 
 
-def merge_column_like_sections(sections: List[List[Dict]]) -> List[List[Dict]]:
+def merge_column_like_sections(sections: List[Union[BlockSet, Sequence[Dict]]]) -> List[BlockSet]:
     """
     섹션들 중 컬럼으로 의심되는 인접 섹션을 병합 (유사성 점수 기반)
     """
@@ -84,7 +78,8 @@ def merge_column_like_sections(sections: List[List[Dict]]) -> List[List[Dict]]:
     i = 0
 
     try:
-        all_blocks = [b for s in sections for b in s]
+        sections = [as_block_set(section) for section in sections]
+        all_blocks = sections[0].concat(*sections[1:]) if sections else as_block_set([])
         tolerance = calculate_dynamic_column_tolerance(all_blocks)
 
         while i < len(sections):
@@ -97,7 +92,7 @@ def merge_column_like_sections(sections: List[List[Dict]]) -> List[List[Dict]]:
                 score = score_column_like_similarity(current, sections[j], tolerance)
                 if score >= 0.85:
                     logger.debug(f"[column] 병합: 섹션 {i} + {j}, score={score:.2f}")
-                    current += sections[j]
+                    current = merge_sections(current, sections[j])
                     j += 1
                 else:
                     break
@@ -108,4 +103,4 @@ def merge_column_like_sections(sections: List[List[Dict]]) -> List[List[Dict]]:
         logger.exception("[column] 병합 도중 오류 발생")
 
     logger.info(f"[column] 병합 완료 → 총 섹션 수: {len(merged)}")
-    return merged
\ No newline at end of file
+    return merged
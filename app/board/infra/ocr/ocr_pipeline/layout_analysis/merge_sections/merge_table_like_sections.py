@@ -1,24 +1,27 @@
 import numpy as np
-from typing import List, Dict
+from typing import List, Dict, Sequence, Union
+from ..block_set import BlockSet, as_block_set
+from ..clustering_1d import leader_clusters
+from ..section_features import merge_sections, section_features
 import logging
 
 logger = logging.getLogger(__name__)
 
-def calculate_dynamic_table_tolerance(blocks: List[Dict]) -> int:
+def calculate_dynamic_table_tolerance(blocks: Union[BlockSet, Sequence[Dict]]) -> int:
     """
     OCR 블록들의 평균 너비를 기반으로 X 클러스터링 tolerance를 동적으로 계산
     """
-    widths = [b.get("w", 0) for b in blocks if b.get("w", 0) > 0]
-    if not widths:
+    blocks = as_block_set(blocks)
+    widths = blocks.w[blocks.w > 0]
+    if not len(widths):
         return 30
 
     avg_width = np.mean(widths)
 
     # 해상도 및 종횡비 보정
-    sample = next((b for b in blocks if "image_width" in b and "image_height" in b), None)
-    if sample:
-        image_width = sample["image_width"]
-        image_height = sample["image_height"]
+    if blocks.image_width is not None and blocks.image_height is not None:
+        image_width = blocks.image_width
+        image_height = blocks.image_height
         aspect_ratio = image_height / image_width if image_width > 0 else 1.0
 
         aspect_factor = 1.0
@@ -40,46 +43,22 @@ def calculate_dynamic_table_tolerance(blocks: List[Dict]) -> int:
     return int(min(max(float(tolerance), 15), 80))
 
 
-def get_x_pattern(line: List[Dict], tolerance: int) -> List[int]:
+def get_x_pattern(line: Union[BlockSet, Sequence[Dict]], tolerance: int) -> List[float]:
     """
     한 줄의 블록들에서 X 기준으로 열 클러스터 추출
     """
-    xs = sorted([block["x"] for block in line])
-    if not xs:
-        return []
+    return leader_clusters(np.sort(as_block_set(line).x), tolerance).tolist()
 
-    clusters = [xs[0]]
-    for x in xs[1:]:
-        if abs(x - clusters[-1]) > tolerance:
-            clusters.append(x)
-    return clusters
 
-
-def get_section_x_patterns(section: List[Dict], y_tolerance: int = 20, x_tolerance: int = 30) -> List[List[int]]:
+def get_section_x_patterns(section: Union[BlockSet, Sequence[Dict]], y_tolerance: int = 20, x_tolerance: int = 30) -> List[List[float]]:
     """
     섹션 내부를 행 단위로 나눈 후 각 행에서 X 패턴(열 좌표)을 추출
     """
-    section = sorted(section, key=lambda b: b["y"] + b.get("h", 0) // 2)
-    lines = []
-    current_line = [section[0]]
-
-    for i in range(1, len(section)):
-        prev = section[i - 1]
-        curr = section[i]
-        prev_cy = prev["y"] + prev.get("h", 0) // 2
-        curr_cy = curr["y"] + curr.get("h", 0) // 2
-
-        if abs(curr_cy - prev_cy) > y_tolerance:
-            lines.append(current_line)
-            current_line = [curr]
-        else:
-            current_line.append(curr)
-
-    lines.append(current_line)
-    return [get_x_pattern(line, tolerance=x_tolerance) for line in lines]
+    # 인접 블록의 y 중심 차이가 tolerance를 넘는 곳에서 행 분리 (섹션 통계에 보관되어 병합 시 재사용)
+    return section_features(as_block_set(section)).row_x_patterns(y_tolerance, x_tolerance)
 
 
-def score_table_like_similarity(s1: List[Dict], s2: List[Dict], x_tolerance: int) -> float:
+def score_table_like_similarity(s1: Union[BlockSet, Sequence[Dict]], s2: Union[BlockSet, Sequence[Dict]], x_tolerance: int) -> float:
     """
     두 섹션이 테이블처럼 유사한 구조를 가졌는지 점수로 평가 (0.0 ~ 1.0)
     """
@@ -104,7 +83,7 @@ def score_table_like_similarity(s1: List[Dict], s2: List[Dict], x_tolerance: int
     return max(score, 0.0)
 
 
-def merge_table_like_sections(sections: List[List[Dict]]) -> List[List[Dict]]:
+def merge_table_like_sections(sections: List[Union[BlockSet, Sequence[Dict]]]) -> List[BlockSet]:
     """
     섹션들 중 테이블로 의심되는 인접 섹션을 병합 (유사성 점수 기반)
     """
@@ -113,7 +92,8 @@ def merge_table_like_sections(sections: List[List[Dict]]) -> List[List[Dict]]:
     i = 0
 
     try:
-        all_blocks = [b for s in sections for b in s]
+        sections = [as_block_set(section) for section in sections]
+        all_blocks = sections[0].concat(*sections[1:]) if sections else as_block_set([])
         x_tolerance = calculate_dynamic_table_tolerance(all_blocks)
 
         while i < len(sections):
@@ -123,7 +103,7 @@ def merge_table_like_sections(sections: List[List[Dict]]) -> List[List[Dict]]:
                 score = score_table_like_similarity(current, sections[j], x_tolerance)
                 if score >= 0.7:
                     logger.debug(f"[table] 병합: 섹션 {i} + {j}, score={score:.2f}")
-                    current += sections[j]
+                    current = merge_sections(current, sections[j])
                     j += 1
                 else:
                     break
@@ -0,0 +1,139 @@
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+import numpy as np
+from .block_set import BlockSet
+from .clustering_1d import gap_breaks, leader_clusters
+from .spatial_index import order_by
+
+
+class SectionFeatures:
+    """
+    섹션 통계(평균 높이/너비, x 중심 분포, 행별 x 패턴 등)를 필요할 때 한 번만 계산해 보관
+
+    병합/분류/후처리 단계가 같은 섹션 view의 통계를 공유하며,
+    섹션 병합 시에는 결합 가능한 통계(정렬된 x 중심, y 범위, 행별 x 패턴)를 블록 재탐색 없이 합칩니다.
+    평균/표준편차 등 부동소수 합계 순서에 따라 값이 달라질 수 있는 통계는 병합된 섹션에서 다시 계산합니다.
+    """
+
+    __slots__ = ("section", "_values")
+
+    def __init__(self, section: BlockSet):
+        self.section = section
+        self._values: Dict[Hashable, Any] = {}
+
+    def _get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        if key not in self._values:
+            self._values[key] = compute()
+        return self._values[key]
+
+    # --- 크기 통계 ---
+
+    @property
+    def avg_height(self) -> float:
+        """블록 높이 합 / 블록 수 (빈 섹션은 0)"""
+        return self._get("avg_height", lambda: self.section.h.sum() / max(len(self.section), 1))
+
+    @property
+    def avg_width(self) -> float:
+        """블록 너비 합 / 블록 수 (빈 섹션은 0)"""
+        return self._get("avg_width", lambda: self.section.w.sum() / max(len(self.section), 1))
+
+    @property
+    def width_mean(self) -> float:
+        return self._get("width_mean", lambda: np.mean(self.section.w))
+
+    @property
+    def width_std(self) -> float:
+        return self._get("width_std", lambda: np.std(self.section.w))
+
+    @property
+    def positive_height_mean(self) -> float:
+        """높이가 0보다 큰 블록의 평균 높이 (없으면 20)"""
+        def compute():
+            heights = self.section.h[self.section.h > 0]
+            return np.mean(heights) if len(heights) else 20
+        return self._get("positive_height_mean", compute)
+
+    # --- 위치 분포 ---
+
+    @property
+    def x_std(self) -> float:
+        return self._get("x_std", lambda: np.std(self.section.x))
+
+    @property
+    def cx_std(self) -> float:
+        return self._get("cx_std", lambda: np.std(self.section.cx))
+
+    @property
+    def sorted_cx(self) -> np.ndarray:
+        return self._get("sorted_cx", lambda: np.sort(self.section.cx))
+
+    @property
+    def cy_range(self) -> Tuple[float, float]:
+        """y 중심 (최솟값, 최댓값) - 빈 섹션은 (inf, -inf)"""
+        def compute():
+            if not self.section:
+                return float("inf"), float("-inf")
+            return float(self.section.cy.min()), float(self.section.cy.max())
+        return self._get("cy_range", compute)
+
+    def x_clusters(self, tolerance: float) -> List[float]:
+        """x 중심을 tolerance 기준 leader 클러스터링한 클러스터 시작값 목록"""
+        return self._get(("x_clusters", tolerance),
+                         lambda: leader_clusters(self.sorted_cx, tolerance).tolist())
+
+    def row_x_patterns(self, y_tolerance: float, x_tolerance: float) -> List[List[float]]:
+        """y 중심 간격으로 행을 나눈 뒤 행별 x 클러스터 시작값 목록"""
+        def compute():
+            section = self.section
+            order = order_by(section, "cy")
+            breaks = gap_breaks(section.cy[order], y_tolerance)
+            return [leader_clusters(np.sort(line_xs), x_tolerance).tolist()
+                    for line_xs in np.split(section.x[order], breaks)]
+        return self._get(("row_x_patterns", y_tolerance, x_tolerance), compute)
+
+    # --- 병합 ---
+
+    @classmethod
+    def combine(cls, merged: BlockSet, first: "SectionFeatures", second: "SectionFeatures") -> "SectionFeatures":
+        """
+        first + second 순서로 이어붙인 섹션(merged)의 통계를 이미 계산된 두 섹션 통계로부터 결합
+
+        - 정렬된 x 중심: 두 정렬 배열 병합
+        - y 범위: 최솟값/최댓값
+        - 행별 x 패턴: 두 섹션의 y 중심 범위가 y_tolerance 넘게 떨어져 있으면 두 섹션의 행 목록을 그대로 이어붙임
+          (정렬된 y 중심 순서가 first → second로 이어지고 경계에서 반드시 행이 나뉘므로 결과가 같음)
+        """
+        features = cls(merged)
+        values = features._values
+
+        if "sorted_cx" in first._values and "sorted_cx" in second._values:
+            values["sorted_cx"] = np.sort(np.concatenate([first._values["sorted_cx"], second._values["sorted_cx"]]),
+                                          kind="stable")
+
+        first_min, first_max = first.cy_range
+        second_min, second_max = second.cy_range
+        values["cy_range"] = (min(first_min, second_min), max(first_max, second_max))
+
+        if not first.section or not second.section:
+            return features
+
+        for key, first_patterns in first._values.items():
+            if not (isinstance(key, tuple) and key[0] == "row_x_patterns" and key in second._values):
+                continue
+            y_tolerance = key[1]
+            if second_min - first_max > y_tolerance:
+                values[key] = first_patterns + second._values[key]
+
+        return features
+
+
+def section_features(section: BlockSet) -> SectionFeatures:
+    """섹션 view에 연결된 통계 객체 (처음 요청 시 생성)"""
+    return section.memoize("features", lambda: SectionFeatures(section))
+
+
+def merge_sections(first: BlockSet, second: BlockSet) -> BlockSet:
+    """두 섹션을 이어붙이고, 이미 계산된 통계를 결합해 병합된 섹션에 연결"""
+    merged = first.concat(second)
+    merged.memoize("features", lambda: SectionFeatures.combine(merged, section_features(first), section_features(second)))
+    return merged
@@ -1,52 +1,63 @@
-from typing import List, Dict
+import heapq
+from typing import Dict, List, Sequence, Union
 import logging
 import numpy as np
 from ..config.block_sort_config import block_sort_config
+from .block_set import BlockSet, as_block_set
+from .spatial_index import order_by, spatial_index
 
 logger = logging.getLogger(__name__)
 
 #3. OCR 블록들을 Y좌표 기준 정렬 -> 줄 내에서는 X 좌표 기준 정렬
-def sort_blocks(blocks: List[Dict], config: Dict = block_sort_config) -> List[Dict]:
-    
+def sort_blocks(blocks: Union[BlockSet, Sequence[Dict]], config: Dict = block_sort_config) -> BlockSet:
+
     #Y 기준으로 가까운 블록끼리 같은 줄로 판단 (동적 마진 적용)
-    
+
     try:
+        blocks = as_block_set(blocks)
         margin = config.get("y_overlap_margin", 5)
-        min_h = config.get("min_line_height", 5)
-        max_h = config.get("max_line_height", 100)
         margin_ratio = config.get("dynamic_margin_ratio", 0.5)
 
-        # 블록 높이 필터링 및 평균 계산
-        heights = [block.get("h", 0) for block in blocks if min_h <= block.get("h", 0) <= max_h]
-        avg_height = np.mean(heights) if heights else 20
+        # y 기준 안정 정렬 후 순서대로 줄 배정 (sweep-line)
+        # 블록은 y 오름차순으로 들어오므로 y1 >= 줄의 최소 y 이고, 줄 판정은 y1 <= 줄 최대 y + 동적 마진(도달 범위)만 남음
+        # 도달 범위보다 아래로 내려간 줄은 이후 블록도 받을 수 없으므로(범위는 블록이 합류할 때만 늘어남) 영구히 제외
+        # → 살아있는 줄 중 가장 먼저 만들어진 줄이 기존 "첫 번째로 맞는 줄"과 동일
+        order = order_by(blocks, "y")
+        ys = blocks.y[order].tolist()
+        bottoms = (blocks.y[order] + blocks.h[order]).tolist()
 
-        lines: List[List[Dict]] = []
+        line_min: List[float] = []
+        line_max: List[float] = []
+        line_reach: List[float] = []
+        active: List[int] = []   # 살아있는 줄 번호 (min-heap, 만료된 줄은 꺼낼 때 제거)
+        line_of = np.empty(len(order), dtype=np.intp)
 
-        for block in sorted(blocks, key=lambda b: b["y"]):
-            y1 = block["y"]
-            y2 = y1 + block.get("h", 0)
-            placed = False
+        for i, (y1, y2) in enumerate(zip(ys, bottoms)):
+            while active and line_reach[active[0]] < y1:
+                heapq.heappop(active)
 
-            for line in lines:
-                line_ys = [b["y"] for b in line]
-                line_heights = [b["h"] for b in line]
-                line_min = min(line_ys)
-                line_max = max(y + h for y, h in zip(line_ys, line_heights))
-                line_range = line_max - line_min
-                dynamic_margin = max(margin, line_range * margin_ratio)
+            if active:
+                line = active[0]
+                line_min[line] = min(line_min[line], y1)
+                line_max[line] = max(line_max[line], y2)
+            else:
+                line = len(line_min)
+                line_min.append(y1)
+                line_max.append(y2)
+                line_reach.append(0.0)
+                heapq.heappush(active, line)
 
-                if y2 >= line_min - dynamic_margin and y1 <= line_max + dynamic_margin:
-                    line.append(block)
-                    placed = True
-                    break
+            dynamic_margin = max(margin, (line_max[line] - line_min[line]) * margin_ratio)
+            line_reach[line] = line_max[line] + dynamic_margin
+            line_of[i] = line
 
-            if not placed:
-                lines.append([block])
+        line_count = len(line_min)
 
-        sorted_lines = [sorted(line, key=lambda b: b["x"]) for line in lines]
-        sorted_blocks = [b for line in sorted_lines for b in line]
+        # 줄 순서 → 줄 내 x 순서 (동률은 y 정렬 순서 유지, x는 이미지 단위 순위로 비교)
+        x_ranks = spatial_index(blocks).ranks("x")[blocks.index]
+        sorted_blocks = blocks.take(order[np.lexsort((x_ranks[order], line_of))])
 
-        logger.info(f"정렬 완료 (라인 기반): 총 {len(sorted_blocks)}개 블록, {len(sorted_lines)}줄")
+        logger.info(f"정렬 완료 (라인 기반): 총 {len(sorted_blocks)}개 블록, {line_count}줄")
         return sorted_blocks
 
     except Exception as e:
@@ -0,0 +1,64 @@
+from typing import Dict
+import numpy as np
+from .block_set import BlockSet
+
+# 16비트 이하 정수 키는 numpy 안정 정렬이 기수 정렬(radix sort, 선형 시간)로 처리됨
+_RADIX_RANK_LIMIT = np.iinfo(np.uint16).max + 1
+
+
+class SpatialIndex:
+    """
+    이미지(원본 블록 배열) 단위 정렬 인덱스
+
+    좌표 열(y, cy, x, cx)별로 원본 전체의 정렬된 고유값 배열과 각 블록의 순위(dense rank)를 한 번만 만들고,
+    섹션/줄/행 등 모든 view의 좌표 정렬은 이 순위를 키로 안정 정렬합니다.
+    - 순위는 좌표의 대소/동률 관계를 그대로 보존하므로 좌표로 직접 정렬한 결과와 같음
+    - 블록 수가 65536개 미만이면 순위를 uint16으로 보관하여 기수 정렬로 처리 (부동소수 비교 정렬 대신)
+    """
+
+    __slots__ = ("records", "_values", "_ranks")
+
+    def __init__(self, records: np.ndarray):
+        self.records = records
+        self._values: Dict[str, np.ndarray] = {}
+        self._ranks: Dict[str, np.ndarray] = {}
+
+    def _column(self, name: str) -> np.ndarray:
+        # BlockSet의 파생 열과 같은 계산식 (x + w // 2, y + h // 2)
+        if name == "cx":
+            return self.records["x"] + self.records["w"] // 2
+        if name == "cy":
+            return self.records["y"] + self.records["h"] // 2
+        return self.records[name]
+
+    def _build(self, name: str) -> None:
+        values, ranks = np.unique(self._column(name), return_inverse=True)
+        rank_dtype = np.uint16 if len(values) <= _RADIX_RANK_LIMIT else np.intp
+        self._values[name] = values
+        self._ranks[name] = ranks.reshape(-1).astype(rank_dtype)
+
+    def ranks(self, name: str) -> np.ndarray:
+        """원본 블록별 좌표 순위 (같은 좌표는 같은 순위)"""
+        if name not in self._ranks:
+            self._build(name)
+        return self._ranks[name]
+
+    def sorted_values(self, name: str) -> np.ndarray:
+        """원본 전체의 정렬된 고유 좌표값"""
+        if name not in self._values:
+            self._build(name)
+        return self._values[name]
+
+    def order(self, blocks: BlockSet, name: str) -> np.ndarray:
+        """view 내 위치를 좌표 오름차순으로 안정 정렬한 배열 (np.argsort(blocks.<name>, kind="stable")과 동일)"""
+        return np.argsort(self.ranks(name)[blocks.index], kind="stable")
+
+
+def spatial_index(blocks: BlockSet) -> SpatialIndex:
+    """view가 속한 이미지의 정렬 인덱스 (같은 원본을 공유하는 view들은 한 번만 생성)"""
+    return blocks.memoize_shared("spatial_index", lambda: SpatialIndex(blocks.records))
+
+
+def order_by(blocks: BlockSet, name: str) -> np.ndarray:
+    """view 내 위치를 좌표(y, cy, x, cx) 오름차순으로 안정 정렬한 배열"""
+    return spatial_index(blocks).order(blocks, name)
@@ -1,32 +1,29 @@
-from typing import List, Dict, Optional
-import logging
-import numpy as np
-
-logger = logging.getLogger(__name__)
-
-
-from typing import List, Dict
+import heapq
+from typing import Dict, List, Optional, Sequence, Union
 import logging
 import numpy as np
+from .block_set import BlockSet, as_block_set
+from .spatial_index import order_by, spatial_index
 
 logger = logging.getLogger(__name__)
 
 #섹션 분리에 쓰일 y 임계값 동적 계산
 def calculate_adaptive_y_threshold(
-    blocks: List[Dict],
+    blocks: Union[BlockSet, Sequence[Dict]],
     fallback: int = 25
 ) -> int:
     if not blocks:
         return fallback
 
-    heights = [block.get("h", 0) for block in blocks if block.get("h", 0) > 0]
-    if not heights:
+    blocks = as_block_set(blocks)
+    heights = blocks.h[blocks.h > 0]
+    if not len(heights):
         return fallback
     avg_height = np.mean(heights)
 
     # 블록에서 이미지 너비/높이 추출
-    image_width = blocks[0].get("image_width", 1000)
-    image_height = blocks[0].get("image_height", 1000)
+    image_width = blocks.image_width if blocks.image_width is not None else 1000
+    image_height = blocks.image_height if blocks.image_height is not None else 1000
 
     # 종횡비 보정
     aspect_ratio = image_height / image_width if image_width > 0 else 1.0
@@ -53,98 +50,143 @@ def calculate_adaptive_y_threshold(
     return threshold
 
 #블록들을 줄 단위로 그룹핑
-def group_blocks_into_lines(blocks: List[Dict], y_tolerance: int) -> List[List[Dict]]:
-    lines: List[List[Dict]] = []
-    sorted_blocks = sorted(blocks, key=lambda b: b["y"] + b.get("h", 0) // 2)
-
-    for block in sorted_blocks:
-        cy = block["y"] + block.get("h", 0) // 2
-        matched = False
-
-        for line in lines:
-            ly = np.mean([b["y"] + b.get("h", 0) // 2 for b in line])
-            if abs(cy - ly) <= y_tolerance:
-                line.append(block)
-                matched = True
-                break
+def group_blocks_into_lines(blocks: Union[BlockSet, Sequence[Dict]], y_tolerance: int) -> List[BlockSet]:
+    blocks = as_block_set(blocks)
+    return blocks.split(_group_line_positions(blocks, y_tolerance))
+
+
+def _group_line_positions(blocks: BlockSet, y_tolerance: int) -> List[np.ndarray]:
+    """
+    y 중심이 기존 줄의 평균 y 중심과 tolerance 이내면 같은 줄로 묶고, 줄마다 x 기준 정렬한 위치 배열 반환
+    """
+    if not blocks:
+        return []
+
+    order = order_by(blocks, "cy")
+    line_of = assign_center_groups(blocks.cy[order].tolist(), y_tolerance)
+    line_count = int(line_of.max()) + 1
+
+    # 줄 순서 → 줄 내 x 순서 (동률은 y 중심 정렬 순서 유지, x는 이미지 단위 순위로 비교)
+    x_ranks = spatial_index(blocks).ranks("x")[blocks.index]
+    grouped = np.lexsort((x_ranks[order], line_of))
+    boundaries = np.cumsum(np.bincount(line_of, minlength=line_count))[:-1]
+    return np.split(order[grouped], boundaries)
+
+
+def assign_center_groups(centers: List[float], tolerance: float) -> np.ndarray:
+    """
+    오름차순 y 중심 목록을 평균 y 중심이 tolerance 이내인 첫 그룹(줄/행)에 배정하고 그룹 번호 배열 반환
 
-        if not matched:
-            lines.append([block])
+    sweep-line: 중심이 오름차순이므로 그룹 평균은 현재 블록보다 위에 있고,
+    평균과의 차이가 tolerance를 넘은 그룹은 이후 블록과도 항상 넘음(평균은 블록이 합류할 때만 바뀜)
+    → 만료된 그룹을 heap에서 제거하고 남은 그룹 중 가장 먼저 만들어진 그룹에 배정 (선형 탐색과 동일)
+    """
+    sums: List[float] = []
+    counts: List[int] = []
+    active: List[int] = []   # 살아있는 그룹 번호 (min-heap)
+    group_of = np.empty(len(centers), dtype=np.intp)
+
+    for i, cy in enumerate(centers):
+        while active and abs(cy - sums[active[0]] / counts[active[0]]) > tolerance:
+            heapq.heappop(active)
+
+        if active:
+            group = active[0]
+            sums[group] += cy
+            counts[group] += 1
+        else:
+            group = len(sums)
+            sums.append(cy)
+            counts.append(1)
+            heapq.heappush(active, group)
+        group_of[i] = group
 
-    return [sorted(line, key=lambda b: b["x"]) for line in lines]
+    return group_of
 
 
 def split_sections_by_y_gap(
-    blocks: List[Dict],
+    blocks: Union[BlockSet, Sequence[Dict]],
     min_section_height: int = 50,
     max_sections: int = 10,
     y_threshold: Optional[int] = None
-) -> List[List[Dict]]:
+) -> List[BlockSet]:
     """
     줄 단위 블록들을 Y 간격 기준으로 섹션으로 분리하며,
     - 종횡비, 해상도 기반 동적 y_threshold 자동 계산 (최초 1회)
-    - 과도한 섹션 분리/병합 방지
+    - 과도한 섹션 분리/병합 방지 (섹션 수가 max_sections를 넘으면 임계값을 1.3배씩 완화)
+
+    줄 그룹핑과 줄 간 중심 간격은 줄 tolerance별로 한 번만 계산하고,
+    임계값 완화 시에는 간격이 임계값 이상인 분리 후보 줄만 다시 확인합니다.
     """
     try:
         if not blocks:
             return []
 
+        blocks = as_block_set(blocks)
+
         # 최초 한 번만 동적 임계값 계산
         if y_threshold is None:
             y_threshold = calculate_adaptive_y_threshold(blocks)
 
-        sections = []
-        current_section = []
-
-        y_tolerance = max(int(y_threshold * 0.51), 10)
-        lines = group_blocks_into_lines(blocks, y_tolerance)
-
-        for i, line in enumerate(lines):
-            if not current_section:
-                current_section.extend(line)
-                continue
-
-            prev_line = lines[i - 1]
-            curr_line = line
-
-            prev_y = np.mean([b["y"] + b.get("h", 0) // 2 for b in prev_line])
-            curr_y = np.mean([b["y"] + b.get("h", 0) // 2 for b in curr_line])
-            y_gap = curr_y - prev_y
-
-            curr_sec_top = current_section[0]["y"]
-            curr_sec_bottom = current_section[-1]["y"] + current_section[-1]["h"]
-            curr_sec_height = curr_sec_bottom - curr_sec_top
-
-            logger.debug(f"[split] 줄 간 중심 간격: {y_gap:.1f}, 기준: {y_threshold}")
-
-            if (
-                y_gap >= y_threshold and
-                curr_sec_height >= min_section_height and
-                len(current_section) >= 3  # 헤더만 따로 분리되는 것 방지
-                ):
-                logger.debug(f"[split] 섹션 분리 발생 (y_gap: {y_gap:.1f}, height: {curr_sec_height:.1f})")
-                sections.append(current_section)
-                current_section = list(line)
-            else:
-                current_section.extend(line)
-
-        if current_section:
-            sections.append(current_section)
-
-        # 섹션 수가 너무 많으면 y_threshold를 1.3배로 늘려 재귀 재시도 (단, threshold는 유지되며 한 단계씩만 증가)
-        if len(sections) > max_sections:
-            new_threshold = int(y_threshold * 1.3)
-            logger.warning(f"[split] 섹션 {len(sections)}개 → 과분할 감지. 임계값 완화 후 재시도 ({new_threshold})")
-            return split_sections_by_y_gap(
-                blocks,
-                min_section_height,
-                max_sections,
-                y_threshold=new_threshold  # ← 증가된 값 유지
-            )
+        ys = blocks.y
+        bottoms = blocks.y + blocks.h
+        layouts: Dict[int, tuple] = {}   # 줄 tolerance → (줄 목록, 줄 간 간격, 누적 블록 수)
+
+        while True:
+            y_tolerance = max(int(y_threshold * 0.51), 10)
+            if y_tolerance not in layouts:
+                layouts[y_tolerance] = _line_layout(blocks, y_tolerance)
+            lines, gaps, cumulative_sizes = layouts[y_tolerance]
+
+            starts = _section_starts(lines, gaps, cumulative_sizes, ys, bottoms, y_threshold, min_section_height)
+            if len(starts) <= max_sections:
+                break
+
+            # 섹션 수가 너무 많으면 y_threshold를 1.3배로 늘려 재시도 (증가된 값 유지)
+            new_threshold = max(int(y_threshold * 1.3), y_threshold + 1)
+            logger.warning(f"[split] 섹션 {len(starts)}개 → 과분할 감지. 임계값 완화 후 재시도 ({new_threshold})")
+            y_threshold = new_threshold
+
+        ends = starts[1:] + [len(lines)]
+        sections = [np.concatenate(lines[start:end]) for start, end in zip(starts, ends)]
 
         logger.info(f"[split] 줄 기반 섹션 분리 완료 - {len(sections)}개 섹션")
-        return sections
+        return blocks.split(sections)
 
     except Exception as e:
         logger.exception("줄 기반 섹션 분리 중 예외 발생")
         raise e
+
+
+def _line_layout(blocks: BlockSet, y_tolerance: int) -> tuple:
+    """줄 그룹핑 결과와 줄 간 중심 간격, 줄 단위 누적 블록 수"""
+    lines = _group_line_positions(blocks, y_tolerance)
+    sizes = np.array([len(line) for line in lines])
+    members = np.concatenate(lines)
+    line_centers = np.add.reduceat(blocks.cy[members], np.concatenate(([0], np.cumsum(sizes)[:-1]))) / sizes
+    cumulative_sizes = np.concatenate(([0], np.cumsum(sizes)))
+    return lines, np.diff(line_centers), cumulative_sizes
+
+
+def _section_starts(lines: List[np.ndarray],
+                    gaps: np.ndarray,
+                    cumulative_sizes: np.ndarray,
+                    ys: np.ndarray,
+                    bottoms: np.ndarray,
+                    y_threshold: int,
+                    min_section_height: int) -> List[int]:
+    """
+    섹션이 시작되는 줄 번호 목록
+
+    줄 i 앞에서 분리되려면 직전 줄과의 중심 간격이 임계값 이상이고, 현재 섹션(시작 줄 ~ i-1)의
+    높이(첫 블록 위 ~ 마지막 블록 아래)와 블록 수(3개 이상, 헤더만 따로 분리되는 것 방지)가 충분해야 함
+    → 간격이 임계값 이상인 후보 줄만 순서대로 확인
+    """
+    starts = [0]
+    for i in np.flatnonzero(gaps >= y_threshold) + 1:
+        start = starts[-1]
+        curr_sec_height = bottoms[lines[i - 1][-1]] - ys[lines[start][0]]
+        if curr_sec_height >= min_section_height and cumulative_sizes[i] - cumulative_sizes[start] >= 3:
+            logger.debug(f"[split] 섹션 분리 발생 (y_gap: {gaps[i - 1]:.1f}, height: {curr_sec_height:.1f})")
+            starts.append(int(i))
+    return starts
@@ -0,0 +1,125 @@
+import binascii
+import json
+import uuid
+import time
+from typing import List, Optional, Tuple
+
+# base64는 3바이트 → 4문자 단위이므로 청크 크기는 3의 배수여야 패딩 없이 이어붙일 수 있음
+BASE64_CHUNK_BYTES = 3 * 64 * 1024
+
+
+def base64_length(raw_length: int) -> int:
+    """원본 바이트 길이에 대한 base64 인코딩 결과 길이"""
+    return 4 * ((raw_length + 2) // 3)
+
+
+def build_ocr_payload(image_data: bytes,
+                      image_format: str,
+                      name: str = "ocr_test",
+                      request_id: Optional[str] = None,
+                      timestamp: Optional[int] = None) -> bytearray:
+    """
+    CLOVA OCR 요청 JSON 본문을 이미지 버퍼 복사 없이 생성 (이미지 1장)
+
+    Args:
+        image_data: 원본 이미지 바이트
+        image_format: 이미지 포맷 (jpg, png 등)
+        name: 이미지 이름 (응답 매칭용)
+        request_id: 요청 ID (없으면 uuid4)
+        timestamp: 요청 시각 ms (없으면 현재 시각)
+
+    Returns:
+        bytearray: 전송 가능한 JSON 본문
+    """
+    return build_batch_ocr_payload([(image_data, image_format, name)], request_id, timestamp)
+
+
+def build_batch_ocr_payload(images: List[Tuple[bytes, str, str]],
+                            request_id: Optional[str] = None,
+                            timestamp: Optional[int] = None) -> bytearray:
+    """
+    여러 이미지를 담은 CLOVA OCR 요청 JSON 본문을 이미지 버퍼 복사 없이 생성
+
+    JSON 조각(이미지별 앞부분, 이미지 사이 구분자, 뒷부분)을 먼저 만들고, 최종 크기만큼
+    미리 할당한 bytearray에 이미지를 청크 단위로 base64 인코딩하여 바로 기록합니다.
+    (base64 문자열 전체 → dict → json.dumps 문자열로 이어지는 중간 사본이 없음)
+
+    Args:
+        images: (이미지 바이트, 포맷, 이름) 목록 - 이름은 응답 매칭에 사용
+        request_id: 요청 ID (없으면 uuid4)
+        timestamp: 요청 시각 ms (없으면 현재 시각)
+
+    Returns:
+        bytearray: 전송 가능한 JSON 본문
+    """
+    heads = [
+        (
+            ('{"images":[' if index == 0 else ',')
+            + '{"format":' + json.dumps(image_format)
+            + ',"name":' + json.dumps(name)
+            + ',"data":"'
+        ).encode("ascii")
+        for index, (_, image_format, name) in enumerate(images)
+    ]
+    tail = (
+        '"}],"requestId":' + json.dumps(request_id or str(uuid.uuid4()))
+        + ',"version":"V2","timestamp":' + str(timestamp if timestamp is not None else int(time.time() * 1000))
+        + '}'
+    ).encode("ascii")
+    image_tail = b'"}'
+
+    total = sum(len(head) for head in heads) + len(tail) + len(image_tail) * (len(images) - 1)
+    total += sum(base64_length(len(image_data)) for image_data, _, _ in images)
+    body = bytearray(total)
+
+    offset = 0
+    for index, ((image_data, _, _), head) in enumerate(zip(images, heads)):
+        if index > 0:
+            body[offset:offset + len(image_tail)] = image_tail
+            offset += len(image_tail)
+        body[offset:offset + len(head)] = head
+        offset += len(head)
+
+        source = memoryview(image_data)
+        for start in range(0, len(source), BASE64_CHUNK_BYTES):
+            encoded = binascii.b2a_base64(source[start:start + BASE64_CHUNK_BYTES], newline=False)
+            body[offset:offset + len(encoded)] = encoded
+            offset += len(encoded)
+
+    body[offset:] = tail
+    return body
+
+
+if __name__ == "__main__":
+    # 기존 방식(임시파일 + b64encode + dict + json.dumps)과 peak 메모리 비교
+    # 사용법: python -m app.board.infra.ocr.ocr_pipeline.payload_builder [바이트 크기]
+    import base64
+    import sys
+    import tracemalloc
+
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 8 * 1024 * 1024
+    image = bytes(range(256)) * (size // 256)
+
+    def legacy_payload(data: bytes) -> bytes:
+        image_base64 = base64.b64encode(data).decode("utf-8")
+        payload = {
+            "images": [{"format": "png", "name": "ocr_test", "data": image_base64}],
+            "requestId": "00000000-0000-0000-0000-000000000000",
+            "version": "V2",
+            "timestamp": 0
+        }
+        return json.dumps(payload).encode("utf-8")
+
+    def streaming_payload(data: bytes) -> bytearray:
+        return build_ocr_payload(data, "png", request_id="00000000-0000-0000-0000-000000000000", timestamp=0)
+
+    assert json.loads(legacy_payload(image)) == json.loads(streaming_payload(image))
+
+    for label, builder in (("legacy", legacy_payload), ("streaming", streaming_payload)):
+        tracemalloc.start()
+        body = builder(image)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{label:>10}: body={len(body) / 1e6:.2f}MB peak={peak / 1e6:.2f}MB "
+              f"({peak / len(image):.2f}x image)")
+        del body
@@ -1,4 +1,5 @@
-from typing import List, Dict
+from typing import List, Dict, Sequence, Union
+from app.board.infra.ocr.ocr_pipeline.layout_analysis.block_set import BlockSet
 from .is_simple_column import is_simple_column
 from .simple_column_post_process import simple_column_post_process
 from .complex_column_post_process import complex_column_post_process
@@ -7,7 +8,7 @@ import logging
 logger = logging.getLogger(__name__)
 
 def column_post_process(
-    section: List[Dict],
+    section: Union[BlockSet, Sequence[Dict]],
     text_join_Delim: str = " ",
     classifier_args: Dict[str, Dict] = {},
     post_process_args: Dict[str, Dict] = {}
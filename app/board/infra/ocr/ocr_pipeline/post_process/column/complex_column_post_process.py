@@ -1,12 +1,14 @@
-from typing import List, Dict
+from typing import List, Dict, Sequence, Union
 from app.board.infra.ocr.ocr_pipeline.classifier.column.cluster_blocks import cluster_blocks_by_x
 from app.board.infra.ocr.ocr_pipeline.classifier.classify_section_type import classify_section_type
 from app.board.infra.ocr.ocr_pipeline.layout_analysis.split_sections import split_sections_by_y_gap
+from app.board.infra.ocr.ocr_pipeline.layout_analysis.block_set import BlockSet, as_block_set
+from app.board.infra.ocr.ocr_pipeline.layout_analysis.section_features import section_features
 import logging
 logger = logging.getLogger(__name__)
 
 def complex_column_post_process(
-    blocks: List[Dict],
+    blocks: Union[BlockSet, Sequence[Dict]],
     classifier: Dict[str, Dict],
     post_process_config: Dict[str, Dict]
 ) -> List[str]:
@@ -21,8 +23,9 @@ def complex_column_post_process(
     logger.debug("[column] 복잡 컬럼 후처리 시작")
     try:
         # 1. x 좌표 기반 컬럼 클러스터링
-        avg_width = sum(b["w"] for b in blocks) / max(len(blocks), 1)
-        section_width = max(b["x"] for b in blocks) - min(b["x"] for b in blocks)
+        blocks = as_block_set(blocks)
+        avg_width = section_features(blocks).avg_width
+        section_width = blocks.x.max() - blocks.x.min()
         x_gap_threshold = min(max(int(avg_width * 1.2), 15), int(section_width * 0.06))
 
         column_bins = cluster_blocks_by_x(blocks, x_gap_threshold)
@@ -1,4 +1,8 @@
-from typing import List, Dict
+from typing import List, Dict, Sequence, Union
+import numpy as np
+from app.board.infra.ocr.ocr_pipeline.layout_analysis.block_set import BlockSet, as_block_set
+from app.board.infra.ocr.ocr_pipeline.layout_analysis.section_features import section_features
+from app.board.infra.ocr.ocr_pipeline.layout_analysis.spatial_index import order_by
 from app.board.infra.ocr.ocr_pipeline.classifier.column.cluster_blocks import cluster_blocks_by_x
 from app.board.infra.ocr.ocr_pipeline.classifier.table.group_rows_by_y import group_rows_by_y
 import logging
@@ -7,18 +11,20 @@ logger = logging.getLogger(__name__)
 
 # 단순한 구조의 컬럼 섹션을 컬럼 단위로 텍스트 복원
 def simple_column_post_process(
-    section: List[Dict],
+    section: Union[BlockSet, Sequence[Dict]],
     text_join_Delim: str
 ) -> List[str]:
 
     logger.debug("[column] 컬럼 후처리 시작")
 
     try:
+        section = as_block_set(section)
+
         # 섹션 내부 블록들의 평균 너비
-        avg_width = sum(b["w"] for b in section) / max(len(section), 1)
+        avg_width = section_features(section).avg_width
 
         # 섹션 전체의 가로 너비
-        section_width = max(b["x"] for b in section) - min(b["x"] for b in section)
+        section_width = section.x.max() - section.x.min()
 
         # 임계값 설정 (x 기준 클러스터링용)
         x_gap_threshold = min(max(int(avg_width * 1.5), 20), int(section_width * 0.1))
@@ -30,7 +36,7 @@ def simple_column_post_process(
         # 2) 각 컬럼 내부를 줄 단위로 묶고, 각 줄은 x 정렬
         columns = []
         for col_blocks in column_bins:
-            avg_height = sum(b["h"] for b in col_blocks) / max(len(col_blocks), 1)
+            avg_height = section_features(col_blocks).avg_height
             y_tolerance = min(max(int(avg_height * 0.6), 10), 40)
             
             # 평균 높이 기반 동적 y_tolerance
@@ -38,8 +44,8 @@ def simple_column_post_process(
 
             row_texts = []
             for row in rows:
-                sorted_row = sorted(row, key=lambda b: b["x"])
-                line = text_join_Delim.join(block["text"].replace("\n", " ").strip() for block in sorted_row)
+                sorted_texts = row.text[order_by(row, "x")]
+                line = text_join_Delim.join(text.replace("\n", " ").strip() for text in sorted_texts)
                 row_texts.append(line)
             column_text = "\n".join(row_texts)  # 줄 단위로 붙이기
             columns.append(column_text)
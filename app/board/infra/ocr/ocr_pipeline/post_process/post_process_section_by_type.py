@@ -1,14 +1,15 @@
 from .table.table_post_process import table_post_process
 from .column.column_post_process import column_post_process
 from .text.text_post_process import text_post_process
-from typing import List, Dict, Union
+from typing import List, Dict, Sequence, Union
+from app.board.infra.ocr.ocr_pipeline.layout_analysis.block_set import BlockSet
 import logging
 
 logger = logging.getLogger(__name__)
 
 # 섹션 타입에 따라 해당 후처리 로직 호출
 def post_process_section_by_type(
-    section: List[Dict],
+    section: Union[BlockSet, Sequence[Dict]],
     section_type: str,
     classifier_config: Dict[str, Dict] = {},
     post_process_config: Dict[str, Dict] = {}
@@ -1,6 +1,8 @@
-from typing import List, Dict
-from .get_block_x_position import get_block_x_position
-from .infer_alignment import infer_alignment
+from typing import Dict, List, Sequence, Union
+from .get_block_x_position import get_x_positions
+from .infer_alignment import infer_alignment_from_columns
+from app.board.infra.ocr.ocr_pipeline.layout_analysis.block_set import BlockSet, as_block_set
+from app.board.infra.ocr.ocr_pipeline.layout_analysis.clustering_1d import SortedCentroids
 import numpy as np
 import logging
 
@@ -8,75 +10,66 @@ logger = logging.getLogger(__name__)
 
 #블록들을 정렬 방식에 맞춰서 열 별로 배치
 def align_blocks_to_columns(
-    rows: List[List[Dict]],
+    rows: Sequence[Union[BlockSet, Sequence[Dict]]],
     x_tolerance: int,
     std_threshold: int,
     max_iterations: int
-) -> List[List[List[Dict]]]:
+) -> List[List[BlockSet]]:
+    """
+    행별 블록을 열 기준 x 좌표에 맞춰 셀로 배치
+
+    Returns:
+        행 → 열 → 셀 블록 (셀 내 블록은 정렬 기준 x 순서, 입력 블록은 변경하지 않음)
+    """
     
     #1) 전체 블록 수집
-    all_blocks = [block for row in rows for block in row]
-
+    rows = [as_block_set(row) for row in rows]
+    all_blocks = rows[0].concat(*rows[1:]) if rows else as_block_set([])
+    xs = all_blocks.x
+    ws = all_blocks.w
 
     #2) 초기의 정렬 기준 X 좌표는 center라고 가정
-    for block in all_blocks:
-        block["aligned_x"] = block["x"] + block["w"] // 2
+    aligned_x = all_blocks.cx.copy()
         
-    column_reps = []
+    column_reps = SortedCentroids([])
     
     for iteration in range(max_iterations):
-        #3) 열의 기준 X 좌표 클러스터링
-        aligned_x_list = sorted(set(block["aligned_x"] for block in all_blocks))
-        new_column_reps = []
-        
-        for x in aligned_x_list:
-            placed = False
-            for i, rep in enumerate(new_column_reps):
-                if abs(rep - x) <= x_tolerance:
-                    new_column_reps[i] = (rep + x) / 2
-                    placed = True
-                    break
-            if not placed:
-                new_column_reps.append(x)
-        
-        #각 열이 어떤 X 좌표 근처에 위치하는지 나타냄
-        new_column_reps = sorted(new_column_reps)
+        #3) 열의 기준 X 좌표 클러스터링 (정렬된 값을 훑으며 인접 기준과 병합 → 기준은 항상 오름차순)
+        new_column_reps = SortedCentroids.merge_values(aligned_x, x_tolerance)
         
         # 열 수 다르면 수렴 검사 skip
-        if column_reps and len(column_reps) == len(new_column_reps):
-            if np.allclose(column_reps, new_column_reps, atol=1e-2):
-                logger.debug(f"[align] {iteration+1}회 반복 후 열 기준 수렴 완료")
-                break
+        if column_reps.is_close(new_column_reps, atol=1e-2):
+            logger.debug(f"[align] {iteration+1}회 반복 후 열 기준 수렴 완료")
+            break
         
         column_reps = new_column_reps
         
-        #4) 열별로 블록 분배
-        col_blocks_map = {i: [] for i in range(len(column_reps))}
-        for block in all_blocks:
-            idx = np.argmin([abs(rep - block["aligned_x"]) for rep in column_reps])
-            col_blocks_map[int(idx)].append(block)
+        #4) 열별로 블록 분배 (정렬된 열 기준에서 searchsorted로 가장 가까운 열)
+        assignment = column_reps.assign(aligned_x)
             
-        #5) 열별 정렬 기준 추론
-        col_alignments = {
-            i : infer_alignment(col_blocks_map[i], std_threshold)
-            for i in col_blocks_map
-        }
-        
-        #6) 정렬 기준에 따라 각 블록의 aligned_x 재계산
-        for block in all_blocks:
-            col_idx = np.argmin([abs(rep - block["aligned_x"]) for rep in column_reps]) 
-            alignment = col_alignments.get(int(col_idx), "center")
-            block["aligned_x"] = get_block_x_position(block, alignment)
+        #5) 열별 정렬 기준 추론 → 6) 정렬 기준에 따라 각 블록의 aligned_x 재계산 (새 배열, 입력 불변)
+        next_aligned_x = np.empty_like(aligned_x)
+        for i in range(len(column_reps)):
+            members = assignment == i
+            alignment = infer_alignment_from_columns(xs[members], ws[members], std_threshold)
+            next_aligned_x[members] = get_x_positions(xs[members], ws[members], alignment)
+        aligned_x = next_aligned_x
     
     #4) 각 행 내의 블록들을 열 기준에 따라 할당
     max_cols = len(column_reps)
+    assignment = column_reps.assign(aligned_x) if max_cols else np.empty(0, dtype=np.intp)
     table = []
+    start = 0
     for row in rows:
-        columns = [[] for _ in range(max_cols)]
-        for block in row:
-            block_x = block["aligned_x"]
-            idx = np.argmin([abs(rep - block_x) for rep in column_reps])
-            columns[idx].append(block)
+        positions = np.arange(start, start + len(row))
+        start += len(row)
+
+        columns = []
+        for col in range(max_cols):
+            cell = positions[assignment[positions] == col]
+            cell = cell[np.argsort(aligned_x[cell], kind="stable")]
+            columns.append(all_blocks.take(cell))
         table.append(columns)
         
     return table
+
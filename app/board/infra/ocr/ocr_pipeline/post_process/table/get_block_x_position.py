@@ -1,4 +1,5 @@
 from typing import Dict
+import numpy as np
 
 def get_block_x_position(block:Dict, alignment:str) -> int:
     if alignment == "left":
@@ -8,4 +9,14 @@ def get_block_x_position(block:Dict, alignment:str) -> int:
     elif alignment == "right":
         return block["x"] + block["w"]
     else:
-        return block["x"] + block["w"] // 2
\ No newline at end of file
+        return block["x"] + block["w"] // 2
+
+
+def get_x_positions(xs: np.ndarray, ws: np.ndarray, alignment: str) -> np.ndarray:
+    """get_block_x_position의 배열 버전"""
+    if alignment == "left":
+        return xs
+    elif alignment == "right":
+        return xs + ws
+    else:
+        return xs + ws // 2
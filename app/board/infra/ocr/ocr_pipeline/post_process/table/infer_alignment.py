@@ -1,17 +1,27 @@
-from typing import List, Dict
+from typing import Dict, Sequence, Union
 import numpy as np
+from app.board.infra.ocr.ocr_pipeline.layout_analysis.block_set import BlockSet, as_block_set
 
 #테이블의 열 별로 정렬 방식 판단
-def infer_alignment(blocks: List[Dict],
+def infer_alignment(blocks: Union[BlockSet, Sequence[Dict]],
                     std_threshold: int
                     ) -> str:
     if not blocks:
         return "unknown"
     
+    blocks = as_block_set(blocks)
+    return infer_alignment_from_columns(blocks.x, blocks.w, std_threshold)
+
+
+def infer_alignment_from_columns(xs: np.ndarray, ws: np.ndarray, std_threshold: int) -> str:
+    """x/w 배열로 정렬 방식 판단 (infer_alignment와 동일 기준)"""
+    if not len(xs):
+        return "unknown"
+
     # 정렬 방식 판단에 필요한 데이터
-    lefts = [block["x"] for block in blocks]
-    centers = [block["x"] + block["w"]// 2 for block in blocks]
-    rights =  [block["x"] + block["w"] for block in blocks]
+    lefts = xs
+    centers = xs + ws // 2
+    rights = xs + ws
     
     stds = {
         "left" : float(np.std(lefts)),
@@ -29,10 +39,10 @@ def infer_alignment(blocks: List[Dict],
     
     # 블록 수가 적으면 분산이 적게 나올 수밖에 없음
     # 더 확실한 정렬 방식 판단을 위함
-    if len(blocks) < 3:
+    if len(xs) < 3:
         if sorted_stds[0][1] - sorted_stds[1][1] > std_threshold:
             return sorted_stds[0][0]
         else:
             return "unknown"
     else:
-        return min_align
\ No newline at end of file
+        return min_align
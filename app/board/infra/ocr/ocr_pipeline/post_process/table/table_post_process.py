@@ -1,20 +1,24 @@
-from typing import List, Dict
+from typing import List, Dict, Sequence, Union
 from app.board.infra.ocr.ocr_pipeline.classifier.table.group_rows_by_y import group_rows_by_y
+from app.board.infra.ocr.ocr_pipeline.layout_analysis.block_set import BlockSet, as_block_set
+from app.board.infra.ocr.ocr_pipeline.layout_analysis.section_features import section_features
 from .align_blocks_to_columns import align_blocks_to_columns
 import logging
 
 logger = logging.getLogger(__name__)
 
 def table_post_process(
-    section: List[Dict],
+    section: Union[BlockSet, Sequence[Dict]],
     max_iterations: int
 ) -> List[List[str]]: 
 
     logger.debug("[table] 테이블 후처리 시작")
 
     try:
-        # 평균 블록 높이 계산
-        avg_height = sum(b["h"] for b in section) / max(len(section), 1)
+        section = as_block_set(section)
+
+        # 평균 블록 높이 (분류 단계에서 계산된 섹션 통계 재사용)
+        avg_height = section_features(section).avg_height
 
         # 임계값 계산
         y_tolerance = min(max(int(avg_height * 0.8), 6), 20)
@@ -38,8 +42,8 @@ def table_post_process(
                 if not cell_blocks:
                     cell_texts.append("")
                     continue
-                sorted_cell = sorted(cell_blocks, key=lambda b: b["aligned_x"])
-                raw_text = " ".join(b["text"] for b in sorted_cell if b.get("text"))
+                # 셀 내 블록은 이미 정렬 기준 x 순서
+                raw_text = " ".join(text for text in cell_blocks.text if text)
                 cleaned_text = raw_text.replace("\n", " ").strip()
                 cell_texts.append(cleaned_text)
             table_lines.append(cell_texts)  #각 행은 리스트로 추가
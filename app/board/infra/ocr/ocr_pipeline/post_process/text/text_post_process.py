@@ -1,34 +1,25 @@
 
-from typing import List, Dict
+from typing import Dict, Sequence, Union
 import logging
+from app.board.infra.ocr.ocr_pipeline.layout_analysis.block_set import BlockSet, as_block_set
 
 logger = logging.getLogger(__name__)
 
-def text_post_process(blocks: List[Dict]) -> str:
+def text_post_process(blocks: Union[BlockSet, Sequence[Dict]]) -> str:
     
     try:
         logger.debug("일반 텍스트 후처리 시작")
 
-        lines = []
-        current_line = []
+        blocks = as_block_set(blocks)
 
-        for block in blocks:  # 이미 정렬된 상태
-            text = block.get("text", "").strip()
-            if not text:
-                continue
-
-            current_line.append(text)
-
-            if block.get("lineBreak", False):
-                lines.append(" ".join(current_line))
-                current_line = []
-
-        if current_line:
-            lines.append(" ".join(current_line))
+        # 이미 정렬된 상태의 블록 텍스트를 공백으로 연결
+        # (기존 구현은 블록에 없는 "lineBreak" 키를 조회해 줄바꿈 없이 한 줄로 이어붙였으므로 출력 형식 유지)
+        texts = (text.strip() for text in blocks.text)
+        line = " ".join(text for text in texts if text)
             
         logger.debug("텍스트 후처리 완료")
 
-        return "\n".join(lines)
+        return line
     except Exception as e:
         logger.error("일반 텍스트 후처리 중 오류 발생", exc_info=True)
-        return "후처리 실패"
\ No newline at end of file
+        return "후처리 실패"
@@ -1,4 +1,4 @@
-from typing import List, Dict, cast
+from typing import Any, List, Dict, cast
 from .layout_analysis.block_extractor import extract_blocks_from_ocr_response
 from .layout_analysis.sorted_block import sort_blocks
 from .layout_analysis.split_sections import split_sections_by_y_gap, calculate_adaptive_y_threshold
@@ -6,16 +6,49 @@ from .layout_analysis.merge_sections.merge_table_like_sections import merge_tabl
 from .layout_analysis.merge_sections.merge_column_like_sections import merge_column_like_sections
 from .classifier.classify_section_type import classify_section_type
 from .post_process.post_process_section_by_type import post_process_section_by_type
+from .stage_timing import stage
 
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 레이아웃 후처리 결과(섹션 분리/판별/후처리)가 바뀌는 변경 시 올림 - 이전 버전으로 캐시된 OCR 텍스트는 원본 응답으로 재생성
+LAYOUT_VERSION = 1
+
 def post_process_pipeline(
     ocr_response: Dict,
     section_classification_config: Dict[str, Dict],
     post_process_config: Dict[str, Dict]
     )-> List[str]:
+    """OCR 응답을 섹션별 후처리 문자열 목록으로 변환"""
+    sections = post_process_sections(ocr_response, section_classification_config, post_process_config)
+    return [section["text"] for section in sections]
+
+
+def post_process_sections(
+    ocr_response: Dict,
+    section_classification_config: Dict[str, Dict],
+    post_process_config: Dict[str, Dict]
+    )-> List[Dict[str, str]]:
+    """OCR 응답을 섹션별 {"type": 섹션 타입, "text": 후처리 문자열} 목록으로 변환"""
+    sections = post_process_structured(ocr_response, section_classification_config, post_process_config)
+    return [{"type": section["type"], "text": section["text"]} for section in sections]
+
+
+def post_process_structured(
+    ocr_response: Dict,
+    section_classification_config: Dict[str, Dict],
+    post_process_config: Dict[str, Dict]
+    )-> List[Dict[str, Any]]:
+    """
+    OCR 응답을 섹션별 후처리 결과 목록으로 변환
+
+    각 섹션은 {"type", "text": 기존 문자열화 결과}이며, 표는 "rows"(행별 셀 목록), 컬럼은 "lines"(줄 목록)를
+    함께 담습니다. (출력 형식별 직렬화는 output_format 참고)
+
+    각 단계(타입별 후처리 포함)는 stage()로 감싸져 있어 단계별 시간이 측정됩니다.
+    (기록기가 활성화된 경우(벤치마크, 레이아웃 워커) 기록기에, 아니면 전역 히스토그램에 기록)
+    """
     
     logger.info("전체 후처리 파이프라인 시작")
     
@@ -23,36 +56,41 @@ def post_process_pipeline(
     # 필요한 정보(bounding box, text, linebreak)를 담아 여러 블록으로 추출    
     
     logger.info("ocr 응답에서 텍스트 블록 추출")
-    blocks = extract_blocks_from_ocr_response(ocr_response)
+    with stage("extract"):
+        blocks = extract_blocks_from_ocr_response(ocr_response)
     logger.info(f"블록 추출 완료 - {len(blocks)}개")
     
     # 2. 블록 정렬 (Y -> X 정렬)
     # Y 우선 정렬, X는 보조
     logger.info("블록 정렬 시작")
-    sorted_blocks = sort_blocks(blocks)
+    with stage("sort"):
+        sorted_blocks = sort_blocks(blocks)
     logger.info("블록 정렬 완료")
     
     # 3. Y 간격 기반 섹션 분리
     logger.info("Y간격 기반 섹션 분리 시작")
-    y_gap_threshold = calculate_adaptive_y_threshold(sorted_blocks)
-    sections = split_sections_by_y_gap(sorted_blocks, y_gap_threshold)
+    with stage("split"):
+        y_gap_threshold = calculate_adaptive_y_threshold(sorted_blocks)
+        sections = split_sections_by_y_gap(sorted_blocks, y_gap_threshold)
     logger.info(f"섹션 분리 완료 - {len(sections)}개 ")
     
     # 3.5 분리된 섹션에서 테이블, 컬럼으로 의심되는 섹션들 병합
     logger.info("테이블/컬럼 병합 시작")
-    sections = merge_table_like_sections(sections)
-    sections = merge_column_like_sections(sections)
+    with stage("merge"):
+        sections = merge_table_like_sections(sections)
+        sections = merge_column_like_sections(sections)
     logger.info(f"병합 후 섹션 수: {len(sections)}개")
     
     # 4. 섹션별 타입 분류
     logger.info("섹션 타입 분류 시작")
     sections_with_type = []
-    for section in sections:
-        section_type = classify_section_type(section, section_classification_config)
-        sections_with_type.append({
-            "blocks": section,
-            "type": section_type
-        })
+    with stage("classify"):
+        for section in sections:
+            section_type = classify_section_type(section, section_classification_config)
+            sections_with_type.append({
+                "blocks": section,
+                "type": section_type
+            })
     logger.info(
         f"타입 분류 완료 - 테이블: {sum(s['type'] == 'table' for s in sections_with_type)}, "
         f"컬럼: {sum(s['type'] == 'column' for s in sections_with_type)}, "
@@ -63,29 +101,37 @@ def post_process_pipeline(
     # 5. 타입별 후처리
     logger.info("섹션별 후처리 시작")
     results = []
-    for idx, section in enumerate(sections_with_type):
-        try:
-            result = post_process_section_by_type(section["blocks"], section["type"], section_classification_config, post_process_config)
-
-            # 후처리 결과 문자열화
-            if section["type"] == "table":
-                # 테이블: 행 단위 줄바꿈 + 열은 탭 또는 파이프(|)로 구분
-                stringified = "\n".join(["\t".join(row) for row in result])
-                results.append(stringified)
-
-            elif section["type"] == "column":
-                # 컬럼: 각 컬럼을 줄 단위로 출력, 컬럼 간에는 빈 줄
-                column_lines = cast(List[str], result)
-                stringified = "\n".join(line.strip() for line in column_lines)
-                results.append(stringified)
-
-            else:
-                # 일반 텍스트 그대로
-                results.append(result)
-        except Exception as e:
-            logger.error(f"섹션 {idx} ({section['type']}) 후처리 실패: {e}", exc_info=True)
-            fallback = " ".join(block["text"].strip() for block in section["blocks"])
-            results.append(fallback)
+    with stage("post_process"):
+        for idx, section in enumerate(sections_with_type):
+            try:
+                with stage(f"post_process.{section['type']}"):
+                    result = post_process_section_by_type(section["blocks"], section["type"], section_classification_config, post_process_config)
+
+                # 후처리 결과 문자열화
+                if section["type"] == "table":
+                    # 테이블: 행 단위 줄바꿈 + 열은 탭 또는 파이프(|)로 구분
+                    stringified = "\n".join(["\t".join(row) for row in result])
+                    structured = {"type": section["type"], "text": stringified}
+                    if isinstance(result, list):
+                        structured["rows"] = result
+                    results.append(structured)
+
+                elif section["type"] == "column":
+                    # 컬럼: 각 컬럼을 줄 단위로 출력, 컬럼 간에는 빈 줄
+                    column_lines = cast(List[str], result)
+                    stringified = "\n".join(line.strip() for line in column_lines)
+                    structured = {"type": section["type"], "text": stringified}
+                    if isinstance(result, list):
+                        structured["lines"] = column_lines
+                    results.append(structured)
+
+                else:
+                    # 일반 텍스트 그대로
+                    results.append({"type": section["type"], "text": result})
+            except Exception as e:
+                logger.error(f"섹션 {idx} ({section['type']}) 후처리 실패: {e}", exc_info=True)
+                fallback = " ".join(text.strip() for text in section["blocks"].text)
+                results.append({"type": section["type"], "text": fallback})
 
     logger.info("전체 후처리 완료")
     return results
@@ -0,0 +1,200 @@
+import io
+import os
+import logging
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+try:
+    from PIL import Image, ImageChops, ImageOps
+except ImportError:  # Pillow 미설치 시 전처리 없이 원본 전송
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+# 전처리 설정 (환경변수)
+OCR_TARGET_MAX_WIDTH = int(os.getenv("OCR_TARGET_MAX_WIDTH", "1600"))        # 축소 기준 가로 폭 (px)
+OCR_TARGET_MAX_PIXELS = int(os.getenv("OCR_TARGET_MAX_PIXELS", "16000000"))  # 축소 후 최대 픽셀 수
+OCR_JPEG_QUALITY = int(os.getenv("OCR_JPEG_QUALITY", "88"))
+OCR_CROP_MARGIN = int(os.getenv("OCR_CROP_MARGIN", "8"))                     # 여백 자르기 후 남길 여유 (px)
+
+# CLOVA OCR이 받는 포맷
+CLOVA_SUPPORTED_FORMATS = {"jpg", "jpeg", "png", "pdf", "tif", "tiff"}
+
+
+@dataclass
+class PreprocessedImage:
+    """OCR 업로드용으로 전처리된 이미지와 원본 좌표 복원 정보"""
+    data: bytes
+    format: str
+    original_width: Optional[int] = None
+    original_height: Optional[int] = None
+    scale: float = 1.0       # 전처리 이미지 / 원본 (크롭 후 기준)
+    offset_x: int = 0        # 원본 이미지 기준 크롭 시작 x
+    offset_y: int = 0        # 원본 이미지 기준 크롭 시작 y
+    width: Optional[int] = None   # 전처리 이미지 크기
+    height: Optional[int] = None
+
+    @property
+    def is_transformed(self) -> bool:
+        return self.scale != 1.0 or self.offset_x != 0 or self.offset_y != 0
+
+
+def sniff_image_format(data: bytes) -> Optional[str]:
+    """
+    매직 바이트로 실제 이미지 포맷 판별 (URL 확장자에 의존하지 않음)
+    """
+    header = bytes(data[:12])
+    if header.startswith(b"\xff\xd8\xff"):
+        return "jpg"
+    if header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
+    if header.startswith(b"%PDF"):
+        return "pdf"
+    if header.startswith(b"II*\x00") or header.startswith(b"MM\x00*"):
+        return "tiff"
+    if header.startswith(b"GIF87a") or header.startswith(b"GIF89a"):
+        return "gif"
+    if header.startswith(b"RIFF") and header[8:12] == b"WEBP":
+        return "webp"
+    if header.startswith(b"BM"):
+        return "bmp"
+    return None
+
+
+def preprocess_image(data: bytes,
+                     fallback_format: str = "jpg",
+                     max_width: int = OCR_TARGET_MAX_WIDTH,
+                     max_pixels: int = OCR_TARGET_MAX_PIXELS,
+                     jpeg_quality: int = OCR_JPEG_QUALITY) -> PreprocessedImage:
+    """
+    OCR 업로드 전 이미지 전처리
+
+    1. 매직 바이트로 포맷 판별
+    2. 단색 여백 자르기
+    3. 가로 폭/전체 픽셀 수 기준으로 축소 (확대는 하지 않음)
+    4. JPEG 재압축 + 메타데이터(EXIF 등) 제거
+
+    결과가 원본보다 크고 변형도 없으면 원본을 그대로 사용합니다.
+    PDF나 Pillow 미설치 환경에서는 포맷 판별만 수행합니다.
+    """
+    sniffed = sniff_image_format(data) or fallback_format
+    passthrough = PreprocessedImage(data=data, format=sniffed)
+
+    if Image is None or sniffed == "pdf":
+        return passthrough
+
+    try:
+        with Image.open(io.BytesIO(data)) as opened:
+            source_width, source_height = opened.size
+            # JPEG은 디코딩 단계에서 미리 축소 (요청 크기 이상으로만 줄어듦)
+            opened.draft("RGB", (max_width, max(1, source_height * max_width // source_width)))
+            image = ImageOps.exif_transpose(opened)
+
+            # EXIF 회전으로 가로/세로가 바뀐 경우 원본 크기도 회전 기준으로 맞춤
+            rotated = image.size == (opened.height, opened.width) and opened.width != opened.height
+            original_width, original_height = (source_height, source_width) if rotated else (source_width, source_height)
+            image = _to_rgb(image)
+
+        draft_scale = image.width / original_width
+
+        # 단색 여백 자르기
+        crop_box = _content_bbox(image)
+        if crop_box is not None:
+            image = image.crop(crop_box)
+
+        # 축소 비율 계산
+        scale = min(1.0, max_width / image.width, (max_pixels / (image.width * image.height)) ** 0.5)
+        if scale < 1.0:
+            new_size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+            image = image.resize(new_size, Image.LANCZOS)
+
+        buffer = io.BytesIO()
+        image.save(buffer, format="JPEG", quality=jpeg_quality, optimize=True)
+        encoded = buffer.getvalue()
+    except Exception as e:
+        logger.warning(f"이미지 전처리 실패 - 원본 사용: {e}")
+        return passthrough
+
+    total_scale = draft_scale * scale
+    offset_x = round(crop_box[0] / draft_scale) if crop_box else 0
+    offset_y = round(crop_box[1] / draft_scale) if crop_box else 0
+
+    result = PreprocessedImage(
+        data=encoded,
+        format="jpg",
+        original_width=original_width,
+        original_height=original_height,
+        scale=total_scale,
+        offset_x=offset_x,
+        offset_y=offset_y,
+        width=image.width,
+        height=image.height,
+    )
+
+    # 변형이 없고 재압축 이득도 없으면 원본 사용 (EXIF 회전이 필요한 이미지는 제외)
+    if not result.is_transformed and not rotated and len(encoded) >= len(data) and sniffed in CLOVA_SUPPORTED_FORMATS:
+        passthrough.original_width, passthrough.original_height = original_width, original_height
+        passthrough.width, passthrough.height = original_width, original_height
+        return passthrough
+
+    logger.debug(
+        f"이미지 전처리 완료: {original_width}x{original_height} {sniffed} {len(data)}B → "
+        f"{image.width}x{image.height} jpg {len(encoded)}B (scale={total_scale:.3f}, offset=({offset_x},{offset_y}))"
+    )
+    return result
+
+
+def restore_ocr_coordinates(ocr_response: Dict, preprocessed: PreprocessedImage) -> Dict:
+    """
+    전처리 이미지 기준 OCR 좌표를 원본 이미지 좌표로 복원 (in-place)
+
+    레이아웃 단계의 픽셀 기준 임계값이 원본 해상도 기준이므로 반드시 복원해야 합니다.
+    """
+    if not preprocessed.is_transformed:
+        return ocr_response
+
+    inverse = 1.0 / preprocessed.scale
+    for image_info in ocr_response.get("images", []):
+        for field in image_info.get("fields", []):
+            for vertex in field.get("boundingPoly", {}).get("vertices", []):
+                vertex["x"] = vertex.get("x", 0) * inverse + preprocessed.offset_x
+                vertex["y"] = vertex.get("y", 0) * inverse + preprocessed.offset_y
+
+        if preprocessed.original_width and preprocessed.original_height:
+            image_info["convertedImageInfo"] = {
+                **image_info.get("convertedImageInfo", {}),
+                "width": preprocessed.original_width,
+                "height": preprocessed.original_height,
+            }
+
+    return ocr_response
+
+
+def _to_rgb(image):
+    """투명 배경은 흰색으로 합성하고 RGB 또는 흑백(L)으로 변환"""
+    if image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info):
+        rgba = image.convert("RGBA")
+        background = Image.new("RGB", rgba.size, (255, 255, 255))
+        background.paste(rgba, mask=rgba.getchannel("A"))
+        return background
+    if image.mode in ("L", "RGB"):
+        return image
+    return image.convert("RGB")
+
+
+def _content_bbox(image) -> Optional[tuple]:
+    """좌상단 픽셀과 같은 색의 균일한 여백을 제외한 내용 영역 (여백이 없으면 None)"""
+    background = Image.new(image.mode, image.size, image.getpixel((0, 0)))
+    diff = ImageChops.difference(image, background).convert("L").point(lambda v: 255 if v > 16 else 0)
+    bbox = diff.getbbox()
+    if bbox is None:
+        return None
+
+    left = max(0, bbox[0] - OCR_CROP_MARGIN)
+    top = max(0, bbox[1] - OCR_CROP_MARGIN)
+    right = min(image.width, bbox[2] + OCR_CROP_MARGIN)
+    bottom = min(image.height, bbox[3] + OCR_CROP_MARGIN)
+
+    if (left, top, right, bottom) == (0, 0, image.width, image.height):
+        return None
+    return left, top, right, bottom
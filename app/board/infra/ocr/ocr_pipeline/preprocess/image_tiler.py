@@ -0,0 +1,118 @@
+import io
+import os
+import copy
+import logging
+from typing import Dict, List, Tuple
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow 미설치 시 타일 분할 없이 한 번에 OCR
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+# 타일 분할 설정 (전처리 이미지 픽셀 기준)
+OCR_TILE_MAX_HEIGHT = int(os.getenv("OCR_TILE_MAX_HEIGHT", "2400"))   # 타일 최대 높이
+OCR_TILE_OVERLAP = int(os.getenv("OCR_TILE_OVERLAP", "160"))          # 인접 타일 겹침 (최대 글자 줄 높이의 2배 이상)
+OCR_TILE_MIN_ASPECT = float(os.getenv("OCR_TILE_MIN_ASPECT", "2.0"))  # 세로/가로 비율이 이 이상일 때만 분할
+OCR_TILE_JPEG_QUALITY = int(os.getenv("OCR_TILE_JPEG_QUALITY", "90"))
+
+# 타일 경계에 닿은 필드는 잘린 글자로 간주 (이웃 타일에 온전히 있음)
+_EDGE_EPSILON = 2
+
+
+def plan_tiles(width: int, height: int,
+               max_height: int = OCR_TILE_MAX_HEIGHT,
+               overlap: int = OCR_TILE_OVERLAP,
+               min_aspect: float = OCR_TILE_MIN_ASPECT) -> List[Tuple[int, int]]:
+    """
+    세로로 긴 이미지를 겹치는 타일 구간 [(top, bottom), ...]으로 분할
+
+    분할이 필요 없으면 빈 리스트를 반환합니다.
+    """
+    if Image is None or not width or not height:
+        return []
+    if height <= max_height or height < width * min_aspect or overlap >= max_height:
+        return []
+
+    stride = max_height - overlap
+    count = -(-(height - overlap) // stride)  # ceil
+    # 타일 높이를 균등하게 맞춰 마지막 타일이 너무 작아지지 않게 함
+    tile_height = -(-(height + (count - 1) * overlap) // count)
+    stride = tile_height - overlap
+
+    spans = []
+    for index in range(count):
+        top = index * stride
+        bottom = min(height, top + tile_height)
+        if index == count - 1:
+            bottom = height
+        spans.append((top, bottom))
+    return spans
+
+
+def crop_tiles(image_data: bytes, spans: List[Tuple[int, int]],
+               jpeg_quality: int = OCR_TILE_JPEG_QUALITY) -> List[bytes]:
+    """타일 구간별로 이미지를 잘라 JPEG 바이트 목록으로 반환"""
+    tiles = []
+    with Image.open(io.BytesIO(image_data)) as image:
+        image = image.convert("RGB") if image.mode not in ("RGB", "L") else image
+        for top, bottom in spans:
+            buffer = io.BytesIO()
+            image.crop((0, top, image.width, bottom)).save(buffer, format="JPEG", quality=jpeg_quality)
+            tiles.append(buffer.getvalue())
+    return tiles
+
+
+def stitch_tile_responses(responses: List[Dict], spans: List[Tuple[int, int]],
+                          width: int, height: int) -> Dict:
+    """
+    타일별 OCR 응답을 하나의 응답으로 합성
+
+    - 각 필드의 y 좌표를 타일 시작 위치만큼 이동
+    - 겹침 구간 중복 제거: 내부 경계에 닿은(잘린) 필드는 버리고,
+      나머지는 중심 y가 해당 타일의 소유 구간(겹침의 중앙선 기준)에 있을 때만 채택
+    - convertedImageInfo는 전체 이미지 크기로 설정
+    """
+    fields = []
+    last = len(spans) - 1
+
+    for index, (response, (top, bottom)) in enumerate(zip(responses, spans)):
+        own_top = top if index == 0 else (top + spans[index - 1][1]) / 2
+        own_bottom = bottom if index == last else (bottom + spans[index + 1][0]) / 2
+
+        for image_info in response.get("images", []):
+            for field in image_info.get("fields", []):
+                vertices = field.get("boundingPoly", {}).get("vertices", [])
+                if not vertices:
+                    continue
+                ys = [vertex.get("y", 0) for vertex in vertices]
+
+                # 내부 경계에서 잘린 필드
+                if index > 0 and min(ys) <= _EDGE_EPSILON:
+                    continue
+                if index < last and max(ys) >= (bottom - top) - _EDGE_EPSILON:
+                    continue
+
+                center_y = top + (min(ys) + max(ys)) / 2
+                if not (own_top <= center_y < own_bottom):
+                    continue
+
+                rebased = copy.deepcopy(field)
+                for vertex in rebased["boundingPoly"]["vertices"]:
+                    vertex["y"] = vertex.get("y", 0) + top
+                fields.append(rebased)
+
+    # 단일 OCR 결과와 같은 읽기 순서(위→아래)가 되도록 타일 순서를 유지한 채 합침
+    base_image = copy.deepcopy(responses[0]["images"][0]) if responses and responses[0].get("images") else {}
+    base_image["fields"] = fields
+    base_image["convertedImageInfo"] = {
+        **base_image.get("convertedImageInfo", {}),
+        "width": width,
+        "height": height,
+    }
+
+    stitched = {key: value for key, value in responses[0].items() if key != "images"} if responses else {}
+    stitched["images"] = [base_image]
+    logger.debug(f"타일 OCR 결과 합성: {len(spans)}개 타일 → 필드 {len(fields)}개")
+    return stitched
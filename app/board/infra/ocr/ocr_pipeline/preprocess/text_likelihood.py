@@ -0,0 +1,173 @@
+import io
+import os
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow 미설치 시 바이트 크기 검사만 수행
+    Image = None
+
+from .image_preprocessor import sniff_image_format
+
+logger = logging.getLogger(__name__)
+
+# OCR 전 텍스트 포함 가능성 검사 설정 (환경변수)
+# 기본 꺼짐 - 보관된 실제 이미지로 text_gate_eval을 돌려 임계값을 검증한 뒤 켭니다
+OCR_TEXT_GATE_ENABLED = os.getenv("OCR_TEXT_GATE_ENABLED", "false").lower() == "true"
+OCR_GATE_MIN_BYTES = int(os.getenv("OCR_GATE_MIN_BYTES", "3072"))              # 이보다 작은 파일은 아이콘/구분선
+OCR_GATE_MIN_SIDE = int(os.getenv("OCR_GATE_MIN_SIDE", "100"))                 # 짧은 변 최소 길이 (px)
+OCR_GATE_MAX_ASPECT = float(os.getenv("OCR_GATE_MAX_ASPECT", "8.0"))           # 가로/세로 비 상한 (가로로 긴 띠 배너/구분선)
+OCR_GATE_MIN_EDGE_DENSITY = float(os.getenv("OCR_GATE_MIN_EDGE_DENSITY", "0.015"))  # 썸네일 에지 픽셀 비율 하한
+OCR_GATE_MIN_CONTRAST = float(os.getenv("OCR_GATE_MIN_CONTRAST", "6.0"))       # 썸네일 밝기 표준편차 하한 (단색 이미지)
+
+# 에지 밀도 계산용 썸네일의 짧은 변 길이(= 띠 길이)와 에지 판정 밝기 차이
+THUMBNAIL_SIZE = 160
+EDGE_THRESHOLD = 48
+# 썸네일 긴 변 상한 (띠 수 상한 = THUMBNAIL_MAX_STRIPS)
+THUMBNAIL_MAX_STRIPS = 64
+
+
+@dataclass
+class TextLikelihood:
+    """OCR 전 검사 결과 (likely가 False이면 reason에 건너뛴 이유)"""
+    likely: bool
+    reason: Optional[str] = None
+    byte_size: int = 0
+    width: Optional[int] = None
+    height: Optional[int] = None
+    edge_density: Optional[float] = None
+    contrast: Optional[float] = None
+
+
+def edge_density(gray: np.ndarray, threshold: int = EDGE_THRESHOLD) -> float:
+    """흑백 썸네일에서 가로/세로 인접 픽셀 밝기 차이가 threshold를 넘는 픽셀 비율 (글자 획이 많을수록 큼)"""
+    if gray.shape[0] < 2 or gray.shape[1] < 2:
+        return 0.0
+    gray = gray.astype(np.int16)
+    horizontal = np.abs(np.diff(gray, axis=1))[:-1, :] > threshold
+    vertical = np.abs(np.diff(gray, axis=0))[:, :-1] > threshold
+    return float((horizontal | vertical).mean())
+
+
+def thumbnail_size(width: int, height: int) -> tuple:
+    """
+    짧은 변을 THUMBNAIL_SIZE로 맞춘 썸네일 크기 (확대하지 않음)
+
+    긴 변 기준으로 줄이면 세로로 긴 공지는 글자가 1px 이하로 뭉개지므로 짧은 변 기준으로 줄이고,
+    긴 변이 THUMBNAIL_SIZE * THUMBNAIL_MAX_STRIPS를 넘으면 그 길이에 맞춥니다.
+    """
+    scale = min(1.0, THUMBNAIL_SIZE / max(min(width, height), 1),
+                THUMBNAIL_SIZE * THUMBNAIL_MAX_STRIPS / max(width, height, 1))
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def iter_strips(gray: np.ndarray, strip: int = THUMBNAIL_SIZE):
+    """썸네일을 긴 변 방향으로 strip px 단위 띠로 나눔 (짧은 마지막 띠는 앞 띠에 합침)"""
+    axis = 0 if gray.shape[0] >= gray.shape[1] else 1
+    length = gray.shape[axis]
+    starts = list(range(0, max(length - strip, 0) + 1, strip)) or [0]
+    for index, start in enumerate(starts):
+        end = length if index == len(starts) - 1 else start + strip
+        yield gray[start:end] if axis == 0 else gray[:, start:end]
+
+
+def assess_text_likelihood(image_data: bytes,
+                           min_bytes: int = OCR_GATE_MIN_BYTES,
+                           min_side: int = OCR_GATE_MIN_SIDE,
+                           max_aspect: float = OCR_GATE_MAX_ASPECT,
+                           min_edge_density: float = OCR_GATE_MIN_EDGE_DENSITY,
+                           min_contrast: float = OCR_GATE_MIN_CONTRAST) -> TextLikelihood:
+    """
+    이미지에 OCR할 텍스트가 있을 가능성 검사 (CLOVA 호출 전, 수 ms)
+
+    바이트 크기 → 크기/가로세로 비 → 썸네일 밝기 대비 → 에지 밀도 순으로 검사하여
+    로고, 구분선, 장식용 배너, 글자 없는 사진을 걸러냅니다. 판단할 수 없으면(PDF, 디코딩 실패) OCR 대상으로 둡니다.
+    밝기 대비와 에지 밀도는 썸네일을 정사각형 띠로 나눠 띠별로 계산하며, 어느 한 띠라도 기준을 넘으면 통과합니다
+    (세로로 긴 포스터에서 글자가 있는 구간이 여백에 희석되지 않도록). 결과에는 가장 높은 띠의 값을 기록합니다.
+    """
+    result = TextLikelihood(likely=True, byte_size=len(image_data))
+    if len(image_data) < min_bytes:
+        result.likely, result.reason = False, "too_few_bytes"
+        return result
+    if Image is None or sniff_image_format(image_data) == "pdf":
+        return result
+
+    try:
+        with Image.open(io.BytesIO(image_data)) as image:
+            result.width, result.height = image.size
+            if min(image.size) < min_side:
+                result.likely, result.reason = False, "too_small"
+                return result
+            if image.size[0] / max(image.size[1], 1) > max_aspect:
+                result.likely, result.reason = False, "extreme_aspect"
+                return result
+
+            size = thumbnail_size(*image.size)
+            image.draft("L", (size[0] * 2, size[1] * 2))
+            thumbnail = image.convert("L")
+            thumbnail.thumbnail(size)
+            gray = np.asarray(thumbnail)
+    except Exception as e:
+        logger.debug(f"텍스트 가능성 검사 중 디코딩 실패 - OCR 대상으로 처리: {e}")
+        return result
+
+    contrasts, densities = [], []
+    for strip in iter_strips(gray):
+        contrast = float(strip.std())
+        contrasts.append(contrast)
+        if contrast >= min_contrast:
+            density = edge_density(strip)
+            densities.append(density)
+            if density >= min_edge_density:
+                result.contrast, result.edge_density = contrast, density
+                return result
+
+    result.contrast = max(contrasts)
+    if not densities:
+        result.likely, result.reason = False, "low_contrast"
+        return result
+    result.edge_density = max(densities)
+    result.likely, result.reason = False, "low_edge_density"
+    return result
+
+
+class TextLikelihoodGate:
+    """
+    OCR 전 텍스트 가능성 검사기 - 검사 수와 건너뛴 이유별 횟수를 기록
+
+    enabled가 False이면 모든 이미지를 OCR 대상으로 통과시킵니다.
+    """
+
+    def __init__(self, enabled: bool = OCR_TEXT_GATE_ENABLED, **thresholds: Any):
+        self.enabled = enabled
+        self.thresholds = thresholds
+        self._checked = 0
+        self._skipped: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def check(self, image_data: bytes) -> TextLikelihood:
+        if not self.enabled:
+            return TextLikelihood(likely=True, byte_size=len(image_data))
+
+        result = assess_text_likelihood(image_data, **self.thresholds)
+        with self._lock:
+            self._checked += 1
+            if not result.likely:
+                self._skipped[result.reason] = self._skipped.get(result.reason, 0) + 1
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            skipped = dict(self._skipped)
+            checked = self._checked
+        return {
+            "enabled": self.enabled,
+            "checked": checked,
+            "skipped": sum(skipped.values()),
+            "skipped_by_reason": skipped,
+        }
@@ -0,0 +1,162 @@
+import bisect
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+# 현재 실행 흐름에서 활성화된 단계 기록기 (없으면 단계 시간은 전역 히스토그램에 기록)
+_active_recorder: ContextVar[Optional["StageRecorder"]] = ContextVar("ocr_stage_recorder", default=None)
+# 현재 처리 중인 게시판 라벨 (히스토그램 구분용)
+_board_label: ContextVar[str] = ContextVar("ocr_stage_board", default="unknown")
+
+# 히스토그램 버킷 상한(ms) - 블록 정렬(1ms 미만)부터 CLOVA/GPT 왕복(수십 초)까지
+HISTOGRAM_BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+
+class StageRecorder:
+    """
+    후처리 파이프라인 단계(추출/정렬/분리/병합/분류/후처리)별 소요 시간과 메모리 할당 기록
+
+    trace_memory가 True이면 tracemalloc으로 단계별 최대 추가 할당량(peak - 시작 시점 사용량)을 함께 기록합니다.
+    (tracemalloc은 실행 속도를 크게 떨어뜨리므로 시간 측정과 분리하여 사용)
+    """
+
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.timings_ms: Dict[str, List[float]] = {}
+        self.peak_bytes: Dict[str, List[int]] = {}
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings_ms.setdefault(name, []).append((time.perf_counter() - started) * 1000)
+            if tracing:
+                _, peak = tracemalloc.get_traced_memory()
+                self.peak_bytes.setdefault(name, []).append(max(0, peak - baseline))
+
+
+class StageHistograms:
+    """
+    (게시판, 단계)별 소요 시간 히스토그램
+
+    고정 버킷 개수만 누적하므로 요청 수와 관계없이 메모리가 일정합니다.
+    """
+
+    def __init__(self, buckets_ms: Tuple[float, ...] = HISTOGRAM_BUCKETS_MS):
+        self.buckets_ms = tuple(buckets_ms)
+        self._series: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, board: str, name: str, elapsed_ms: float) -> None:
+        """단계 1회 소요 시간(ms) 기록"""
+        bucket = bisect.bisect_left(self.buckets_ms, elapsed_ms)
+        with self._lock:
+            series = self._series.get((board, name))
+            if series is None:
+                series = {"count": 0, "sum_ms": 0.0, "max_ms": 0.0, "buckets": [0] * (len(self.buckets_ms) + 1)}
+                self._series[(board, name)] = series
+            series["count"] += 1
+            series["sum_ms"] += elapsed_ms
+            series["buckets"][bucket] += 1
+            if elapsed_ms > series["max_ms"]:
+                series["max_ms"] = elapsed_ms
+
+    def observe_many(self, board: str, timings_ms: Dict[str, List[float]]) -> None:
+        """다른 프로세스(레이아웃 워커)에서 측정한 단계 시간 일괄 기록"""
+        for name, samples in timings_ms.items():
+            for elapsed_ms in samples:
+                self.observe(board, name, elapsed_ms)
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """게시판 → 단계 → 누적 통계, 버킷별 누적 개수(le), 버킷 기준 p50/p95 추정값"""
+        with self._lock:
+            series = {key: {**value, "buckets": list(value["buckets"])} for key, value in self._series.items()}
+
+        boards: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for (board, name), value in sorted(series.items()):
+            count = value["count"]
+            cumulative, running = {}, 0
+            for bound, bucket_count in zip(self.buckets_ms + ("+Inf",), value["buckets"]):
+                running += bucket_count
+                cumulative[str(bound)] = running
+            boards.setdefault(board, {})[name] = {
+                "count": count,
+                "avg_ms": round(value["sum_ms"] / count, 3) if count else 0.0,
+                "max_ms": round(value["max_ms"], 3),
+                "p50_ms": self._quantile_bound(value["buckets"], count, 0.50, value["max_ms"]),
+                "p95_ms": self._quantile_bound(value["buckets"], count, 0.95, value["max_ms"]),
+                "buckets": cumulative,
+            }
+        return boards
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def _quantile_bound(self, buckets: List[int], count: int, q: float, max_ms: float) -> float:
+        """q 백분위수가 속한 버킷의 상한 (마지막 버킷이면 최댓값)"""
+        if not count:
+            return 0.0
+        target, running = q * count, 0
+        for bound, bucket_count in zip(self.buckets_ms, buckets):
+            running += bucket_count
+            if running >= target:
+                return round(float(min(bound, max_ms)), 3)
+        return round(max_ms, 3)
+
+
+# 운영 중 단계 시간 집계 (/metrics/stages)
+stage_histograms = StageHistograms()
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """
+    파이프라인 단계 구간
+
+    활성화된 기록기가 있으면(벤치마크, 레이아웃 워커) 기록기에, 없으면 현재 게시판 라벨로 전역 히스토그램에 기록합니다.
+    """
+    recorder = _active_recorder.get()
+    if recorder is not None:
+        with recorder.measure(name):
+            yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        stage_histograms.observe(_board_label.get(), name, (time.perf_counter() - started) * 1000)
+
+
+@contextmanager
+def recording(recorder: StageRecorder) -> Iterator[StageRecorder]:
+    """이 구간에서 실행되는 파이프라인 단계를 recorder에 기록"""
+    token = _active_recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _active_recorder.reset(token)
+
+
+@contextmanager
+def board_context(board: Union[int, str, None]) -> Iterator[None]:
+    """이 구간에서 측정되는 단계 시간을 board 라벨로 집계"""
+    token = _board_label.set("unknown" if board is None else str(board))
+    try:
+        yield
+    finally:
+        _board_label.reset(token)
+
+
+def current_board() -> str:
+    return _board_label.get()
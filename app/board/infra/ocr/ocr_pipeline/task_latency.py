@@ -0,0 +1,53 @@
+import threading
+from collections import deque
+from typing import Any, Deque, Dict
+
+
+class TaskLatencyMetrics:
+    """
+    작업 지연 시간 메트릭 (제출 → 결과 수신, 큐 대기 포함)
+
+    누적 작업 수/평균/최대와 최근 샘플 기준 백분위수를 제공합니다.
+    최근 샘플은 고정 크기 버퍼에만 보관하므로 메모리가 늘어나지 않습니다.
+    """
+
+    def __init__(self, max_samples: int = 1024):
+        self._samples: Deque[float] = deque(maxlen=max_samples)
+        self._count = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, elapsed_ms: float) -> None:
+        """작업 1건 소요 시간(ms) 기록"""
+        with self._lock:
+            self._samples.append(elapsed_ms)
+            self._count += 1
+            self._total_ms += elapsed_ms
+            if elapsed_ms > self._max_ms:
+                self._max_ms = elapsed_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        """누적 통계와 최근 샘플 기준 백분위수 반환"""
+        with self._lock:
+            samples = sorted(self._samples)
+            count = self._count
+            total_ms = self._total_ms
+            max_ms = self._max_ms
+
+        return {
+            "tasks": count,
+            "task_avg_ms": round(total_ms / count, 3) if count else 0.0,
+            "task_max_ms": round(max_ms, 3),
+            "task_p50_ms": round(self._percentile(samples, 0.50), 3),
+            "task_p95_ms": round(self._percentile(samples, 0.95), 3),
+            "task_p99_ms": round(self._percentile(samples, 0.99), 3),
+        }
+
+    @staticmethod
+    def _percentile(sorted_samples, q: float) -> float:
+        """정렬된 샘플에서 nearest-rank 백분위수 계산"""
+        if not sorted_samples:
+            return 0.0
+        index = min(len(sorted_samples) - 1, max(0, int(round(q * len(sorted_samples))) - 1))
+        return sorted_samples[index]
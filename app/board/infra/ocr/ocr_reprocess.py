@@ -0,0 +1,173 @@
+"""
+보관된 원본 CLOVA 응답으로 OCR 후처리/사진 요약 재실행 (OCR 재호출 없음)
+
+레이아웃 후처리(post_process_pipeline)나 요약 프롬프트를 고친 뒤 과거 사진에 다시 적용할 때 사용합니다.
+후처리는 레이아웃 워커 풀에서, 요약은 --concurrency 개씩 동시에 실행합니다.
+기본은 결과만 보고하며(dry run), --write를 주면 보관소의 OCR 텍스트와 DB의 사진 요약(post_picture.picture_summary)을 갱신합니다.
+
+사용법:
+    python -m app.board.infra.ocr.ocr_reprocess [--summarize] [--write] [--url URL ...] [--since YYYY-MM-DD]
+                                                [--limit N] [--output result.jsonl]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from app.board.domain.post_picture import PostPicture
+from .layout_worker_pool import LayoutWorkerPool
+from .ocr_pipeline.output_format import OCR_OUTPUT_FORMAT
+from .ocr_response_archive import ArchivedOCRResponse, OCRResponseArchive, OCR_ARCHIVE_PATH
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReprocessResult:
+    """사진 1장의 재처리 결과 (실패 시 error)"""
+    url: str
+    old_text: str
+    new_text: Optional[str] = None
+    picture_summary: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def changed(self) -> bool:
+        return self.new_text is not None and self.new_text != self.old_text
+
+    def to_dict(self) -> dict:
+        return {
+            "url": self.url,
+            "changed": self.changed,
+            "old_text": self.old_text,
+            "new_text": self.new_text,
+            "picture_summary": self.picture_summary,
+            "error": self.error,
+        }
+
+
+class OcrReprocessor:
+    """보관된 응답 묶음을 후처리하고 (선택) 사진 요약까지 다시 생성"""
+
+    def __init__(self, layout_pool: Optional[LayoutWorkerPool] = None, summary_adapter=None, concurrency: int = 4):
+        self.layout_pool = layout_pool or LayoutWorkerPool()
+        # 요약 어댑터가 없으면 후처리만 수행
+        self.summary_adapter = summary_adapter
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def reprocess(self, records: List[ArchivedOCRResponse]) -> List[ReprocessResult]:
+        texts = await self.layout_pool.run_many([record.ocr_response for record in records])
+        results = []
+        for record, text in zip(records, texts):
+            if isinstance(text, Exception):
+                results.append(ReprocessResult(record.url, record.ocr_text, error=f"후처리 실패: {text}"))
+            else:
+                results.append(ReprocessResult(record.url, record.ocr_text, new_text=text))
+
+        if self.summary_adapter is not None:
+            await asyncio.gather(*(self._summarize(result) for result in results if result.error is None))
+        return results
+
+    async def _summarize(self, result: ReprocessResult) -> None:
+        async with self._semaphore:
+            picture = PostPicture(url=result.url, original_post_id=0, original_ocr_text=result.new_text)
+            try:
+                picture = await self.summary_adapter.summarize_ocr_content(picture)
+            except Exception as e:
+                result.error = f"요약 실패: {e}"
+                return
+        # 요약 어댑터는 짧은 텍스트면 요약 없이 반환 (picture_summary 없음 → 갱신하지 않음)
+        if picture.picture_summary == "실패":
+            result.error = "요약 실패"
+        else:
+            result.picture_summary = picture.picture_summary
+
+
+async def run(args: argparse.Namespace) -> int:
+    archive = OCRResponseArchive(args.archive)
+    summary_adapter = None
+    if args.summarize:
+        from app.board.infra.adapters.openai_summary_adapter import OpenAISummaryAdapter
+        summary_adapter = OpenAISummaryAdapter()
+    picture_repo = None
+    if args.write and args.summarize:
+        from app.board.infra.repository.post_picture_repo import PostPictureRepository
+        picture_repo = PostPictureRepository()
+
+    reprocessor = OcrReprocessor(LayoutWorkerPool(args.workers), summary_adapter, args.concurrency)
+    since = datetime.strptime(args.since, "%Y-%m-%d").timestamp() if args.since else None
+    output = open(args.output, "w", encoding="utf-8") if args.output else None
+
+    counts = {"records": 0, "changed": 0, "failed": 0, "summarized": 0, "pictures_updated": 0}
+
+    async def flush(batch: List[ArchivedOCRResponse]) -> None:
+        results = await reprocessor.reprocess(batch)
+        summaries: Dict[str, str] = {}
+        for result in results:
+            counts["records"] += 1
+            counts["changed"] += result.changed
+            counts["failed"] += result.error is not None
+            if result.error is None and result.picture_summary:
+                counts["summarized"] += 1
+                summaries[result.url] = result.picture_summary
+            if args.write and result.error is None:
+                await asyncio.to_thread(archive.update_text, result.url, result.new_text, OCR_OUTPUT_FORMAT)
+            if output is not None:
+                output.write(json.dumps(result.to_dict(), ensure_ascii=False) + "\n")
+        if picture_repo is not None:
+            counts["pictures_updated"] += await picture_repo.update_picture_summaries_by_url(summaries)
+        logger.info(f"OCR 재처리 진행: {counts['records']}건")
+
+    started = time.perf_counter()
+    try:
+        batch: List[ArchivedOCRResponse] = []
+        for record in archive.iter_records(urls=args.url, since=since, limit=args.limit, chunk_size=args.batch_size):
+            batch.append(record)
+            if len(batch) >= args.batch_size:
+                await flush(batch)
+                batch = []
+        if batch:
+            await flush(batch)
+    finally:
+        reprocessor.layout_pool.close()
+        archive.close()
+        if output is not None:
+            output.close()
+
+    elapsed = time.perf_counter() - started
+    print(
+        f"records: {counts['records']}, changed: {counts['changed']}, failed: {counts['failed']}, "
+        f"summarized: {counts['summarized']}, pictures updated: {counts['pictures_updated']}, "
+        f"elapsed: {elapsed:.1f}s{'' if args.write else ' (dry run)'}"
+    )
+    return 0 if counts["failed"] == 0 else 1
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="보관된 CLOVA 응답으로 OCR 후처리/사진 요약 재실행")
+    parser.add_argument("--archive", help="원본 응답 보관소 경로 (기본: OCR_ARCHIVE_PATH)")
+    parser.add_argument("--url", nargs="*", help="재처리할 사진 URL (기본: 전체)")
+    parser.add_argument("--since", help="이 날짜(YYYY-MM-DD) 이후 보관된 사진만")
+    parser.add_argument("--limit", type=int, help="최대 처리 건수")
+    parser.add_argument("--summarize", action="store_true", help="사진 요약도 다시 생성 (OpenAI 호출)")
+    parser.add_argument("--write", action="store_true", help="보관소 OCR 텍스트 갱신, --summarize와 함께 주면 DB 사진 요약도 갱신")
+    parser.add_argument("--output", help="사진별 결과 JSONL 파일")
+    parser.add_argument("--batch-size", type=int, default=50, help="한 번에 후처리할 응답 수")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시 요약 요청 수")
+    parser.add_argument("--workers", type=int, default=None, help="레이아웃 워커 프로세스 수 (기본: OCR_LAYOUT_WORKERS)")
+    args = parser.parse_args(argv)
+    if not (args.archive or OCR_ARCHIVE_PATH):
+        parser.error("--archive 또는 OCR_ARCHIVE_PATH로 보관소 경로를 지정해야 합니다")
+    logging.basicConfig(level=logging.INFO)
+    # 후처리 단계의 섹션별 결과 로그는 생략
+    logging.getLogger("app.board.infra.ocr.layout_worker_pool").setLevel(logging.WARNING)
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,230 @@
+import gzip
+import json
+import os
+import sqlite3
+import threading
+import time
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import zstandard
+except ImportError:  # zstandard 미설치 시 gzip으로 압축
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+OCR_ARCHIVE_ENABLED = os.getenv("OCR_ARCHIVE_ENABLED", "true").lower() == "true"
+# 보관소 SQLite 파일 경로 - 재배포 후에도 남도록 마운트된 볼륨 경로를 지정 (없으면 보관 비활성화)
+OCR_ARCHIVE_PATH = os.getenv("OCR_ARCHIVE_PATH")
+# 원본 응답 압축 방식 - zstd | gzip (zstandard 미설치 시 gzip)
+OCR_ARCHIVE_CODEC = os.getenv("OCR_ARCHIVE_CODEC", "zstd")
+OCR_ARCHIVE_ZSTD_LEVEL = int(os.getenv("OCR_ARCHIVE_ZSTD_LEVEL", "9"))
+OCR_ARCHIVE_GZIP_LEVEL = int(os.getenv("OCR_ARCHIVE_GZIP_LEVEL", "6"))
+
+ARCHIVE_COLUMNS = "url, sha256, codec, raw_response, ocr_text, output_format, created_at, reprocessed_at"
+
+
+@dataclass
+class ArchivedOCRResponse:
+    """보관된 사진 1장의 원본 CLOVA 응답과 OCR 텍스트"""
+    url: str
+    sha256: Optional[str]
+    ocr_response: Dict
+    ocr_text: str
+    output_format: Optional[str]
+    created_at: float
+    reprocessed_at: Optional[float] = None
+
+
+def compress_response(ocr_response: Dict, codec: str) -> bytes:
+    raw = json.dumps(ocr_response, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=OCR_ARCHIVE_ZSTD_LEVEL).compress(raw)
+    if codec == "gzip":
+        return gzip.compress(raw, compresslevel=OCR_ARCHIVE_GZIP_LEVEL, mtime=0)
+    raise ValueError(f"지원하지 않는 압축 방식: {codec}")
+
+
+def decompress_response(data: bytes, codec: str) -> Dict:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstd로 압축된 응답을 읽으려면 zstandard 패키지가 필요합니다")
+        raw = zstandard.ZstdDecompressor().decompress(data)
+    elif codec == "gzip":
+        raw = gzip.decompress(data)
+    else:
+        raise ValueError(f"지원하지 않는 압축 방식: {codec}")
+    return json.loads(raw.decode("utf-8"))
+
+
+def create_default_archive() -> Optional["OCRResponseArchive"]:
+    """
+    환경변수 설정으로 보관소 생성
+
+    컨테이너 작업 디렉터리에 두면 재배포 때마다 사라지므로 기본 경로를 두지 않고,
+    OCR_ARCHIVE_PATH가 없으면 경고 후 보관하지 않습니다.
+    """
+    if not OCR_ARCHIVE_ENABLED:
+        return None
+    if not OCR_ARCHIVE_PATH:
+        logger.warning("OCR_ARCHIVE_PATH 미설정 - OCR 원본 응답을 보관하지 않습니다 (마운트된 볼륨 경로 지정 필요)")
+        return None
+    return OCRResponseArchive(OCR_ARCHIVE_PATH)
+
+
+class OCRResponseArchive:
+    """
+    사진별 원본 CLOVA 응답 보관소 (SQLite 파일, 제거 없음)
+
+    OCR 결과 캐시(LRU 제거)와 달리 보관한 응답을 지우지 않으므로, 레이아웃 후처리나 요약 프롬프트를
+    고친 뒤 유료 OCR 재호출 없이 과거 사진을 다시 처리할 수 있습니다(ocr_reprocess).
+    사진 URL(post_picture.url)을 키로 원본 응답(zstd 또는 gzip 압축)과 OCR 텍스트, 텍스트 형식을 저장합니다.
+    """
+
+    def __init__(self, path: Optional[str] = None, codec: str = OCR_ARCHIVE_CODEC):
+        path = path or OCR_ARCHIVE_PATH
+        if not path:
+            raise ValueError("OCR 원본 응답 보관소 경로가 없습니다 (OCR_ARCHIVE_PATH 설정 필요)")
+        if codec == "zstd" and zstandard is None:
+            logger.info("zstandard 미설치 - OCR 원본 응답을 gzip으로 압축합니다")
+            codec = "gzip"
+        self.path = path
+        self.codec = codec
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def put(self, url: str, sha256: Optional[str], ocr_response: Dict, ocr_text: str,
+            output_format: Optional[str] = None, overwrite: bool = True) -> bool:
+        """
+        사진 1장의 원본 응답과 OCR 텍스트 저장
+
+        overwrite가 False이면 이미 보관된 URL은 압축 없이 건너뜁니다(캐시 적중 경로).
+
+        Returns:
+            bool: 저장 여부
+        """
+        if not overwrite and self.contains(url):
+            return False
+
+        data = compress_response(ocr_response, self.codec)
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO ocr_archive "
+                "(url, sha256, codec, raw_response, ocr_text, output_format, created_at, reprocessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, NULL)",
+                (url, sha256, self.codec, data, ocr_text, output_format, time.time()),
+            )
+            conn.commit()
+        return True
+
+    def contains(self, url: str) -> bool:
+        with self._lock:
+            return self._connection().execute(
+                "SELECT 1 FROM ocr_archive WHERE url = ?", (url,)
+            ).fetchone() is not None
+
+    def get(self, url: str) -> Optional[ArchivedOCRResponse]:
+        with self._lock:
+            row = self._connection().execute(
+                f"SELECT {ARCHIVE_COLUMNS} FROM ocr_archive WHERE url = ?", (url,)
+            ).fetchone()
+        return self._to_record(row) if row is not None else None
+
+    def iter_records(self,
+                     urls: Optional[List[str]] = None,
+                     since: Optional[float] = None,
+                     limit: Optional[int] = None,
+                     chunk_size: int = 200) -> Iterator[ArchivedOCRResponse]:
+        """
+        보관된 응답을 오래된 순으로 반환 (재처리용)
+
+        응답 전체를 메모리에 올리지 않도록 chunk_size 단위로 조회합니다.
+        """
+        conditions, params = [], []
+        if urls:
+            conditions.append(f"url IN ({', '.join('?' * len(urls))})")
+            params.extend(urls)
+        if since is not None:
+            conditions.append("created_at >= ?")
+            params.append(since)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        remaining = limit
+        offset = 0
+        while remaining is None or remaining > 0:
+            size = chunk_size if remaining is None else min(chunk_size, remaining)
+            with self._lock:
+                rows = self._connection().execute(
+                    f"SELECT {ARCHIVE_COLUMNS} FROM ocr_archive {where} ORDER BY created_at, url LIMIT ? OFFSET ?",
+                    (*params, size, offset),
+                ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield self._to_record(row)
+            offset += len(rows)
+            if remaining is not None:
+                remaining -= len(rows)
+
+    def update_text(self, url: str, ocr_text: str, output_format: Optional[str]) -> None:
+        """재처리한 OCR 텍스트로 갱신 (원본 응답은 그대로 유지)"""
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "UPDATE ocr_archive SET ocr_text = ?, output_format = ?, reprocessed_at = ? WHERE url = ?",
+                (ocr_text, output_format, time.time(), url),
+            )
+            conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """보관 건수와 압축 크기"""
+        with self._lock:
+            count, stored_bytes, reprocessed = self._connection().execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(raw_response)), 0), COUNT(reprocessed_at) FROM ocr_archive"
+            ).fetchone()
+        return {
+            "path": self.path,
+            "codec": self.codec,
+            "records": count,
+            "stored_bytes": stored_bytes,
+            "reprocessed": reprocessed,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @staticmethod
+    def _to_record(row) -> ArchivedOCRResponse:
+        url, sha256, codec, data, ocr_text, output_format, created_at, reprocessed_at = row
+        return ArchivedOCRResponse(
+            url=url,
+            sha256=sha256,
+            ocr_response=decompress_response(data, codec),
+            ocr_text=ocr_text,
+            output_format=output_format,
+            created_at=created_at,
+            reprocessed_at=reprocessed_at,
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        """연결 지연 생성 및 스키마 초기화"""
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS ocr_archive ("
+                " url TEXT PRIMARY KEY, sha256 TEXT, codec TEXT NOT NULL, raw_response BLOB NOT NULL,"
+                " ocr_text TEXT NOT NULL, output_format TEXT, created_at REAL NOT NULL, reprocessed_at REAL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_ocr_archive_created_at ON ocr_archive (created_at)")
+            self._conn = conn
+        return self._conn
@@ -0,0 +1,298 @@
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+import logging
+from dataclasses import dataclass
+from typing import Dict, Iterator, Optional, Tuple
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow 미설치 시 정확히 같은 이미지(SHA-256)만 캐시 적중
+    Image = None
+
+from .ocr_pipeline.output_format import OCR_OUTPUT_FORMAT
+from .ocr_pipeline.post_process_pipeline import LAYOUT_VERSION
+
+logger = logging.getLogger(__name__)
+
+OCR_CACHE_ENABLED = os.getenv("OCR_CACHE_ENABLED", "true").lower() == "true"
+OCR_CACHE_PATH = os.getenv("OCR_CACHE_PATH", os.path.join(".cache", "ocr_cache.sqlite3"))
+OCR_CACHE_MAX_BYTES = int(os.getenv("OCR_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+# dHash 근사 일치 (기본 비활성) - 같은 학과 템플릿으로 만든 날짜/문구만 다른 포스터가 서로 적중하여
+# 다른 포스터의 OCR 텍스트를 돌려줄 수 있으므로, 켜더라도 가로/세로 크기가 같은 이미지끼리만 매우 좁은 거리로 비교
+OCR_CACHE_PHASH_ENABLED = os.getenv("OCR_CACHE_PHASH_ENABLED", "false").lower() == "true"
+OCR_CACHE_PHASH_MAX_DISTANCE = int(os.getenv("OCR_CACHE_PHASH_MAX_DISTANCE", "1"))  # dHash 해밍 거리 허용치 (64bit 중)
+
+
+@dataclass(frozen=True)
+class ImageFingerprint:
+    """근사 일치용 이미지 지문 (dHash + 원본 크기)"""
+    dhash: int
+    width: int
+    height: int
+
+
+@dataclass
+class CachedOCRResult:
+    """캐시된 OCR 결과"""
+    sha256: str
+    ocr_response: Dict
+    text: str
+    match: str  # "url" | "sha256" | "phash"
+    output_format: Optional[str] = None
+    layout_version: Optional[int] = None
+
+    @property
+    def is_current(self) -> bool:
+        """현재 출력 형식/레이아웃 버전으로 만든 텍스트인지 (아니면 원본 응답으로 재생성 필요)"""
+        return self.output_format == OCR_OUTPUT_FORMAT and self.layout_version == LAYOUT_VERSION
+
+
+def compute_sha256(image_data: bytes) -> str:
+    return hashlib.sha256(image_data).hexdigest()
+
+
+def compute_dhash(image_data: bytes) -> Optional[ImageFingerprint]:
+    """
+    64bit difference hash와 원본 크기 계산 (재인코딩된 같은 포스터 식별용)
+
+    9x8 흑백 썸네일에서 가로로 인접한 픽셀 밝기 비교 결과를 비트로 만듭니다.
+    """
+    if Image is None:
+        return None
+    try:
+        with Image.open(io.BytesIO(image_data)) as image:
+            width, height = image.size
+            image.draft("L", (64, 64))
+            pixels = list(image.convert("L").resize((9, 8), Image.BILINEAR).getdata())
+    except Exception as e:
+        logger.debug(f"dHash 계산 실패: {e}")
+        return None
+
+    value = 0
+    for row in range(8):
+        for col in range(8):
+            value = (value << 1) | (pixels[row * 9 + col] > pixels[row * 9 + col + 1])
+    # sqlite INTEGER는 부호 있는 64bit이므로 부호 있는 값으로 저장
+    return ImageFingerprint(value - (1 << 64) if value >= (1 << 63) else value, width, height)
+
+
+class OCRResultCache:
+    """
+    콘텐츠 주소 기반 OCR 결과 캐시 (SQLite 파일)
+
+    - URL → SHA-256 매핑: 이미 본 URL은 이미지 다운로드 없이 적중
+    - SHA-256 정확 일치: 같은 파일이 다른 URL로 올라온 경우
+    - dHash 근사 일치 (OCR_CACHE_PHASH_ENABLED, 기본 비활성): 크기가 같고 재인코딩만 다른 같은 포스터
+    원본 CLOVA 응답(zlib 압축)과 최종 텍스트, 텍스트의 출력 형식/레이아웃 버전을 저장하며,
+    전체 크기가 상한을 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다(LRU).
+    """
+
+    def __init__(self,
+                 path: str = OCR_CACHE_PATH,
+                 max_bytes: int = OCR_CACHE_MAX_BYTES,
+                 phash_max_distance: int = OCR_CACHE_PHASH_MAX_DISTANCE,
+                 phash_enabled: bool = OCR_CACHE_PHASH_ENABLED):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.phash_max_distance = phash_max_distance
+        self.phash_enabled = phash_enabled
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._dhashes: Dict[str, ImageFingerprint] = {}  # sha256 -> 지문 (근사 검색용 메모리 인덱스)
+
+    def get_by_url(self, url: str) -> Optional[CachedOCRResult]:
+        """URL로 캐시 조회 (다운로드 전 단계)"""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT sha256 FROM ocr_url WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            return self._load(row[0], "url")
+
+    def get_by_content(self, image_data: bytes) -> tuple:
+        """
+        이미지 내용으로 캐시 조회
+
+        Returns:
+            (CachedOCRResult 또는 None, sha256, 지문) - 미적중 시 put()에 해시를 재사용
+        """
+        sha256 = compute_sha256(image_data)
+        with self._lock:
+            cached = self._load(sha256, "sha256")
+        if cached is not None or not self.phash_enabled:
+            return cached, sha256, None
+
+        dhash = compute_dhash(image_data)
+        if dhash is None:
+            return None, sha256, None
+
+        with self._lock:
+            self._connection()
+            nearest = self._find_nearest(dhash)
+            if nearest is not None:
+                return self._load(nearest, "phash"), sha256, dhash
+        return None, sha256, dhash
+
+    def put(self, sha256: str, dhash: Optional[ImageFingerprint], url: Optional[str], ocr_response: Dict, text: str,
+            output_format: str = OCR_OUTPUT_FORMAT, layout_version: int = LAYOUT_VERSION) -> None:
+        """OCR 결과 저장 후 크기 상한 초과분 제거"""
+        raw = zlib.compress(json.dumps(ocr_response, ensure_ascii=False).encode("utf-8"))
+        size = len(raw) + len(text.encode("utf-8"))
+        now = time.time()
+
+        with self._lock:
+            conn = self._connection()
+            # INSERT OR REPLACE는 기존 행을 지웠다가 다시 넣으므로 ON DELETE CASCADE로 같은 sha256의 URL 매핑까지 지워짐
+            conn.execute(
+                "INSERT INTO ocr_result (sha256, dhash, width, height, raw_response, text, output_format, layout_version,"
+                " size, last_access) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(sha256) DO UPDATE SET dhash = excluded.dhash, width = excluded.width, "
+                "height = excluded.height, raw_response = excluded.raw_response, text = excluded.text, "
+                "output_format = excluded.output_format, layout_version = excluded.layout_version, "
+                "size = excluded.size, last_access = excluded.last_access",
+                (sha256, dhash.dhash if dhash else None, dhash.width if dhash else None,
+                 dhash.height if dhash else None, raw, text, output_format, layout_version, size, now),
+            )
+            if url:
+                conn.execute("INSERT OR REPLACE INTO ocr_url (url, sha256) VALUES (?, ?)", (url, sha256))
+            if dhash is not None:
+                self._dhashes[sha256] = dhash
+            self._evict(conn)
+            conn.commit()
+
+    def update_text(self, sha256: str, text: str,
+                    output_format: str = OCR_OUTPUT_FORMAT, layout_version: int = LAYOUT_VERSION) -> None:
+        """원본 응답으로 재생성한 텍스트로 갱신 (출력 형식/레이아웃 버전 변경 후 첫 적중 시)"""
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "UPDATE ocr_result SET text = ?, output_format = ?, layout_version = ?,"
+                " size = LENGTH(raw_response) + ? WHERE sha256 = ?",
+                (text, output_format, layout_version, len(text.encode("utf-8")), sha256),
+            )
+            conn.commit()
+
+    def remember_url(self, url: str, sha256: str) -> None:
+        """다른 URL로 적중한 경우 다음부터 다운로드 없이 적중하도록 URL 매핑 추가"""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("INSERT OR REPLACE INTO ocr_url (url, sha256) VALUES (?, ?)", (url, sha256))
+            conn.commit()
+
+    def iter_responses(self, limit: Optional[int] = None) -> Iterator[Tuple[str, Dict]]:
+        """저장된 (sha256, 원본 CLOVA 응답)을 최근 사용 순으로 반환 (골든 코퍼스 수집 등 오프라인 용도, LRU 갱신 없음)"""
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT sha256, raw_response FROM ocr_result ORDER BY last_access DESC LIMIT ?",
+                (-1 if limit is None else limit,),
+            ).fetchall()
+        for sha256, raw in rows:
+            yield sha256, json.loads(zlib.decompress(raw).decode("utf-8"))
+
+    def peek_text(self, sha256: str) -> Optional[str]:
+        """sha256으로 저장된 최종 텍스트 조회 (오프라인 평가용, LRU 갱신 없음)"""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT text FROM ocr_result WHERE sha256 = ?", (sha256,)
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """연결 지연 생성 및 스키마/메모리 인덱스 초기화"""
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS ocr_result ("
+                " sha256 TEXT PRIMARY KEY, dhash INTEGER, raw_response BLOB NOT NULL,"
+                " text TEXT NOT NULL, size INTEGER NOT NULL, last_access REAL NOT NULL)"
+            )
+            # 컬럼이 없던 기존 캐시 파일 보강 (크기 없는 항목은 근사 일치 대상에서 제외,
+            # 출력 형식/레이아웃 버전이 없는 항목은 적중 시 텍스트 재생성)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(ocr_result)")}
+            for column, column_type in (("width", "INTEGER"), ("height", "INTEGER"),
+                                        ("output_format", "TEXT"), ("layout_version", "INTEGER")):
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE ocr_result ADD COLUMN {column} {column_type}")
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_ocr_result_last_access ON ocr_result (last_access)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS ocr_url ("
+                " url TEXT PRIMARY KEY, sha256 TEXT NOT NULL REFERENCES ocr_result (sha256) ON DELETE CASCADE)"
+            )
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._dhashes = {
+                sha256: ImageFingerprint(dhash, width, height)
+                for sha256, dhash, width, height in conn.execute(
+                    "SELECT sha256, dhash, width, height FROM ocr_result "
+                    "WHERE dhash IS NOT NULL AND width IS NOT NULL AND height IS NOT NULL"
+                )
+            } if self.phash_enabled else {}
+            self._conn = conn
+        return self._conn
+
+    def _load(self, sha256: str, match: str) -> Optional[CachedOCRResult]:
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT raw_response, text, output_format, layout_version FROM ocr_result WHERE sha256 = ?", (sha256,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        conn.execute("UPDATE ocr_result SET last_access = ? WHERE sha256 = ?", (time.time(), sha256))
+        conn.commit()
+        raw, text, output_format, layout_version = row
+        return CachedOCRResult(
+            sha256=sha256,
+            ocr_response=json.loads(zlib.decompress(raw).decode("utf-8")),
+            text=text,
+            match=match,
+            output_format=output_format,
+            layout_version=layout_version,
+        )
+
+    def _find_nearest(self, fingerprint: ImageFingerprint) -> Optional[str]:
+        """가로/세로 크기가 같고 해밍 거리가 허용치 이내인 가장 가까운 항목의 sha256"""
+        target = fingerprint.dhash & 0xFFFFFFFFFFFFFFFF
+        best_sha, best_distance = None, self.phash_max_distance + 1
+        for sha256, candidate in self._dhashes.items():
+            if (candidate.width, candidate.height) != (fingerprint.width, fingerprint.height):
+                continue
+            distance = (target ^ (candidate.dhash & 0xFFFFFFFFFFFFFFFF)).bit_count()
+            if distance < best_distance:
+                best_sha, best_distance = sha256, distance
+        return best_sha
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """전체 크기가 상한을 넘으면 LRU 순으로 제거"""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM ocr_result").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        evicted = 0
+        for sha256, size in conn.execute(
+            "SELECT sha256, size FROM ocr_result ORDER BY last_access ASC"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM ocr_result WHERE sha256 = ?", (sha256,))
+            self._dhashes.pop(sha256, None)
+            total -= size
+            evicted += 1
+
+        logger.info(f"OCR 캐시 LRU 제거: {evicted}개 (현재 {total} bytes)")
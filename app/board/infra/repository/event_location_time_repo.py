@@ -2,7 +2,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete
 from sqlalchemy.exc import SQLAlchemyError
 from typing import List
-from app.database.db import get_db
+from app.database.db import get_write_db
 from app.board.infra.db_models.event_location_time import EventLocationTime
 from app.board.domain.repository.event_location_time_repo import IEventLocationTimeRepository
 from app.board.domain.event_location_time import EventLocationTime as EventLocationTimeVO
@@ -37,7 +37,7 @@ class EventLocationTimeRepository(IEventLocationTimeRepository):
             logger.info("No valid events to save (all events lack post_id)")
             return []
             
-        async for db in get_db():
+        async for db in get_write_db():
             try:
                 # 배치 변환 (빠른 리스트 컴프리헨션)
                 event_models = self._convert_to_models_batch(events)
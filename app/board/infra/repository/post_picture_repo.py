@@ -1,7 +1,8 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
-from typing import List
-from app.database.db import get_db
+from typing import Dict, List
+from sqlalchemy import update
+from app.database.db import get_write_db
 from app.board.infra.db_models.post_picture import PostPicture as PostPictureModel
 from app.board.domain.repository.post_picture_repo import IPostPictureRepository
 from app.board.domain.post_picture import PostPicture
@@ -30,7 +31,7 @@ class PostPictureRepository(IPostPictureRepository):
         if not picture.post_id:
             raise ValueError("post_id is required for creating post picture")
             
-        async for db in get_db():
+        async for db in get_write_db():
             try:
                 # Domain Entity를 SQLAlchemy Model로 변환
                 picture_model = PostPictureModel(**picture.to_dict())
@@ -79,7 +80,7 @@ class PostPictureRepository(IPostPictureRepository):
             if not picture.post_id:
                 raise ValueError(f"post_id is required for creating post picture at index {i}")
         
-        async for db in get_db():
+        async for db in get_write_db():
             try:
                 # Domain Entity를 SQLAlchemy Model로 변환
                 picture_models = [PostPictureModel(**picture.to_dict()) for picture in pictures]
@@ -112,4 +113,38 @@ class PostPictureRepository(IPostPictureRepository):
             except SQLAlchemyError as e:
                 await db.rollback()
                 logger.error(f"PostPictureRepository: 게시글 사진 일괄 저장 실패: {e}")
-                raise e
\ No newline at end of file
+                raise e
+
+    async def update_picture_summaries_by_url(self, summaries: Dict[str, str]) -> int:
+        """
+        사진 URL별 요약을 갱신합니다. (OCR 재처리 결과 반영용)
+        
+        Args:
+            summaries (Dict[str, str]): 사진 URL → 새 picture_summary
+            
+        Returns:
+            int: 갱신된 행 수 (같은 URL의 사진이 여러 게시글에 있으면 모두 갱신)
+            
+        Raises:
+            SQLAlchemyError: 데이터베이스 업데이트 중 오류 발생 시
+        """
+        if not summaries:
+            return 0
+            
+        async for db in get_write_db():
+            try:
+                updated = 0
+                for url, picture_summary in summaries.items():
+                    result = await db.execute(
+                        update(PostPictureModel).where(PostPictureModel.url == url).values(picture_summary=picture_summary)
+                    )
+                    updated += result.rowcount
+                await db.commit()
+                
+                logger.info(f"PostPictureRepository: 사진 요약 {updated}건 갱신 완료")
+                return updated
+                
+            except SQLAlchemyError as e:
+                await db.rollback()
+                logger.error(f"PostPictureRepository: 사진 요약 갱신 실패: {e}")
+                raise e
@@ -0,0 +1,126 @@
+from sqlalchemy import select, insert, inspect
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.exc import SQLAlchemyError
+from typing import List
+from datetime import datetime
+from app.database.db import get_write_db
+from app.board.infra.db_models.post_view_delta import PostViewDelta
+from app.board.infra.db_models.post_popularity import PostPopularity
+from app.board.domain.repository.post_popularity_repo import IPostPopularityRepository
+from app.board.domain.post_view_delta import PostViewDelta as PostViewDeltaVO
+from app.board.domain.post_popularity import PostPopularity as PostPopularityVO
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class PostPopularityRepository(IPostPopularityRepository):
+
+    async def tables_exist(self) -> bool:
+        """
+        인기도 테이블(post_popularity, post_view_count_delta)이 생성되어 있는지 확인합니다.
+        
+        Returns:
+            bool: 두 테이블이 모두 있으면 True
+        """
+        table_names = (PostPopularity.__tablename__, PostViewDelta.__tablename__)
+        async for db in get_write_db():
+            connection = await db.connection()
+            return await connection.run_sync(
+                lambda sync_connection: all(inspect(sync_connection).has_table(name) for name in table_names)
+            )
+
+    async def append_view_deltas(self, deltas: List[PostViewDeltaVO]) -> None:
+        """
+        주기별 조회수 증가량을 시계열 테이블에 배치로 추가합니다.
+        
+        ORM 객체 없이 executemany 한 번으로 저장합니다.
+        
+        Args:
+            deltas (List[PostViewDeltaVO]): 저장할 조회수 증가량 목록
+            
+        Raises:
+            SQLAlchemyError: 데이터베이스 저장 중 오류 발생 시
+        """
+        if not deltas:
+            return
+
+        async for db in get_write_db():
+            try:
+                rows = [delta.to_dict() for delta in deltas]
+                for row in rows:
+                    row.pop('id')
+
+                await db.execute(insert(PostViewDelta), rows)
+                await db.commit()
+
+                logger.debug("조회수 증가량 저장 완료: %d건", len(rows))
+
+            except SQLAlchemyError as e:
+                await db.rollback()
+                logger.error("조회수 증가량 저장 중 오류 발생: %s", e)
+                raise e
+
+    async def upsert_popularities(self, popularities: List[PostPopularityVO]) -> None:
+        """
+        인기도 점수 스냅샷을 post_id 기준으로 upsert 합니다.
+        
+        Args:
+            popularities (List[PostPopularityVO]): 저장할 인기도 점수 목록
+            
+        Raises:
+            SQLAlchemyError: 데이터베이스 저장 중 오류 발생 시
+        """
+        if not popularities:
+            return
+
+        async for db in get_write_db():
+            try:
+                stmt = mysql_insert(PostPopularity)
+                stmt = stmt.on_duplicate_key_update(
+                    board_id=stmt.inserted.board_id,
+                    score=stmt.inserted.score,
+                    last_view_count=stmt.inserted.last_view_count,
+                    updated_at=stmt.inserted.updated_at,
+                )
+
+                await db.execute(stmt, [popularity.to_dict() for popularity in popularities])
+                await db.commit()
+
+                logger.debug("인기도 점수 저장 완료: %d건", len(popularities))
+
+            except SQLAlchemyError as e:
+                await db.rollback()
+                logger.error("인기도 점수 저장 중 오류 발생: %s", e)
+                raise e
+
+    async def read_popularities_updated_since(self, since: datetime) -> List[PostPopularityVO]:
+        """
+        since 이후 갱신된 인기도 점수를 조회합니다.
+        
+        Args:
+            since (datetime): 조회 기준 시각
+            
+        Returns:
+            List[PostPopularityVO]: 인기도 점수 목록
+            
+        Raises:
+            SQLAlchemyError: 데이터베이스 조회 중 오류 발생 시
+        """
+        async for db in get_write_db():
+            try:
+                result = await db.execute(
+                    select(
+                        PostPopularity.post_id,
+                        PostPopularity.board_id,
+                        PostPopularity.score,
+                        PostPopularity.last_view_count,
+                        PostPopularity.updated_at,
+                    )
+                    .where(PostPopularity.updated_at >= since)
+                )
+
+                return [PostPopularityVO.from_dict(row._asdict()) for row in result.all()]
+
+            except SQLAlchemyError as e:
+                raise e
@@ -5,9 +5,10 @@ from typing import List
 from datetime import datetime
 
 from app.board.domain.post import Post as PostVO
+from app.board.domain.post_projection import PostProjection
 from app.board.infra.db_models.post import Post
 from app.board.domain.repository.post_repo import IPostRepository
-from app.database.db import get_db
+from app.database.db import get_write_db
 import logging
 
 logger = logging.getLogger(__name__)
@@ -28,7 +29,7 @@ class PostRepository(IPostRepository):
         Raises:
             SQLAlchemyError: 데이터베이스 저장 중 오류 발생 시
         """
-        async for db in get_db():
+        async for db in get_write_db():
             try:
                 # 배치 변환 (빠른 리스트 컴프리헨션)
                 post_models = self._convert_to_models_batch(posts)
@@ -75,7 +76,7 @@ class PostRepository(IPostRepository):
         Raises:
             SQLAlchemyError: 데이터베이스 조회 중 오류 발생 시
         """
-        async for db in get_db():
+        async for db in get_write_db():
             try:
                 result = await db.execute(
                     select(Post)
@@ -103,7 +104,7 @@ class PostRepository(IPostRepository):
         Raises:
             SQLAlchemyError: 데이터베이스 업데이트 중 오류 발생 시
         """
-        async for db in get_db():
+        async for db in get_write_db():
             try:
                 for update_data in updates:
                     post_id = update_data.pop("id")
@@ -129,7 +130,7 @@ class PostRepository(IPostRepository):
             if not posts:
                 return
                 
-            async for db in get_db():
+            async for db in get_write_db():
                 try:
                     current_time = datetime.now()
                     
@@ -197,7 +198,7 @@ class PostRepository(IPostRepository):
         if not posts:
             return
             
-        async for db in get_db():
+        async for db in get_write_db():
             try:
                 current_time = datetime.now()
                 
@@ -241,7 +242,7 @@ class PostRepository(IPostRepository):
         if not original_ids:
             return []
             
-        async for db in get_db():
+        async for db in get_write_db():
             try:
                 # 문자열 original_ids를 정수로 변환
                 original_ids_int = [int(oid) for oid in original_ids]
@@ -258,6 +259,38 @@ class PostRepository(IPostRepository):
             except SQLAlchemyError as e:
                 raise e
 
+    async def find_projections_by_original_ids(self, board_id: int, original_ids: List[str]) -> List[PostProjection]:
+        """
+        특정 게시판에서 original_id 리스트에 해당하는 게시물들을 경량 조회합니다.
+        
+        ORM 객체를 만들지 않고 필요한 컬럼만 튜플로 받아 읽기 모델로 변환합니다.
+        
+        Args:
+            board_id: 게시판 ID
+            original_ids: 조회할 original_post_id 리스트
+            
+        Returns:
+            id, original_post_id, view_count만 담은 읽기 모델 목록
+        """
+        if not original_ids:
+            return []
+            
+        async for db in get_write_db():
+            try:
+                # 문자열 original_ids를 정수로 변환
+                original_ids_int = [int(oid) for oid in original_ids]
+                
+                result = await db.execute(
+                    select(Post.id, Post.original_post_id, Post.view_count)
+                    .where(Post.board_id == board_id)
+                    .where(Post.original_post_id.in_(original_ids_int))
+                )
+                
+                return self._convert_to_projections_batch(result.all())
+                
+            except SQLAlchemyError as e:
+                raise e
+
     async def upsert_posts_and_return_new(self, posts: List[PostVO]) -> List[PostVO]:
         """
         게시글들을 upsert하고 새로 생성된 게시글들만 반환합니다.
@@ -271,7 +304,7 @@ class PostRepository(IPostRepository):
         if not posts:
             return []
             
-        async for db in get_db():
+        async for db in get_write_db():
             try:
                 # 1. 기존 게시글들의 original_post_id 조회
                 board_id = posts[0].board_id  # 모든 posts는 같은 board_id를 가져야 함
@@ -322,7 +355,7 @@ class PostRepository(IPostRepository):
         if not posts:
             return
             
-        async for db in get_db():
+        async for db in get_write_db():
             try:
                 current_time = datetime.now()
                 
@@ -380,4 +413,16 @@ class PostRepository(IPostRepository):
         Returns:
             List[PostVO]: 게시글 도메인 객체 리스트
         """
-        return [PostVO.from_dict(m.__dict__) for m in post_models]
\ No newline at end of file
+        return [PostVO.from_dict(m.__dict__) for m in post_models]
+
+    def _convert_to_projections_batch(self, rows) -> List[PostProjection]:
+        """
+        컬럼 튜플 결과를 경량 읽기 모델로 배치 변환합니다.
+        
+        Args:
+            rows: (id, original_post_id, view_count) 행 목록
+            
+        Returns:
+            List[PostProjection]: 게시글 읽기 모델 리스트
+        """
+        return [PostProjection.from_row(row) for row in rows]
\ No newline at end of file
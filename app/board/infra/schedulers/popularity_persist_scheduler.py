@@ -0,0 +1,43 @@
+import os
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+import logging
+from app.containers import Container
+from dependency_injector.wiring import Provide, inject
+
+from app.board.application.popularity_engine import PopularityEngine
+
+logger = logging.getLogger(__name__)
+
+
+class PopularityPersistScheduler:
+    """인기도 점수를 주기적으로 DB에 저장하는 작업을 스케줄링하는 클래스"""
+
+    @inject
+    def __init__(
+        self,
+        scheduler: AsyncIOScheduler = Provide[Container.scheduler],
+        popularity_engine: PopularityEngine = Provide[Container.popularity_engine]
+    ):
+        self.scheduler = scheduler
+        self.popularity_engine = popularity_engine
+
+    async def start(self):
+        """DB에서 점수를 복원한 뒤 주기 저장 작업 등록"""
+        await self.popularity_engine.warm_start()
+        self.add_persist_job()
+
+    async def stop(self):
+        """종료 전 남은 점수 저장"""
+        await self.popularity_engine.persist()
+
+    def add_persist_job(self):
+        """
+        변경된 인기도 점수를 일정 주기로 저장하도록 스케줄링합니다.
+        
+        환경변수: POPULARITY_PERSIST_INTERVAL_SECONDS (기본값 300초)
+        """
+        interval = int(os.getenv("POPULARITY_PERSIST_INTERVAL_SECONDS", "300"))
+        job_id = "popularity_persist"
+
+        self.scheduler.add_job(self.popularity_engine.persist, "interval", seconds=interval, id=job_id)
+        logger.info(f"등록된 작업: {job_id} (interval={interval}s)")
@@ -3,6 +3,16 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 import asyncio
 from app.board.infra.http_new_post_sender import HttpNewPostSender
 from app.board.application.post_classifier import PostClassifier
+from app.board.application.post_processor import PostProcessor
+from app.board.application.existing_post_handler import ExistingPostHandler
+from app.board.application.new_post_handler import NewPostHandler
+from app.board.application.post_processing_pipeline import PostProcessingPipeline
+from app.board.application.ocr_pipeline import OcrPipeline
+from app.board.infra.ocr.clova_ocr_adapter import ClovaOCRAdapter
+from app.board.infra.ocr.layout_worker_pool import LayoutWorkerPool
+from app.board.infra.ocr.local_stub_ocr_adapter import LocalStubOCRAdapter
+from app.board.infra.ocr.ocr_backend_router import OcrBackendRouter
+from app.board.application.popularity_engine import PopularityEngine
 from app.board.application.ports.new_post_sender import INewPostSender
 from app.board.application.scraped_post_manager import ScrapedPostManager
 from app.board.infra.scraper.posts.scraper_factory import PostScraperFactory
@@ -20,19 +30,69 @@ class Container(containers.DeclarativeContainer):
     scheduler = providers.Singleton(AsyncIOScheduler)
     scrape_lock = providers.Singleton(asyncio.Lock)
 
+    # 인기도(트렌딩) 엔진 - 메모리 상태를 공유해야 하므로 싱글톤
+    popularity_engine = providers.Singleton(PopularityEngine)
+
+    post_scraper_factory = providers.Singleton(PostScraperFactory)
+
+    # OCR 레이아웃 후처리 프로세스 풀 - 워커 프로세스를 공유해야 하므로 싱글톤 (워커 수: OCR_LAYOUT_WORKERS, 0이면 스레드 실행)
+    layout_worker_pool = providers.Singleton(LayoutWorkerPool)
+
+    # OCR 어댑터 - aiohttp 세션(커넥션 풀)을 공유해야 하므로 싱글톤
+    ocr_adapter = providers.Singleton(
+        ClovaOCRAdapter,
+        layout_pool=layout_worker_pool
+    )
+    # 오프라인 개발/테스트용 결정적 OCR 스텁
+    local_stub_ocr_adapter = providers.Singleton(LocalStubOCRAdapter)
+    # OCR 백엔드 라우터 - 백엔드별 지연 시간/오류율을 공유해야 하므로 싱글톤 (사용 백엔드: OCR_BACKENDS)
+    ocr_router = providers.Singleton(
+        OcrBackendRouter,
+        backends=providers.Dict(
+            clova=ocr_adapter,
+            stub=local_stub_ocr_adapter,
+        )
+    )
+    ocr_pipeline = providers.Singleton(
+        OcrPipeline,
+        ocr_adapter=ocr_router
+    )
+    post_processing_pipeline = providers.Singleton(
+        PostProcessingPipeline,
+        post_scraper_factory=post_scraper_factory,
+        ocr_pipeline=ocr_pipeline
+    )
+
+    # 게시물 처리 체인
+    new_post_handler = providers.Singleton(
+        NewPostHandler,
+        post_processing_pipeline=post_processing_pipeline
+    )
+    existing_post_handler = providers.Singleton(
+        ExistingPostHandler,
+        popularity_engine=popularity_engine
+    )
+    post_processor = providers.Singleton(
+        PostProcessor,
+        new_post_handler=new_post_handler,
+        existing_post_handler=existing_post_handler
+    )
+
     # sender와 classifier
-    post_classifier = providers.Singleton(PostClassifier)
+    post_classifier = providers.Singleton(
+        PostClassifier,
+        post_processor=post_processor
+    )
     http_new_post_sender = providers.Singleton(HttpNewPostSender)
     new_post_sender = providers.AbstractSingleton(INewPostSender)
     
     # ScrapedPostManager (의존성 주입)
     scraped_post_manager = providers.Singleton(
         ScrapedPostManager,
-        new_post_sender=new_post_sender
+        new_post_sender=new_post_sender,
+        classifier=post_classifier
     )
 
-    post_scraper_factory = providers.Singleton(PostScraperFactory)
-    
     protest_event_repository = providers.Singleton(ProtestEventRepository)  # AbstractSingleton 대신
     
     protest_service = providers.Singleton(
@@ -1,9 +1,11 @@
 import logging
 import os
+import time
 from dotenv import load_dotenv
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Dict, Any
+from app.database.pool_metrics import PoolCheckoutMetrics
 
 # 로깅 설정: SQLAlchemy 쿼리 로그 끄기 (echo=True 상태에서도)
 logging.basicConfig()
@@ -21,24 +23,63 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 # Base 선언 (모든 모델의 베이스 클래스)
 Base = declarative_base()
 
-# 비동기 SQLAlchemy 엔진 설정
-engine = create_async_engine(
+# 쓰기 엔진: 스케줄러의 스크랩 결과 저장과, 저장 여부를 결정하는 조회(신규/기존 게시물 판정, 이전 조회수)용
+# 복제본 지연을 허용하는 순수 조회 API가 생기면 별도 읽기 엔진/풀을 추가합니다.
+write_engine = create_async_engine(
     DATABASE_URL,               # 데이터베이스 접속 URL
     echo=False,                 # SQL 쿼리를 로그로 출력할지 여부 (디버깅용)
-    pool_size=7,               # 커넥션 풀의 기본 연결 수 (초기 커넥션 수)
-    max_overflow=20,            # 풀 외에 추가로 허용할 커넥션 수 (최대 10 + 20 = 30까지 가능)
+    pool_size=int(os.getenv("DB_WRITE_POOL_SIZE", "7")),         # 커넥션 풀의 기본 연결 수
+    max_overflow=int(os.getenv("DB_WRITE_MAX_OVERFLOW", "20")),  # 풀 외에 추가로 허용할 커넥션 수
+    pool_timeout=int(os.getenv("DB_WRITE_POOL_TIMEOUT", "30")),  # 커넥션 대기 최대 시간(초)
     pool_recycle=1800,          # 30분(1800초) 마다 커넥션 재활용 (MySQL의 timeout 방지 등)
     pool_pre_ping=True          # 커넥션 사용 전 유효한지 검사하여 끊긴 커넥션 자동 복구
 )
 
+# 기존 코드 호환용 별칭
+engine = write_engine
+
 # 비동기 세션 생성
-AsyncSessionLocal = sessionmaker(
-    bind=engine,
+WriteSessionLocal = sessionmaker(
+    bind=write_engine,
     class_=AsyncSession,
     expire_on_commit=False,
 )
 
-# get_db() 함수 (의존성 주입용)
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    async with AsyncSessionLocal() as session:
+AsyncSessionLocal = WriteSessionLocal
+
+# 커넥션 체크아웃 대기 시간 메트릭
+write_pool_metrics = PoolCheckoutMetrics("writer")
+
+
+async def _checkout_session(session_factory, metrics: PoolCheckoutMetrics) -> AsyncGenerator[AsyncSession, None]:
+    """세션 생성 후 커넥션 체크아웃 시간을 측정하여 전달"""
+    async with session_factory() as session:
+        start = time.perf_counter()
+        await session.connection()
+        metrics.record((time.perf_counter() - start) * 1000)
         yield session
+
+
+# get_write_db() 함수 (INSERT/UPDATE 등 쓰기 작업용)
+async def get_write_db() -> AsyncGenerator[AsyncSession, None]:
+    async for session in _checkout_session(WriteSessionLocal, write_pool_metrics):
+        yield session
+
+
+# get_db() 함수 (의존성 주입용, 기존 코드 호환을 위해 쓰기 풀 사용)
+get_db = get_write_db
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """풀별 체크아웃 대기 시간 및 현재 사용 현황 반환"""
+    stats = {}
+    for name, db_engine, metrics in (
+        ("writer", write_engine, write_pool_metrics),
+    ):
+        pool = db_engine.pool
+        stats[name] = {
+            **metrics.snapshot(),
+            "checked_out": pool.checkedout(),
+            "status": pool.status(),
+        }
+    return stats
@@ -0,0 +1,28 @@
+-- 인기도(트렌딩) 엔진 테이블 (app/board/infra/db_models/post_popularity.py, post_view_delta.py)
+-- 공유 스키마는 이 레포가 자동 생성하지 않으므로 배포 전에 한 번 적용합니다:
+--   mysql -u <user> -p <database> < app/database/migrations/001_post_popularity.sql
+-- 적용하지 않으면 인기도 엔진은 DB 저장 없이 메모리에서만 동작합니다(재시작 시 점수 초기화).
+
+CREATE TABLE IF NOT EXISTS post_popularity (
+    post_id         INT          NOT NULL,
+    board_id        INT          NOT NULL,
+    score           DOUBLE       NOT NULL DEFAULT 0,
+    last_view_count INT          NOT NULL DEFAULT 0,
+    updated_at      DATETIME     NOT NULL,
+    PRIMARY KEY (post_id),
+    KEY ix_post_popularity_updated_at (updated_at),
+    CONSTRAINT fk_post_popularity_post FOREIGN KEY (post_id) REFERENCES post (id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS post_view_count_delta (
+    id          INT          NOT NULL AUTO_INCREMENT,
+    post_id     INT          NOT NULL,
+    board_id    INT          NOT NULL,
+    delta       INT          NOT NULL,
+    view_count  INT          NOT NULL,
+    recorded_at DATETIME     NOT NULL,
+    PRIMARY KEY (id),
+    KEY ix_post_view_count_delta_board_recorded (board_id, recorded_at),
+    KEY ix_post_view_count_delta_post_recorded (post_id, recorded_at),
+    CONSTRAINT fk_post_view_count_delta_post FOREIGN KEY (post_id) REFERENCES post (id) ON DELETE CASCADE
+);
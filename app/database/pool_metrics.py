@@ -0,0 +1,55 @@
+import threading
+from collections import deque
+from typing import Any, Deque, Dict
+
+
+class PoolCheckoutMetrics:
+    """
+    커넥션 풀 체크아웃 대기 시간 메트릭
+
+    세션이 실제 커넥션을 얻기까지 걸린 시간(풀 대기 + 신규 연결)을 기록합니다.
+    최근 샘플은 고정 크기 버퍼에만 보관하므로 메모리가 늘어나지 않습니다.
+    """
+
+    def __init__(self, pool_name: str, max_samples: int = 1024):
+        self.pool_name = pool_name
+        self._samples: Deque[float] = deque(maxlen=max_samples)
+        self._count = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, elapsed_ms: float) -> None:
+        """체크아웃 1회 소요 시간(ms) 기록"""
+        with self._lock:
+            self._samples.append(elapsed_ms)
+            self._count += 1
+            self._total_ms += elapsed_ms
+            if elapsed_ms > self._max_ms:
+                self._max_ms = elapsed_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        """누적 통계와 최근 샘플 기준 백분위수 반환"""
+        with self._lock:
+            samples = sorted(self._samples)
+            count = self._count
+            total_ms = self._total_ms
+            max_ms = self._max_ms
+
+        return {
+            "pool": self.pool_name,
+            "count": count,
+            "avg_ms": round(total_ms / count, 3) if count else 0.0,
+            "max_ms": round(max_ms, 3),
+            "p50_ms": round(self._percentile(samples, 0.50), 3),
+            "p95_ms": round(self._percentile(samples, 0.95), 3),
+            "p99_ms": round(self._percentile(samples, 0.99), 3),
+        }
+
+    @staticmethod
+    def _percentile(sorted_samples, q: float) -> float:
+        """정렬된 샘플에서 nearest-rank 백분위수 계산"""
+        if not sorted_samples:
+            return 0.0
+        index = min(len(sorted_samples) - 1, max(0, int(round(q * len(sorted_samples))) - 1))
+        return sorted_samples[index]
@@ -1,9 +1,20 @@
+import asyncio
 import logging
-from fastapi import FastAPI
+from typing import Optional
+from fastapi import FastAPI, Depends, Query
 from contextlib import asynccontextmanager
 from app.board.infra.schedulers.board_scrape_scheduler import BoardScrapeScheduler
 from app.protest.infra.scheduler.protest_scrape_scheduler import ProtestScrapeScheduler
 from app.board.infra.schedulers.scraper_initializer import initialize_scrapers
+from app.board.infra.schedulers.popularity_persist_scheduler import PopularityPersistScheduler
+from app.board.application.popularity_engine import PopularityEngine
+from app.board.infra.ocr.clova_ocr_adapter import ClovaOCRAdapter
+from app.board.infra.ocr.layout_worker_pool import LayoutWorkerPool
+from app.board.infra.ocr.ocr_backend_router import OcrBackendRouter
+from app.board.infra.ocr.ocr_pipeline.stage_timing import stage_histograms
+from app.containers import Container
+from app.database.db import get_pool_stats
+from dependency_injector.wiring import Provide, inject
 from app.config.logging_config import setup_logging
 from app.config.container_config import configure_container
 
@@ -35,8 +46,15 @@ async def lifespan(app: FastAPI):
     protest_scheduler = ProtestScrapeScheduler()
     protest_scheduler.add_protest_scrape_job()  # 시위 정보 스크래핑 작업 등록
 
+    logger.info("Starting popularity engine...")
+    popularity_scheduler = PopularityPersistScheduler()
+    await popularity_scheduler.start()  # 인기도 점수 복원 및 주기 저장 작업 등록
+
     yield # 서버 실행
 
+    await popularity_scheduler.stop()  # 남은 인기도 점수 저장
+    await container.ocr_router().close()  # OCR 백엔드(HTTP 세션, 레이아웃 워커 프로세스) 정리
+
     logger.info("Shutting down scheduler...")
     board_scheduler.stop()  # 앱 종료 시 스케줄러 정리
 
@@ -57,3 +75,60 @@ async def health_check():
         "status": "healthy",
         # "active_jobs": board_scheduler.get_job_count()
     }
+
+@app.get("/metrics/db")
+async def db_pool_metrics():
+    """커넥션 풀 체크아웃 대기 시간 및 사용 현황"""
+    return get_pool_stats()
+
+@app.get("/metrics/ocr-layout")
+@inject
+async def ocr_layout_pool_metrics(
+    layout_worker_pool: LayoutWorkerPool = Depends(Provide[Container.layout_worker_pool]),
+):
+    """OCR 레이아웃 후처리 워커 풀 설정 및 작업 지연 시간"""
+    return layout_worker_pool.stats()
+
+@app.get("/metrics/ocr-gate")
+@inject
+async def ocr_text_gate_metrics(
+    ocr_adapter: ClovaOCRAdapter = Depends(Provide[Container.ocr_adapter]),
+):
+    """OCR 전 텍스트 가능성 검사 - 검사 수와 건너뛴 이유별 횟수 (건너뛴 수 = 절약한 CLOVA 호출 수)"""
+    return ocr_adapter.text_gate.stats()
+
+@app.get("/metrics/ocr-archive")
+@inject
+async def ocr_archive_metrics(
+    ocr_adapter: ClovaOCRAdapter = Depends(Provide[Container.ocr_adapter]),
+):
+    """원본 CLOVA 응답 보관소 - 보관 건수, 압축 크기, 재처리 건수"""
+    if ocr_adapter.response_archive is None:
+        return {"enabled": False}
+    return {"enabled": True, **await asyncio.to_thread(ocr_adapter.response_archive.stats)}
+
+@app.get("/metrics/ocr-router")
+@inject
+async def ocr_router_metrics(
+    ocr_router: OcrBackendRouter = Depends(Provide[Container.ocr_router]),
+):
+    """OCR 백엔드별 호출/오류 수, 오류율 EWMA와 현재 경로 순서"""
+    return ocr_router.stats()
+
+@app.get("/metrics/stages")
+async def stage_timing_metrics():
+    """게시판별 OCR/요약 단계(다운로드, CLOVA 호출, 레이아웃 단계, 요약, 위치 추출) 소요 시간 히스토그램"""
+    return {"buckets_ms": list(stage_histograms.buckets_ms), "boards": stage_histograms.snapshot()}
+
+@app.get("/trending")
+@inject
+async def get_trending_posts(
+    board_id: Optional[int] = Query(None, description="게시판 ID (없으면 전체)"),
+    limit: int = Query(10, ge=1, le=100),
+    popularity_engine: PopularityEngine = Depends(Provide[Container.popularity_engine]),
+):
+    """조회수 증가량 기반 트렌딩 게시물 상위 목록"""
+    return {
+        "board_id": board_id,
+        "posts": [popularity.to_dict() for popularity in popularity_engine.top_k(limit, board_id)],
+    }
@@ -2,7 +2,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete
 from sqlalchemy.exc import SQLAlchemyError
 from typing import List
-from app.database.db import get_db
+from app.database.db import get_write_db
 from app.protest.infra.db_model.protest_event import ProtestEvent
 from app.protest.domain.repository.protest_event_repo import IProtestEventRepository
 from app.protest.domain.protest_event import ProtestEvent as ProtestEventVO
@@ -30,7 +30,7 @@ class ProtestEventRepository(IProtestEventRepository):
             logger.warning("Empty protest events list provided")
             raise ValueError("Protest events list cannot be empty")
             
-        async for db in get_db():
+        async for db in get_write_db():
             try:
                 # 도메인 객체들을 SQLAlchemy 모델로 변환
                 db_models = []